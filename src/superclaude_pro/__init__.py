@@ -1,12 +1,5 @@
 """SuperClaude Pro - Professional framework extending Claude Code capabilities."""
 
-from importlib.metadata import version, PackageNotFoundError
-
-try:
-    __version__ = version("superclaude-pro")
-except PackageNotFoundError:
-    __version__ = "0.0.0-dev"
-
 __all__ = [
     "__version__",
     "core",
@@ -16,21 +9,16 @@ __all__ = [
     "orchestrator",
 ]
 
+# Kept in step with pyproject.toml; a literal, so ``--version`` does not
+# need importlib.metadata
+__version__ = "3.1.0"
+
 # Lazy imports to improve startup time
 def __getattr__(name):
-    if name == "core":
-        from . import core
-        return core
-    elif name == "commands":
-        from . import commands
-        return commands
-    elif name == "personas":
-        from . import personas
-        return personas
-    elif name == "mcp":
-        from . import mcp
-        return mcp
-    elif name == "orchestrator":
-        from . import orchestrator
-        return orchestrator
+    if name in ("core", "commands", "personas", "mcp", "orchestrator"):
+        # Not "from . import name": it looks the attribute up first, which
+        # re-enters this function and recurses
+        from importlib import import_module
+        
+        return import_module(f"{__name__}.{name}")
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
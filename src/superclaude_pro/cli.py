@@ -1,33 +1,98 @@
-"""Command Line Interface for SuperClaude Pro."""
+"""Command Line Interface for SuperClaude Pro.
 
+This module is imported on every invocation, including from shell hooks,
+so it only imports click up front. Rich, structlog and the core modules are
+imported by the commands that use them (``--version`` needs none of them).
+"""
+
+import importlib
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import click
-import structlog
-from rich.console import Console
-from rich.panel import Panel
 
-from .core.config import Config
-from .core.installer import Installer
-from .utils.logger import setup_logging
+from . import __version__
+from .utils.logger import get_logger, setup_logging
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+logger = get_logger(__name__)
+_console: Optional["Console"] = None
+
+# Names resolved on first access: (module, attribute)
+_LAZY_IMPORTS = {
+    "Config": ("superclaude_pro.core.config", "Config"),
+    "Installer": ("superclaude_pro.core.installer", "Installer"),
+    "TelemetryCollector": ("superclaude_pro.telemetry.collector", "TelemetryCollector"),
+}
 
-logger = structlog.get_logger()
-console = Console()
+
+def __getattr__(name: str) -> Any:
+    """Import deferred module attributes on first access.
+    
+    A name whose module cannot be imported is reported as missing, with the
+    ImportError as the cause, so ``hasattr()`` and ``mock.patch`` work.
+    """
+    if name in _LAZY_IMPORTS:
+        module_name, attribute = _LAZY_IMPORTS[name]
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} ({e})"
+            ) from e
+        value = getattr(module, attribute)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _lazy(name: str) -> Any:
+    """Resolve a deferred import, honouring values patched onto this module."""
+    return getattr(sys.modules[__name__], name)
+
+
+def get_console() -> "Console":
+    """Get the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        
+        _console = Console()
+    return _console
+
+
+def _configure_logging() -> None:
+    """Set up logging for this invocation, once, on first need."""
+    ctx = click.get_current_context(silent=True)
+    obj = ctx.find_object(dict) if ctx is not None else None
+    if obj is not None and obj.get("logging_configured"):
+        return
+    setup_logging(debug=bool(obj and obj.get("debug")))
+    if obj is not None:
+        obj["logging_configured"] = True
+
+
+def _log_exception(message: str) -> None:
+    """Log the exception being handled."""
+    _configure_logging()
+    logger.exception(message)
 
 
 @click.group()
-@click.version_option()
+@click.version_option(version=__version__)
 @click.option(
     "--debug", is_flag=True, help="Enable debug logging"
 )
 @click.pass_context
 def cli(ctx: click.Context, debug: bool) -> None:
     """SuperClaude Pro - Extend Claude Code with superpowers! 🚀"""
-    setup_logging(debug=debug)
     ctx.ensure_object(dict)
     ctx.obj["debug"] = debug
+    if debug:
+        _configure_logging()
 
 
 @cli.command()
@@ -48,9 +113,13 @@ def cli(ctx: click.Context, debug: bool) -> None:
 @click.pass_context
 def install(ctx: click.Context, profile: str, force: bool, claude_dir: Optional[Path]) -> None:
     """Install SuperClaude Pro framework."""
+    from rich.panel import Panel
+    
+    _configure_logging()
+    console = get_console()
     try:
-        config = Config(claude_dir=claude_dir)
-        installer = Installer(config=config, debug=ctx.obj["debug"])
+        config = _lazy("Config").shared(claude_dir=claude_dir)
+        installer = _lazy("Installer")(config=config, debug=ctx.obj["debug"])
         
         console.print(
             Panel.fit(
@@ -69,7 +138,7 @@ def install(ctx: click.Context, profile: str, force: bool, claude_dir: Optional[
             "\n[dim]Run [bold]superclaude-pro help[/bold] to see available commands.[/dim]"
         )
     except Exception as e:
-        logger.exception("Installation failed")
+        _log_exception("Installation failed")
         console.print(f"\n[bold red]✗ Installation failed:[/bold red] {e}")
         sys.exit(1)
 
@@ -78,24 +147,37 @@ def install(ctx: click.Context, profile: str, force: bool, claude_dir: Optional[
 @click.option(
     "--check", is_flag=True, help="Check for updates without installing"
 )
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="With --check, answer from the cached index and refresh it in the background",
+)
 @click.pass_context
-def update(ctx: click.Context, check: bool) -> None:
+def update(ctx: click.Context, check: bool, offline: bool) -> None:
     """Update SuperClaude Pro to the latest version."""
+    _configure_logging()
+    console = get_console()
     try:
-        config = Config()
-        installer = Installer(config=config, debug=ctx.obj["debug"])
+        config = _lazy("Config").shared()
         
         if check:
-            update_available = installer.check_for_updates()
-            if update_available:
-                console.print("[yellow]⚠[/yellow] Update available!")
+            from .core.updates import UPDATE_CACHE_FILE, UpdateChecker
+            
+            checker = UpdateChecker(config.claude_dir / UPDATE_CACHE_FILE)
+            latest = checker.check(__version__, wait=not offline)
+            if latest:
+                console.print(
+                    f"[yellow]⚠[/yellow] Update available: {latest} "
+                    f"(installed: {__version__})"
+                )
             else:
                 console.print("[green]✓[/green] You're on the latest version.")
         else:
+            installer = _lazy("Installer")(config=config, debug=ctx.obj["debug"])
             installer.update()
             console.print("[green]✓[/green] Updated successfully!")
     except Exception as e:
-        logger.exception("Update failed")
+        _log_exception("Update failed")
         console.print(f"[red]✗ Update failed:[/red] {e}")
         sys.exit(1)
 
@@ -104,38 +186,83 @@ def update(ctx: click.Context, check: bool) -> None:
 @click.confirmation_option(prompt="Are you sure you want to uninstall?")
 def uninstall() -> None:
     """Uninstall SuperClaude Pro framework."""
+    _configure_logging()
+    console = get_console()
     try:
-        config = Config()
-        installer = Installer(config=config)
+        config = _lazy("Config").shared()
+        installer = _lazy("Installer")(config=config)
         installer.uninstall()
         console.print("[green]✓[/green] Uninstalled successfully!")
     except Exception as e:
-        logger.exception("Uninstall failed")
+        _log_exception("Uninstall failed")
         console.print(f"[red]✗ Uninstall failed:[/red] {e}")
         sys.exit(1)
 
 
 @cli.command()
-def status() -> None:
+def rollback() -> None:
+    """Switch back to the previously installed version."""
+    from .core.generations import GenerationStore
+    
+    _configure_logging()
+    console = get_console()
+    try:
+        config = _lazy("Config").shared()
+        generation = GenerationStore(config.claude_dir).rollback()
+        console.print(f"[green]✓[/green] Rolled back to installation {generation}")
+    except Exception as e:
+        _log_exception("Rollback failed")
+        console.print(f"[red]✗ Rollback failed:[/red] {e}")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--verify", is_flag=True, help="Check installed files instead of the cached status"
+)
+@click.option("--json", "as_json", is_flag=True, help="Output status as JSON")
+def status(verify: bool, as_json: bool) -> None:
     """Show SuperClaude Pro installation status."""
+    import json
+    
+    from .core.status import get_status
+    
     try:
-        config = Config()
-        installer = Installer(config=config)
-        status_info = installer.get_status()
-        
-        console.print(
-            Panel(
-                f"[bold]SuperClaude Pro Status[/bold]\n\n"
-                f"Installed: {status_info['installed']}\n"
-                f"Version: {status_info['version']}\n"
-                f"Profile: {status_info['profile']}\n"
-                f"Components: {', '.join(status_info['components'])}",
-                border_style="cyan"
-            )
-        )
+        # One stat and one small file read while the record is current
+        record = get_status(_lazy("Config").shared(), verify=verify)
     except Exception as e:
-        logger.exception("Failed to get status")
-        console.print(f"[red]✗ Failed to get status:[/red] {e}")
+        _log_exception("Failed to get status")
+        if as_json:
+            click.echo(json.dumps({"error": str(e)}))
+        else:
+            get_console().print(f"[red]✗ Failed to get status:[/red] {e}")
+        sys.exit(1)
+    
+    problems = record.get("problems") or []
+    if as_json:
+        click.echo(json.dumps(record, indent=2))
+        if problems:
+            sys.exit(1)
+        return
+    
+    from rich.panel import Panel
+    
+    lines = [
+        "[bold]SuperClaude Pro Status[/bold]\n",
+        f"Installed: {record['installed']}",
+        f"Version: {record['version']}",
+        f"Profile: {record['profile']}",
+        f"Components: {', '.join(record['components'])}",
+    ]
+    if record.get("generation"):
+        lines.append(f"Generation: {record['generation']}")
+    if problems or verify:
+        lines.append("")
+        lines.extend(f"[red]✗[/red] {problem}" for problem in problems)
+        if not problems:
+            lines.append("[green]✓[/green] All installed files intact")
+    get_console().print(Panel("\n".join(lines), border_style="cyan"))
+    if problems:
         sys.exit(1)
 
 
@@ -144,9 +271,11 @@ def status() -> None:
 @click.option("--enable/--disable", default=True, help="Enable or disable component")
 def component(component: str, enable: bool) -> None:
     """Manage individual components."""
+    _configure_logging()
+    console = get_console()
     try:
-        config = Config()
-        installer = Installer(config=config)
+        config = _lazy("Config").shared()
+        installer = _lazy("Installer")(config=config)
         
         if enable:
             installer.enable_component(component)
@@ -155,11 +284,121 @@ def component(component: str, enable: bool) -> None:
             installer.disable_component(component)
             console.print(f"[yellow]⚠[/yellow] Disabled {component}")
     except Exception as e:
-        logger.exception(f"Failed to {'enable' if enable else 'disable'} component")
+        _log_exception(f"Failed to {'enable' if enable else 'disable'} component")
         console.print(f"[red]✗ Operation failed:[/red] {e}")
         sys.exit(1)
 
 
+@cli.command()
+@click.option("--json", "as_json", is_flag=True, help="Output raw summary as JSON")
+def stats(as_json: bool) -> None:
+    """Show telemetry usage and command latency statistics."""
+    import json
+    
+    from rich.table import Table
+    
+    console = get_console()
+    try:
+        config = _lazy("Config").shared()
+        collector = _lazy("TelemetryCollector")(config=config)
+        
+        if not collector.enabled:
+            console.print(
+                "[yellow]⚠[/yellow] Telemetry is disabled. "
+                "Enable it with [bold]settings.telemetry[/bold]."
+            )
+            return
+        
+        summary = collector.get_metrics_summary()
+        if as_json:
+            click.echo(json.dumps(summary, indent=2))
+            return
+        
+        if not summary:
+            console.print("[dim]No telemetry recorded yet.[/dim]")
+            return
+        
+        console.print(
+            f"[bold]Events:[/bold] {summary['total_events']}  "
+            f"[bold]Commands:[/bold] {summary['total_commands']}  "
+            f"[bold]Errors:[/bold] {summary['total_errors']}"
+        )
+        
+        table = Table(title="Command latency (ms)", border_style="cyan")
+        for column in ("Command", "Count", "p50", "p90", "p99", "Max"):
+            table.add_column(column, justify="left" if column == "Command" else "right")
+        for command, latency in summary.get("latency", {}).items():
+            table.add_row(
+                command,
+                str(latency["count"]),
+                str(latency["p50"]),
+                str(latency["p90"]),
+                str(latency["p99"]),
+                str(latency["max"]),
+            )
+        console.print(table)
+        for cache, counts in summary.get("caches", {}).items():
+            rate = counts["hit_rate"]
+            console.print(
+                f"[bold]Cache {cache}:[/bold] {counts['hits']} hits, "
+                f"{counts['misses']} misses"
+                + (f" ({rate:.0%} hit rate)" if rate is not None else "")
+            )
+    except Exception as e:
+        _log_exception("Failed to get stats")
+        console.print(f"[red]✗ Failed to get stats:[/red] {e}")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--timeout", type=float, default=None, help="Seconds each server may take to answer"
+)
+@click.option("--json", "as_json", is_flag=True, help="Output server status as JSON")
+def mcp(timeout: Optional[float], as_json: bool) -> None:
+    """Check that the configured MCP servers start and answer."""
+    import json
+    
+    from .mcp import probe_servers
+    
+    if not as_json:
+        _configure_logging()
+    try:
+        statuses = probe_servers(_lazy("Config").shared(), timeout=timeout)
+    except Exception as e:
+        _log_exception("Failed to probe MCP servers")
+        if as_json:
+            click.echo(json.dumps({"error": str(e)}))
+        else:
+            get_console().print(f"[red]✗ Failed to probe MCP servers:[/red] {e}")
+        sys.exit(1)
+    
+    if as_json:
+        click.echo(json.dumps([status.to_dict() for status in statuses], indent=2))
+    else:
+        from rich.table import Table
+        
+        table = Table(title="MCP servers", border_style="cyan")
+        for column in ("Server", "Status", "Version", "Tools", "Latency (ms)"):
+            justify = "right" if column == "Latency (ms)" else "left"
+            table.add_column(column, justify=justify)
+        for status in statuses:
+            if status.healthy:
+                state = "[green]✓ healthy[/green]"
+            else:
+                state = f"[red]✗ {status.error}[/red]"
+            table.add_row(
+                status.name,
+                state,
+                status.version or "",
+                str(len(status.tools)) if status.healthy else "",
+                f"{status.latency_ms:.0f}",
+            )
+        get_console().print(table)
+    if not all(status.healthy for status in statuses):
+        sys.exit(1)
+
+
 def main() -> None:
     """Main entry point."""
     cli()
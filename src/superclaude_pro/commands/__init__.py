@@ -0,0 +1,5 @@
+"""The /sc: slash commands installed into Claude."""
+
+from .registry import Command, CommandRegistry
+
+__all__ = ["Command", "CommandRegistry"]
@@ -0,0 +1,150 @@
+"""Registry of installed /sc: commands.
+
+Command files are markdown with frontmatter:
+    
+    ---
+    description: Analyze code quality
+    aliases: [review, audit]
+    ---
+
+The command name is the file's path below the commands directory without
+``.md`` (``git/commit.md`` is ``git:commit``) unless the frontmatter sets
+``name``. Frontmatter is read through a ``MarkdownIndex``, so building the
+registry does not parse files that did not change; after that, listing and
+resolving commands are dictionary lookups.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from ..utils.logger import get_logger
+from ..utils.mdindex import MarkdownIndex
+
+if TYPE_CHECKING:
+    from ..core.config import Config
+
+logger = get_logger(__name__)
+
+# Prefix Claude shows in front of the commands, e.g. "/sc:analyze"
+COMMAND_PREFIX = "/sc:"
+
+
+@dataclass(frozen=True)
+class Command:
+    """An installed command."""
+    
+    name: str
+    description: str
+    path: Path
+    aliases: Tuple[str, ...] = ()
+    metadata: Mapping[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+
+class CommandRegistry:
+    """Installed commands by name and alias."""
+    
+    def __init__(self, directory: Path, index_path: Optional[Path] = None) -> None:
+        """Initialize registry.
+        
+        Args:
+            directory: Commands directory, e.g. ``~/.claude/commands/sc``
+            index_path: Index file; see ``MarkdownIndex``
+        """
+        self.directory = Path(directory)
+        self.index = MarkdownIndex(self.directory, index_path)
+        self._commands: Optional[Dict[str, Command]] = None
+        self._lookup: Dict[str, Command] = {}
+    
+    @classmethod
+    def for_config(cls, config: "Config") -> "CommandRegistry":
+        """Get the registry of the commands installed for a configuration."""
+        return cls(config.get_component_path("commands"))
+    
+    def refresh(self, verify: bool = False) -> None:
+        """Pick up commands added, removed or changed since loading.
+        
+        Args:
+            verify: Also check every file for in-place edits
+        """
+        self.index.refresh(verify=verify)
+        self._build()
+    
+    def _build(self) -> None:
+        """Build the name and alias maps from the index."""
+        commands: Dict[str, Command] = {}
+        lookup: Dict[str, Command] = {}
+        aliases: List[Tuple[str, Command]] = []
+        
+        for rel, doc in sorted(self.index.documents().items()):
+            meta = doc["meta"]
+            name = str(meta.get("name") or rel[:-len(".md")].replace("/", ":"))
+            alias_list = meta.get("aliases", [])
+            if isinstance(alias_list, str):
+                alias_list = [alias_list]
+            command = Command(
+                name=name,
+                description=str(meta.get("description") or doc["summary"]),
+                path=self.directory / rel,
+                aliases=tuple(str(alias) for alias in alias_list),
+                metadata=meta,
+            )
+            if name in commands:
+                logger.warning("Duplicate command name", command=name, path=rel)
+                continue
+            commands[name] = lookup[name] = command
+            aliases.extend((alias, command) for alias in command.aliases)
+        
+        # Names take precedence over aliases
+        for alias, command in aliases:
+            if alias in lookup:
+                logger.warning(
+                    "Ignoring conflicting alias", alias=alias, command=command.name
+                )
+                continue
+            lookup[alias] = command
+        
+        self._commands = dict(sorted(commands.items()))
+        self._lookup = lookup
+    
+    def _ensure_loaded(self) -> Dict[str, Command]:
+        """Load the registry on first use."""
+        if self._commands is None:
+            self._build()
+        return self._commands  # type: ignore[return-value]
+    
+    def resolve(self, name: str) -> Optional[Command]:
+        """Find a command by name or alias.
+        
+        Args:
+            name: ``analyze``, ``sc:analyze`` or ``/sc:analyze``, or an alias
+        
+        Returns:
+            The command, or None if there is none
+        """
+        self._ensure_loaded()
+        for prefix in (COMMAND_PREFIX, COMMAND_PREFIX[1:]):
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+                break
+        return self._lookup.get(name)
+    
+    def commands(self) -> List[Command]:
+        """Get all commands, sorted by name."""
+        return list(self._ensure_loaded().values())
+    
+    def names(self) -> List[str]:
+        """Get all command names, sorted."""
+        return list(self._ensure_loaded())
+    
+    def __contains__(self, name: str) -> bool:
+        """Whether a name or alias resolves to a command."""
+        return self.resolve(name) is not None
+    
+    def __iter__(self) -> Iterator[Command]:
+        """Iterate over commands, sorted by name."""
+        return iter(self.commands())
+    
+    def __len__(self) -> int:
+        """Get the number of commands."""
+        return len(self._ensure_loaded())
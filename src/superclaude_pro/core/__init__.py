@@ -1,7 +1,17 @@
 """Core functionality for SuperClaude Pro."""
 
-from .config import Config
-from .installer import Installer
-from .component import Component
+__all__ = ["Config", "Installer", "Component"]
 
-__all__ = ["Config", "Installer", "Component"]
\ No newline at end of file
+
+# Lazy imports so that loading one core module does not load them all
+def __getattr__(name):
+    if name == "Config":
+        from .config import Config
+        return Config
+    elif name == "Installer":
+        from .installer import Installer
+        return Installer
+    elif name == "Component":
+        from .component import Component
+        return Component
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
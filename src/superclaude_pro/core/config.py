@@ -1,113 +1,466 @@
 """Configuration management for SuperClaude Pro."""
 
+import copy
 import json
 import os
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import structlog
+from ..utils.files import atomic_write, file_lock
+from ..utils.logger import get_logger
+from .keypath import get_path, parse_key, set_path
+from .layers import (
+    DEFAULTS_LAYER,
+    ENV_LAYER,
+    PROJECT_LAYER,
+    USER_LAYER,
+    ConfigSnapshot,
+    env_layer,
+    find_project_file,
+    resolve,
+    thaw,
+)
 
-logger = structlog.get_logger()
+if TYPE_CHECKING:
+    from .schema import ConfigModel
+
+logger = get_logger(__name__)
+
+# Marks an omitted ``default`` argument
+_MISSING = object()
+
+# Shared stand-in for a missing layer; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+# Parsed file keyed by the (mtime_ns, size, inode) of the file it came from;
+# None as the key means the file was missing
+_CacheEntry = Tuple[Optional[Tuple[int, int, int]], Dict[str, Any]]
+
+# Process-wide instances handed out by Config.shared(), by directory
+_shared: Dict[Tuple[Path, str], "Config"] = {}
+_shared_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _builtin_defaults(version: str) -> Dict[str, Any]:
+    """Get the built-in defaults, built once per version.
+    
+    The dict is shared and must not be mutated; ``Config.get_defaults()``
+    hands out private copies.
+    """
+    return {
+        "version": version,
+        "profile": "quick",
+        "components": {
+            "commands": True,
+            "personas": True,
+            "mcp": True,
+            "orchestrator": True,
+        },
+        "settings": {
+            "auto_update": True,
+            "telemetry": False,
+            "debug": False,
+        },
+        "mcp_servers": [
+            "context7",
+            "sequential",
+            "magic",
+            "playwright",
+        ],
+    }
+
+
+class ConfigTransaction:
+    """A batch of configuration changes written with a single save."""
+    
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """Initialize transaction.
+        
+        Args:
+            data: Private copy of the configuration to modify
+        """
+        self.data = data
+        self.changed = False
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, including changes made in this transaction."""
+        return get_path(self.data, parse_key(key), default)
+    
+    def set(self, key: str, value: Any) -> None:
+        """Set a value; written to disk when the transaction commits.
+        
+        Raises:
+            TypeError: If a parent on the key's path is not a section
+        """
+        set_path(self.data, parse_key(key), value)
+        self.changed = True
+    
+    def update(self, values: Dict[str, Any]) -> None:
+        """Set several dotted keys at once."""
+        for key, value in values.items():
+            self.set(key, value)
 
 
 @dataclass
 class Config:
-    """Configuration for SuperClaude Pro."""
+    """Configuration for SuperClaude Pro.
+    
+    Values are resolved from four layers, each overriding the previous one:
+    built-in defaults, the user file (``~/.claude/superclaude.json``), the
+    nearest project file (``.superclaude.json``) and ``SUPERCLAUDE_*``
+    environment variables. ``load()``, ``save()`` and ``set()`` work on the
+    user file only; ``get()`` reads the merged ``snapshot()``.
+    
+    Constructing a config touches no files; the Claude directory is created
+    on the first write. Use ``Config.shared()`` to reuse one instance (and
+    its parsed-config cache) per directory across a process.
+    """
     
     claude_dir: Path = field(default_factory=lambda: Path.home() / ".claude")
     config_file: str = "superclaude.json"
     version: str = "3.1.0"
+    # Project config file; looked up from the working directory if None
+    project_file: Optional[Path] = None
     
     def __post_init__(self) -> None:
         """Initialize configuration."""
+        if self.claude_dir is None:
+            self.claude_dir = Path.home() / ".claude"
         self.claude_dir = Path(self.claude_dir)
         self.config_path = self.claude_dir / self.config_file
-        self.ensure_claude_dir()
+        self.lock_path = self.claude_dir / f"{self.config_file}.lock"
+        self._lock = threading.RLock()
+        self._txn: Optional[ConfigTransaction] = None
+        self._cache: Optional[_CacheEntry] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._dir_ready = False
+        self._project_cache: Optional[_CacheEntry] = None
+        self._project_searched = self.project_file is not None
+        self._env: Optional[Dict[str, Any]] = None
+        # Snapshot with the user and project data objects it was built from
+        self._snapshot: Optional[Tuple[Dict[str, Any], Dict[str, Any], ConfigSnapshot]] = None
+        self._model: Optional[Tuple[ConfigSnapshot, "ConfigModel"]] = None
+    
+    @classmethod
+    def shared(
+        cls,
+        claude_dir: Optional[Path] = None,
+        config_file: str = "superclaude.json",
+    ) -> "Config":
+        """Get the process-wide config for a directory, creating it once.
+        
+        Args:
+            claude_dir: Claude configuration directory, ``~/.claude`` if None
+            config_file: Config file name within ``claude_dir``
+        
+        Returns:
+            The same instance for every call with the same directory and file
+        """
+        if claude_dir is None:
+            claude_dir = Path.home() / ".claude"
+        # abspath, unlike resolve(), needs no syscalls
+        key = (Path(os.path.abspath(claude_dir)), config_file)
+        with _shared_lock:
+            config = _shared.get(key)
+            if config is None:
+                config = cls(claude_dir=key[0], config_file=config_file)
+                _shared[key] = config
+            return config
+    
+    @classmethod
+    def clear_shared(cls) -> None:
+        """Forget all shared instances."""
+        with _shared_lock:
+            _shared.clear()
     
     def ensure_claude_dir(self) -> None:
-        """Ensure Claude directory exists."""
+        """Ensure Claude directory exists; only the first call hits the disk."""
+        if self._dir_ready:
+            return
         self.claude_dir.mkdir(parents=True, exist_ok=True)
+        self._dir_ready = True
         logger.debug("Ensured Claude directory exists", path=str(self.claude_dir))
     
     def load(self) -> Dict[str, Any]:
         """Load configuration from disk."""
-        if not self.config_path.exists():
+        return copy.deepcopy(self._read())
+    
+    def _stat_key(self, path: Optional[Path] = None) -> Optional[Tuple[int, int, int]]:
+        """Get the cache validation key of a file, None if missing.
+        
+        Args:
+            path: File to check, the user config file by default
+        """
+        try:
+            st = os.stat(path or self.config_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    def _read(self) -> Dict[str, Any]:
+        """Return the parsed configuration, re-reading only if the file changed.
+        
+        The returned dict is shared with the cache and must not be mutated;
+        use ``load()`` for a private copy.
+        """
+        key = self._stat_key()
+        cached = self._cache
+        if cached is not None and cached[0] == key:
+            self.cache_hits += 1
+            return cached[1]
+        
+        self.cache_misses += 1
+        if key is None:
             logger.debug("Config file not found, returning defaults")
-            return self.get_defaults()
+            config = _builtin_defaults(self.version)
+        else:
+            loaded = self._parse_file(self.config_path)
+            if loaded is None:
+                config = _builtin_defaults(self.version)
+            else:
+                config = loaded
+                logger.debug("Loaded configuration", config=config)
+        
+        self._cache = (key, config)
+        return config
+    
+    @staticmethod
+    def _parse_file(path: Path) -> Optional[Dict[str, Any]]:
+        """Read and validate a config file.
+        
+        Returns:
+            The values set in the file, or None if it cannot be used
+        """
+        # Imported here so pydantic only loads once a config file exists
+        from .schema import parse_layer_json
         
         try:
-            with open(self.config_path, "r") as f:
-                config = json.load(f)
-            logger.debug("Loaded configuration", config=config)
-            return config
-        except Exception as e:
-            logger.error("Failed to load config", error=str(e))
-            return self.get_defaults()
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            logger.error("Failed to load config", path=str(path), error=str(e))
+            return None
+        return parse_layer_json(raw, str(path))
+    
+    def _read_project(self) -> Dict[str, Any]:
+        """Return the parsed project config, re-reading only if it changed."""
+        if not self._project_searched:
+            self.project_file = find_project_file()
+            self._project_searched = True
+        if self.project_file is None:
+            return _EMPTY
+        
+        key = self._stat_key(self.project_file)
+        cached = self._project_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        config = _EMPTY
+        if key is not None:
+            config = self._parse_file(self.project_file) or _EMPTY
+        self._project_cache = (key, config)
+        return config
+    
+    def snapshot(self) -> ConfigSnapshot:
+        """Get the configuration merged from all layers.
+        
+        The snapshot is rebuilt only when the user or project file changed
+        on disk; environment variables are read once and picked up again
+        after ``invalidate_cache()``.
+        
+        Returns:
+            Immutable snapshot; its ``digest`` changes with any layer
+        """
+        user = self._read()
+        project = self._read_project()
+        cached = self._snapshot
+        if cached is not None and cached[0] is user and cached[1] is project:
+            return cached[2]
+        
+        if self._env is None:
+            self._env = env_layer()
+            if self._env:
+                from .schema import validate_layer
+                
+                self._env = validate_layer(self._env, "environment")
+        snapshot = resolve(self._layers(user, project))
+        self._snapshot = (user, project, snapshot)
+        return snapshot
+    
+    def trusted_snapshot(self) -> ConfigSnapshot:
+        """Get the configuration merged from all layers but the project file.
+        
+        The project file comes with whatever directory the user runs in, such
+        as a cloned repository, so settings that run commands (MCP servers)
+        are read from here instead of ``snapshot()``.
+        
+        Returns:
+            Immutable snapshot of the defaults, user and environment layers
+        """
+        snapshot = self.snapshot()
+        if PROJECT_LAYER not in snapshot.provenance.values():
+            return snapshot
+        return resolve(self._layers(self._read(), _EMPTY))
+    
+    def _layers(
+        self, user: Dict[str, Any], project: Dict[str, Any]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get the (name, data) layers to merge, lowest precedence first."""
+        defaults = _builtin_defaults(self.version)
+        return [
+            (DEFAULTS_LAYER, defaults),
+            # A missing or broken user file reads as the defaults
+            (USER_LAYER, _EMPTY if user is defaults else user),
+            (PROJECT_LAYER, project),
+            (ENV_LAYER, self._env or _EMPTY),
+        ]
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached configuration so the next read hits the disk."""
+        self._cache = None
+        self._project_cache = None
+        self._env = None
+        self._snapshot = None
+        self._model = None
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """Get config cache hit/miss counters."""
+        return {"hits": self.cache_hits, "misses": self.cache_misses}
     
     def save(self, config: Dict[str, Any]) -> None:
-        """Save configuration to disk."""
+        """Save configuration to disk.
+        
+        The file is replaced atomically, so a crash or a concurrent reader
+        never sees a partially written config.
+        
+        Raises:
+            pydantic.ValidationError: If a value does not match the schema;
+                nothing is written
+        """
+        from .schema import ConfigModel
+        
+        ConfigModel.model_validate(config)
         try:
-            with open(self.config_path, "w") as f:
-                json.dump(config, f, indent=2)
+            self.ensure_claude_dir()
+            atomic_write(self.config_path, json.dumps(config, indent=2))
             logger.debug("Saved configuration", config=config)
         except Exception as e:
             logger.error("Failed to save config", error=str(e))
+            self.invalidate_cache()
             raise
+        self._cache = (self._stat_key(), copy.deepcopy(config))
+        self._record_status(config)
+    
+    def _record_status(self, config: Dict[str, Any]) -> None:
+        """Refresh the status record read by ``superclaude-pro status``."""
+        from .status import config_fields, config_key, update_status
+        
+        try:
+            fields = config_fields(config, _builtin_defaults(self.version))
+            update_status(self.claude_dir, config_key=config_key(self), **fields)
+        except OSError as e:
+            logger.warning("Failed to update status record", error=str(e))
     
     def get_defaults(self) -> Dict[str, Any]:
         """Get default configuration."""
-        return {
-            "version": self.version,
-            "profile": "quick",
-            "components": {
-                "commands": True,
-                "personas": True,
-                "mcp": True,
-                "orchestrator": True,
-            },
-            "settings": {
-                "auto_update": True,
-                "telemetry": False,
-                "debug": False,
-            },
-            "mcp_servers": [
-                "context7",
-                "sequential",
-                "magic",
-                "playwright",
-            ],
-        }
+        return copy.deepcopy(_builtin_defaults(self.version))
     
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value."""
-        config = self.load()
-        keys = key.split(".")
-        value = config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+    def get(self, key: str, default: Any = _MISSING) -> Any:
+        """Get configuration value.
+        
+        Args:
+            key: Dotted key, e.g. ``"settings.telemetry"``
+            default: Value if no layer sets the key; None if omitted
+        """
+        value = self.snapshot().index.get(key, _MISSING)
+        if value is _MISSING:
+            return None if default is _MISSING else default
+        # Hand out mutable copies of sections and lists
+        return thaw(value)
+    
+    def get_many(self, keys: Iterable[str], default: Any = None) -> Dict[str, Any]:
+        """Get several configuration values from one snapshot.
+        
+        Args:
+            keys: Dotted keys
+            default: Value for keys that no layer sets
         
-        return value
+        Returns:
+            Values by key
+        """
+        index = self.snapshot().index
+        return {key: thaw(index.get(key, default)) for key in keys}
+    
+    def model(self) -> "ConfigModel":
+        """Get the merged configuration as a typed, frozen model.
+        
+        The model is validated once per snapshot; later calls return the
+        same object until a layer changes.
+        """
+        snapshot = self.snapshot()
+        cached = self._model
+        if cached is not None and cached[0] is snapshot:
+            return cached[1]
+        
+        from .schema import ConfigModel
+        
+        model = ConfigModel.model_validate(thaw(snapshot.data))
+        self._model = (snapshot, model)
+        return model
+    
+    def source(self, key: str) -> Optional[str]:
+        """Get the layer that set a value: defaults, user, project or env.
+        
+        Args:
+            key: Dotted key of a value (not a section)
+        """
+        return self.snapshot().source(key)
     
     def set(self, key: str, value: Any) -> None:
         """Set configuration value."""
-        config = self.load()
-        keys = key.split(".")
+        with self.transaction() as txn:
+            txn.set(key, value)
+    
+    def set_many(self, values: Dict[str, Any]) -> None:
+        """Set several dotted keys with a single load and save."""
+        with self.transaction() as txn:
+            txn.update(values)
+    
+    @contextmanager
+    def transaction(self) -> Iterator[ConfigTransaction]:
+        """Apply a batch of changes under a lock and write them once.
         
-        # Navigate to the parent of the target key
-        current = config
-        for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            current = current[k]
+        An advisory lock on ``<config_file>.lock`` serializes concurrent
+        processes, so read-modify-write cycles never lose updates. Nothing is
+        written if the block raises or makes no changes. Nested calls on the
+        same instance join the outer transaction.
         
-        # Set the value
-        current[keys[-1]] = value
-        self.save(config)
+        Example:
+            with config.transaction() as txn:
+                txn.set("profile", "developer")
+                txn.set("settings.telemetry", True)
+        """
+        with self._lock:
+            if self._txn is not None:
+                yield self._txn
+                return
+            
+            self.ensure_claude_dir()
+            with file_lock(self.lock_path):
+                txn = ConfigTransaction(self.load())
+                self._txn = txn
+                try:
+                    yield txn
+                finally:
+                    self._txn = None
+                if txn.changed:
+                    self.save(txn.data)
     
     def get_component_path(self, component: str) -> Path:
         """Get path for a component."""
@@ -128,6 +481,5 @@ class Config:
     
     def get_installed_components(self) -> List[str]:
         """Get list of installed components."""
-        config = self.load()
-        components = config.get("components", {})
+        components = self.get("components", {})
         return [name for name, enabled in components.items() if enabled]
\ No newline at end of file
@@ -0,0 +1,426 @@
+"""Staged installs activated by an atomic symlink swap.
+
+Every install or update is staged into a new directory (a "generation")
+next to the live one and activated by atomically repointing a ``current``
+symlink, so Claude never sees a half-written tree. The previously active
+generation is kept, which makes rollback a symlink flip instead of a
+re-copy. Layout under ``~/.claude/.superclaude``::
+    
+    generations/000001/          complete, never modified once staged
+    generations/000002/
+    generations/000003.partial/  being staged (removed if left by a crash)
+    current -> generations/000002
+    previous -> generations/000001
+    lock                         held while a process changes any of these
+
+Installed paths in the Claude directory (``commands/sc``, ``personas``, ...)
+are symlinks through ``current``, created once by ``link()``. Each
+generation carries a ``core.sync`` manifest of its files. A new generation
+is planned against the active one's manifest: files with unchanged content
+that were not edited since are hard-linked from it, so an update only
+writes what changed, and an install that changes nothing stages nothing.
+"""
+
+import os
+import shutil
+import threading
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from ..utils.files import _fsync_dir, file_lock
+from ..utils.logger import get_logger
+from .status import update_status
+from .sync import (
+    MANIFEST_FILE,
+    Manifest,
+    ProgressCallback,
+    SyncPlan,
+    apply_sync,
+    copy_file,
+    plan_sync,
+)
+
+logger = get_logger(__name__)
+
+STATE_DIR = ".superclaude"
+PARTIAL_SUFFIX = ".partial"
+LOCK_NAME = "lock"
+
+
+class GenerationStore:
+    """Generations of installed files for one Claude directory."""
+    
+    def __init__(self, claude_dir: Path) -> None:
+        """Initialize store.
+        
+        Args:
+            claude_dir: Claude configuration directory
+        """
+        self.claude_dir = Path(claude_dir)
+        self.root = self.claude_dir / STATE_DIR
+        self.generations_dir = self.root / "generations"
+        self.current_link = self.root / "current"
+        self.previous_link = self.root / "previous"
+        # Pre-existing files found where a link had to go
+        self.backup_dir = self.root / "backup"
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+    
+    def current(self) -> Optional[str]:
+        """Get the active generation, None if nothing is installed."""
+        return self._read_link(self.current_link)
+    
+    def previous(self) -> Optional[str]:
+        """Get the generation a rollback would activate."""
+        return self._read_link(self.previous_link)
+    
+    def generations(self) -> List[str]:
+        """Get the complete generations on disk, oldest first."""
+        try:
+            names = os.listdir(self.generations_dir)
+        except FileNotFoundError:
+            return []
+        return sorted(name for name in names if not name.endswith(PARTIAL_SUFFIX))
+    
+    def path(self, generation: str) -> Path:
+        """Get the directory of a generation."""
+        return self.generations_dir / generation
+    
+    def manifest(self, generation: str) -> Manifest:
+        """Get the manifest of a generation's files.
+        
+        Raises:
+            OSError: If the generation has no readable manifest
+        """
+        path = self.path(generation) / MANIFEST_FILE
+        if not path.is_file():
+            raise FileNotFoundError(f"Generation {generation} has no manifest")
+        return Manifest.load(path)
+    
+    def targets(self, generation: str) -> List[str]:
+        """Get the Claude directory paths a generation provides."""
+        return list(self.manifest(generation).metadata.get("targets", []))
+    
+    def install(
+        self,
+        targets: Dict[str, Path],
+        workers: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        progress: bool = False,
+    ) -> str:
+        """Stage, activate and link a new generation.
+        
+        Args:
+            targets: Source file or directory for each path relative to the
+                Claude directory, e.g. ``{"commands/sc": source / "commands"}``
+            workers: Thread pool size for staging
+            on_progress: Called with the size of each copied chunk
+            progress: Show a progress bar of the bytes copied
+        
+        Returns:
+            The new active generation
+        """
+        with self._locked():
+            current = self.current()
+            generation = self.stage(
+                targets, workers=workers, on_progress=on_progress, progress=progress
+            )
+            self.activate(generation)
+            self.link(targets)
+            if current is not None:
+                self._unlink_dangling(set(self.targets(current)) - set(targets))
+            self.prune()
+        return generation
+    
+    def stage(
+        self,
+        targets: Dict[str, Path],
+        workers: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        progress: bool = False,
+    ) -> str:
+        """Build a complete new generation without touching the active one.
+        
+        Files the active generation has with the same content, and that were
+        not edited since it was staged, are hard-linked from it; the rest are
+        copied from the sources. If nothing needs copying or removing, no
+        generation is staged and the active one is returned. A new generation
+        only gets its final name once every file and its manifest are written.
+        
+        Args:
+            targets: Source file or directory per Claude directory path
+            workers: Thread pool size
+            on_progress: Called with the size of each copied chunk
+            progress: Show a progress bar of the bytes copied
+        
+        Returns:
+            The staged generation, or the active one if it is up to date
+        """
+        with self._locked():
+            return self._stage(targets, workers, on_progress, progress)
+    
+    def activate(self, generation: str) -> None:
+        """Make a staged generation the active one, keeping the old as previous.
+        
+        Args:
+            generation: Complete generation to activate
+        """
+        with self._locked():
+            current = self.current()
+            if current is not None and current != generation:
+                self._set_link(self.previous_link, current)
+            self._set_link(self.current_link, generation)
+            update_status(self.claude_dir, generation=generation)
+        logger.debug("Activated generation", generation=generation, previous=current)
+    
+    def rollback(self) -> str:
+        """Swap the active and previous generations.
+        
+        Returns:
+            The generation now active
+        
+        Raises:
+            RuntimeError: If there is no previous generation
+        """
+        with self._locked():
+            current, previous = self.current(), self.previous()
+            if previous is None or not self.path(previous).is_dir():
+                raise RuntimeError("No previous installation to roll back to")
+            
+            self._set_link(self.current_link, previous)
+            if current is not None:
+                self._set_link(self.previous_link, current)
+            restored = self.targets(previous)
+            self.link(restored)
+            if current is not None:
+                self._unlink_dangling(set(self.targets(current)) - set(restored))
+            update_status(self.claude_dir, generation=previous)
+        logger.info("Rolled back", generation=previous, previous=current)
+        return previous
+    
+    def link(self, targets: Iterable[str]) -> None:
+        """Point Claude directory paths at the active generation.
+        
+        Paths already linked are left alone, so this only writes on the
+        first install or when a new path appears. Real files or directories
+        in the way are moved to the backup directory.
+        
+        Args:
+            targets: Paths relative to the Claude directory
+        """
+        with self._locked():
+            for target in targets:
+                self._link(target)
+    
+    def prune(self) -> List[str]:
+        """Delete generations that are neither active nor previous.
+        
+        Returns:
+            The deleted generations
+        """
+        with self._locked():
+            keep = {self.current(), self.previous()}
+            removed = [name for name in self.generations() if name not in keep]
+            for name in removed:
+                shutil.rmtree(self.path(name), ignore_errors=True)
+        return removed
+    
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the store lock; re-entrant within this store object.
+        
+        Serializes staging, activation and rollback across processes, so
+        no process removes another's partial generation or picks the same
+        generation number.
+        """
+        with self._thread_lock:
+            self._lock_depth += 1
+            try:
+                if self._lock_depth > 1:
+                    yield
+                else:
+                    self.root.mkdir(parents=True, exist_ok=True)
+                    with file_lock(self.root / LOCK_NAME):
+                        yield
+            finally:
+                self._lock_depth -= 1
+    
+    def _stage(
+        self,
+        targets: Dict[str, Path],
+        workers: Optional[int],
+        on_progress: Optional[ProgressCallback],
+        progress: bool,
+    ) -> str:
+        """Stage a generation; the caller holds the store lock."""
+        self.generations_dir.mkdir(parents=True, exist_ok=True)
+        self._remove_partials()
+        
+        # Plan against the active generation, or an empty manifest if none
+        current = self.current()
+        base = self._manifest_or_none(current)
+        if base is None:
+            base = Manifest(self.generations_dir / MANIFEST_FILE)
+        plans = [
+            plan_sync(source, base.root / target, base, workers=workers)
+            for target, source in sorted(targets.items())
+        ]
+        if (
+            base.metadata.get("targets") == sorted(targets)
+            and not any(plan.copy or plan.remove for plan in plans)
+        ):
+            logger.debug("Active generation is up to date", generation=current)
+            return current  # type: ignore[return-value]
+        
+        existing = [int(name) for name in self.generations() if name.isdigit()]
+        generation = f"{max(existing, default=0) + 1:06d}"
+        staging = self.generations_dir / f"{generation}{PARTIAL_SUFFIX}"
+        staging.mkdir()
+        
+        manifest = Manifest(
+            staging / MANIFEST_FILE, metadata={"targets": sorted(targets)}
+        )
+        for plan in plans:
+            for path in plan.unchanged:
+                _reuse(path, staging / path.relative_to(base.root), base, manifest)
+        plans = [_rebase(plan, base.root, staging) for plan in plans]
+        with ExitStack() as stack:
+            callbacks = [on_progress] if on_progress is not None else []
+            if progress:
+                from ..utils.progress import byte_progress
+                
+                total = sum(plan.copy_bytes for plan in plans)
+                callbacks.append(
+                    stack.enter_context(byte_progress(total, "Installing files"))
+                )
+            
+            def advance(size: int) -> None:
+                for callback in callbacks:
+                    callback(size)
+            
+            for plan in plans:
+                apply_sync(plan, manifest, advance if callbacks else None)
+        manifest.save()
+        
+        os.rename(staging, self.path(generation))
+        _fsync_dir(self.generations_dir)
+        logger.debug(
+            "Staged generation",
+            generation=generation,
+            files=len(manifest.entries),
+            copied=sum(len(plan.copy) for plan in plans),
+        )
+        return generation
+    
+    def _manifest_or_none(self, generation: Optional[str]) -> Optional[Manifest]:
+        """Get a generation's manifest, None without a generation or manifest."""
+        if generation is None:
+            return None
+        try:
+            return self.manifest(generation)
+        except OSError as e:
+            logger.warning(
+                "Staging without the active generation's manifest",
+                generation=generation,
+                error=str(e),
+            )
+            return None
+    
+    def _link(self, target: str) -> None:
+        """Point one Claude directory path at the active generation."""
+        path = self.claude_dir / target
+        want = os.path.relpath(self.current_link / target, path.parent)
+        if path.is_symlink():
+            if os.readlink(path) == want:
+                return
+        elif path.exists():
+            backup = self.backup_dir / target
+            backup.parent.mkdir(parents=True, exist_ok=True)
+            if backup.exists() or backup.is_symlink():
+                _remove(backup)
+            os.rename(path, backup)
+            logger.warning(
+                "Moved existing files aside", path=str(path), backup=str(backup)
+            )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _replace_symlink(path, want)
+    
+    def _unlink_dangling(self, targets: Iterable[str]) -> None:
+        """Remove links to paths the active generation does not provide.
+        
+        Args:
+            targets: Paths only the previously active generation provided
+        """
+        for target in sorted(targets):
+            path = self.claude_dir / target
+            if path.is_symlink() and not path.exists():
+                os.unlink(path)
+                logger.debug("Removed link to dropped path", path=str(path))
+    
+    def _remove_partials(self) -> None:
+        """Delete generations left half-staged by an interrupted install."""
+        for name in os.listdir(self.generations_dir):
+            if name.endswith(PARTIAL_SUFFIX):
+                shutil.rmtree(self.generations_dir / name, ignore_errors=True)
+    
+    def _read_link(self, link: Path) -> Optional[str]:
+        """Get the generation a state link points at."""
+        try:
+            return Path(os.readlink(link)).name
+        except OSError:
+            return None
+    
+    def _set_link(self, link: Path, generation: str) -> None:
+        """Atomically repoint a state link at a generation."""
+        _replace_symlink(link, os.path.join("generations", generation))
+        _fsync_dir(self.root)
+
+
+def _reuse(path: Path, staged: Path, base: Manifest, manifest: Manifest) -> None:
+    """Hard-link an unchanged file into a staged generation.
+    
+    Falls back to copying where the filesystem has no hard links.
+    
+    Args:
+        path: File in the active generation
+        staged: Its place in the generation being staged
+        base: Manifest of the active generation
+        manifest: Manifest of the generation being staged
+    """
+    staged.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(path, staged)
+    except OSError:
+        copy_file(path, staged)
+    manifest.record(staged, base.get(path)["sha256"])  # type: ignore[index]
+
+
+def _rebase(plan: SyncPlan, root: Path, staging: Path) -> SyncPlan:
+    """Get the copies of a plan made against ``root`` as a plan into ``staging``."""
+    return SyncPlan(
+        source=plan.source,
+        destination=staging / plan.destination.relative_to(root),
+        copy=[
+            (src, staging / dst.relative_to(root), digest, size)
+            for src, dst, digest, size in plan.copy
+        ],
+        workers=plan.workers,
+    )
+
+
+def _replace_symlink(path: Path, target: str) -> None:
+    """Create or atomically replace a symlink."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if tmp.is_symlink() or tmp.exists():
+        os.unlink(tmp)
+    os.symlink(target, tmp)
+    os.replace(tmp, path)
+
+
+def _remove(path: Path) -> None:
+    """Delete a file, symlink or directory tree."""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        os.unlink(path)
@@ -0,0 +1,114 @@
+"""Dotted-key access to nested configuration dicts."""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Tuple
+
+KeyPath = Tuple[str, ...]
+
+# Nested {segment: subtree} dict; a subtree holding _LEAF ends a requested key
+KeyTrie = Dict[str, Any]
+
+_LEAF = object()
+
+
+@lru_cache(maxsize=1024)
+def parse_key(key: str) -> KeyPath:
+    """Split a dotted key into its path, memoized.
+    
+    Args:
+        key: Dotted key, e.g. ``"settings.telemetry"``
+    
+    Returns:
+        Path segments
+    """
+    return tuple(key.split("."))
+
+
+def get_path(data: Any, path: KeyPath, default: Any = None) -> Any:
+    """Get the value at a path.
+    
+    Args:
+        data: Nested dicts
+        path: Parsed key
+        default: Value returned if the path does not exist
+    
+    Returns:
+        The value, or ``default``
+    """
+    value = data
+    for segment in path:
+        if isinstance(value, dict) and segment in value:
+            value = value[segment]
+        else:
+            return default
+    return value
+
+
+def set_path(data: Dict[str, Any], path: KeyPath, value: Any) -> None:
+    """Set the value at a path, creating missing parents.
+    
+    Args:
+        data: Nested dicts, modified in place
+        path: Parsed key
+        value: Value to set
+    
+    Raises:
+        TypeError: If a parent on the path exists but is not a dict
+    """
+    current = data
+    for depth, segment in enumerate(path[:-1]):
+        child = current.get(segment)
+        if child is None:
+            child = current[segment] = {}
+        elif not isinstance(child, dict):
+            raise TypeError(
+                f"Cannot set {'.'.join(path)!r}: "
+                f"{'.'.join(path[:depth + 1])!r} is a {type(child).__name__}, not a section"
+            )
+        current = child
+    current[path[-1]] = value
+
+
+@lru_cache(maxsize=256)
+def compile_keys(keys: Tuple[str, ...]) -> KeyTrie:
+    """Merge keys into a trie so shared prefixes are walked once, memoized.
+    
+    Args:
+        keys: Dotted keys
+    
+    Returns:
+        Trie for ``get_many()``
+    """
+    trie: KeyTrie = {}
+    for key in keys:
+        node = trie
+        for segment in parse_key(key):
+            node = node.setdefault(segment, {})
+        node[_LEAF] = key
+    return trie
+
+
+def get_many(data: Any, keys: Iterable[str], default: Any = None) -> Dict[str, Any]:
+    """Get several values in a single traversal.
+    
+    Args:
+        data: Nested dicts
+        keys: Dotted keys
+        default: Value for keys that do not exist
+    
+    Returns:
+        Values by key
+    """
+    keys = tuple(keys)
+    result = dict.fromkeys(keys, default)
+    _collect(data, compile_keys(keys), result)
+    return result
+
+
+def _collect(value: Any, node: KeyTrie, result: Dict[str, Any]) -> None:
+    """Fill ``result`` with the values below ``node`` found in ``value``."""
+    for segment, child in node.items():
+        if segment is _LEAF:
+            result[child] = value
+        elif isinstance(value, dict) and segment in value:
+            _collect(value[segment], child, result)
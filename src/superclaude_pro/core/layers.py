@@ -0,0 +1,191 @@
+"""Layered configuration resolved into immutable snapshots."""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from .keypath import set_path
+
+# Environment variables overriding config keys, e.g.
+# SUPERCLAUDE_SETTINGS__TELEMETRY=true sets "settings.telemetry"
+ENV_PREFIX = "SUPERCLAUDE_"
+ENV_SEPARATOR = "__"
+
+# Project-local config, looked up from the working directory upwards
+PROJECT_CONFIG_FILE = ".superclaude.json"
+
+# Layer names, lowest precedence first
+DEFAULTS_LAYER = "defaults"
+USER_LAYER = "user"
+PROJECT_LAYER = "project"
+ENV_LAYER = "env"
+
+Layer = Tuple[str, Mapping[str, Any]]
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Configuration merged from all layers, resolved once.
+    
+    Every section and value is indexed by its dotted key, so lookups are a
+    single dict access. Values are read-only views (mappings and tuples).
+    ``provenance`` names the layer that supplied each leaf value. Snapshots
+    compare and hash by ``digest``, a hash of all layer contents, so caches
+    keyed by a snapshot are invalidated whenever any layer changes.
+    """
+    
+    digest: str
+    data: Mapping[str, Any] = field(compare=False, repr=False)
+    index: Mapping[str, Any] = field(compare=False, repr=False)
+    provenance: Mapping[str, str] = field(compare=False, repr=False)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value by dotted key."""
+        return self.index.get(key, default)
+    
+    def source(self, key: str) -> Optional[str]:
+        """Get the name of the layer that set a value, None for sections."""
+        return self.provenance.get(key)
+    
+    def __contains__(self, key: str) -> bool:
+        """Whether a dotted key is set in any layer."""
+        return key in self.index
+
+
+def resolve(layers: Iterable[Layer]) -> ConfigSnapshot:
+    """Merge layers into a snapshot.
+    
+    Sections are merged key by key; any other value replaces what lower
+    layers set at the same key.
+    
+    Args:
+        layers: (name, data) pairs, lowest precedence first
+    
+    Returns:
+        Immutable snapshot
+    """
+    layers = list(layers)
+    merged: Dict[str, Any] = {}
+    provenance: Dict[str, str] = {}
+    for name, data in layers:
+        _merge(merged, data, "", name, provenance)
+    
+    index: Dict[str, Any] = {}
+    frozen = _freeze(merged, "", index)
+    
+    digest = hashlib.sha256(
+        json.dumps(
+            [[name, data] for name, data in layers], sort_keys=True, default=str
+        ).encode("utf-8")
+    ).hexdigest()
+    
+    return ConfigSnapshot(
+        digest=digest,
+        data=frozen,
+        index=MappingProxyType(index),
+        # Drop leaves a later layer replaced with a plain value
+        provenance=MappingProxyType(
+            {key: name for key, name in provenance.items() if key in index}
+        ),
+    )
+
+
+def env_layer(environ: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+    """Build the layer set by ``SUPERCLAUDE_*`` environment variables.
+    
+    Variable names map to lower-case keys with ``__`` separating sections.
+    Values are parsed as JSON when possible (``true``, ``3``, ``["a"]``)
+    and used as plain strings otherwise.
+    
+    Args:
+        environ: Environment, ``os.environ`` by default
+    
+    Returns:
+        Nested config data
+    """
+    data: Dict[str, Any] = {}
+    for name, raw in (os.environ if environ is None else environ).items():
+        if not name.startswith(ENV_PREFIX) or len(name) == len(ENV_PREFIX):
+            continue
+        path = tuple(name[len(ENV_PREFIX):].lower().split(ENV_SEPARATOR))
+        if not all(path):
+            continue
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw
+        try:
+            set_path(data, path, value)
+        except TypeError:
+            # Both SUPERCLAUDE_A=1 and SUPERCLAUDE_A__B=2; the section wins
+            continue
+    return data
+
+
+def find_project_file(start: Optional[Path] = None) -> Optional[Path]:
+    """Find the nearest project config file.
+    
+    Args:
+        start: Directory to search from, the working directory by default
+    
+    Returns:
+        Path of the first ``.superclaude.json`` in ``start`` or a parent
+    """
+    directory = Path(os.path.abspath(start if start is not None else os.getcwd()))
+    for candidate in (directory, *directory.parents):
+        path = candidate / PROJECT_CONFIG_FILE
+        if path.is_file():
+            return path
+    return None
+
+
+def thaw(value: Any) -> Any:
+    """Get a mutable deep copy of a snapshot value."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def _merge(
+    target: Dict[str, Any],
+    source: Mapping[str, Any],
+    prefix: str,
+    layer: str,
+    provenance: Dict[str, str],
+) -> None:
+    """Deep-merge ``source`` into ``target``, recording leaf provenance."""
+    for key, value in source.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, Mapping) and isinstance(target.get(key), dict):
+            _merge(target[key], value, f"{path}.", layer, provenance)
+        elif isinstance(value, Mapping):
+            target[key] = {}
+            provenance.pop(path, None)
+            _merge(target[key], value, f"{path}.", layer, provenance)
+            if not value:
+                provenance[path] = layer
+        else:
+            target[key] = value
+            provenance[path] = layer
+
+
+def _freeze(value: Any, path: str, index: Dict[str, Any]) -> Any:
+    """Build a read-only copy of ``value``, indexing every section and value."""
+    if isinstance(value, dict):
+        frozen: Any = MappingProxyType({
+            key: _freeze(item, f"{path}.{key}" if path else key, index)
+            for key, item in value.items()
+        })
+    elif isinstance(value, list):
+        frozen = tuple(_freeze(item, "", {}) for item in value)
+    else:
+        frozen = value
+    if path:
+        index[path] = frozen
+    return frozen
@@ -0,0 +1,160 @@
+"""Typed schema of the SuperClaude Pro configuration.
+
+Each configuration layer is validated once, when it is read, and the merged
+configuration is exposed as a frozen ``ConfigModel`` by ``Config.model()``.
+Unknown keys are allowed and kept, so newer config files still load.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Section(BaseModel):
+    """Base for config sections: immutable, unknown keys kept."""
+    
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+
+class ComponentsModel(_Section):
+    """Enabled state of each component."""
+    
+    commands: bool = True
+    personas: bool = True
+    mcp: bool = True
+    orchestrator: bool = True
+
+
+class SettingsModel(_Section):
+    """General settings."""
+    
+    auto_update: bool = True
+    telemetry: bool = False
+    debug: bool = False
+    telemetry_redact_patterns: List[Union[str, Dict[str, str], List[str]]] = Field(
+        default_factory=list
+    )
+    telemetry_sampling: Dict[str, float] = Field(default_factory=dict)
+    telemetry_rate_limits: Dict[str, Dict[str, float]] = Field(default_factory=dict)
+
+
+class MCPServerModel(_Section):
+    """How to reach one MCP server; see ``mcp.servers.ServerSpec``."""
+    
+    command: Optional[Union[str, List[str]]] = None
+    url: Optional[str] = None
+    env: Dict[str, str] = Field(default_factory=dict)
+    headers: Dict[str, str] = Field(default_factory=dict)
+    timeout: Optional[float] = None
+
+
+class MCPModel(_Section):
+    """MCP server definitions and probing."""
+    
+    servers: Dict[str, MCPServerModel] = Field(default_factory=dict)
+    timeout: Optional[float] = None
+
+
+class ConfigModel(_Section):
+    """The whole configuration."""
+    
+    version: str = "3.1.0"
+    profile: str = "quick"
+    components: ComponentsModel = Field(default_factory=ComponentsModel)
+    settings: SettingsModel = Field(default_factory=SettingsModel)
+    mcp_servers: List[str] = Field(
+        default_factory=lambda: ["context7", "sequential", "magic", "playwright"]
+    )
+    mcp: MCPModel = Field(default_factory=MCPModel)
+
+
+def parse_layer_json(raw: bytes, source: str) -> Optional[Dict[str, Any]]:
+    """Parse and validate a config file in one pass.
+    
+    Keys with invalid values are logged and dropped; the rest of the file
+    is kept.
+    
+    Args:
+        raw: File contents
+        source: Description of the file for log messages
+    
+    Returns:
+        The values set in the file, or None if it is not a JSON object
+    """
+    try:
+        # Fast path: pydantic parses and validates straight from bytes
+        return ConfigModel.model_validate_json(raw).model_dump(exclude_unset=True)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            logger.error("Failed to load config", source=source, error=str(e))
+            return None
+    
+    data = json.loads(raw)
+    if not isinstance(data, dict):
+        logger.error("Config is not a JSON object", source=source)
+        return None
+    return validate_layer(data, source)
+
+
+def validate_layer(data: Dict[str, Any], source: str) -> Dict[str, Any]:
+    """Validate config values, dropping the invalid ones.
+    
+    Args:
+        data: Values set by one layer
+        source: Description of the layer for log messages
+    
+    Returns:
+        The valid values, coerced to their declared types
+    """
+    while True:
+        try:
+            return ConfigModel.model_validate(data).model_dump(exclude_unset=True)
+        except ValidationError as e:
+            errors = e.errors()
+        
+        before = data
+        for error in errors:
+            path = _key_path(error["loc"])
+            logger.warning(
+                "Ignoring invalid config value",
+                source=source,
+                key=".".join(path),
+                error=error["msg"],
+            )
+            data = _without(data, path)
+        if data is before:
+            # Nothing left to drop
+            return {}
+
+
+def _key_path(loc: Tuple[Union[int, str], ...]) -> Tuple[str, ...]:
+    """Get the dotted-key path of an error, up to the first list index."""
+    path: List[str] = []
+    for part in loc:
+        if not isinstance(part, str):
+            break
+        path.append(part)
+    return tuple(path)
+
+
+def _without(data: Dict[str, Any], path: Tuple[str, ...]) -> Dict[str, Any]:
+    """Get a copy of ``data`` with the value at ``path`` removed."""
+    if not path:
+        return {}
+    head, rest = path[0], path[1:]
+    if head not in data:
+        return data
+    result = dict(data)
+    if rest and isinstance(data[head], dict):
+        child = _without(data[head], rest)
+        if child is data[head]:
+            return data
+        result[head] = child
+    else:
+        del result[head]
+    return result
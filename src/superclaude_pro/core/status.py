@@ -0,0 +1,186 @@
+"""Precomputed installation status.
+
+``superclaude-pro status`` runs from shell prompts, so it must not parse the
+config or walk component directories. Whatever changes the installation
+(saving the config, activating or rolling back a generation) updates a small
+status record in the Claude directory, and ``status`` reads that one file.
+The record carries the stat key of the config file it was derived from, so
+a config edited by hand, replaced or deleted since is noticed with one
+``stat()``. ``scan_status()`` recomputes the record from disk in that case
+and for ``status --verify``.
+
+This module only imports the standard library and lightweight helpers, so
+``status --json`` stays cheap.
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
+
+from ..utils.files import atomic_write, file_lock
+from ..utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from .config import Config
+
+logger = get_logger(__name__)
+
+STATUS_FILE = "superclaude.status.json"
+
+
+def read_status(claude_dir: Path) -> Optional[Dict[str, Any]]:
+    """Read the status record.
+    
+    Args:
+        claude_dir: Claude configuration directory
+    
+    Returns:
+        The record, or None if it is missing or unreadable
+    """
+    try:
+        with open(Path(claude_dir) / STATUS_FILE, "rb") as f:
+            record = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def get_status(config: "Config", verify: bool = False) -> Dict[str, Any]:
+    """Get the installation status, from the record while it is current.
+    
+    A record that is missing, predates the config stat key or was written
+    for a config file that has since changed is recomputed with
+    ``scan_status()`` and saved, as is every ``verify`` scan. Nothing is
+    written for a directory that was never installed.
+    
+    Args:
+        config: Configuration of the installation
+        verify: Check installed files even if the record is current
+    
+    Returns:
+        The status record; recomputed records also list ``problems``
+    """
+    key = config_key(config)
+    stored = read_status(config.claude_dir)
+    if (
+        not verify
+        and stored is not None
+        and "config_key" in stored
+        and stored["config_key"] == key
+    ):
+        return stored
+    
+    record = scan_status(config)
+    if record["installed"] or stored is not None:
+        fields = {k: v for k, v in record.items() if k != "problems"}
+        try:
+            update_status(config.claude_dir, config_key=key, **fields)
+        except OSError as e:
+            logger.warning("Failed to update status record", error=str(e))
+    return record
+
+
+def config_key(config: "Config") -> Optional[List[int]]:
+    """Get the stat key of the config file as stored in the record.
+    
+    Args:
+        config: Configuration of the installation
+    
+    Returns:
+        The key the config cache validates with, None if there is no file
+    """
+    key = config._stat_key()
+    return list(key) if key is not None else None
+
+
+def update_status(claude_dir: Path, **fields: Any) -> Dict[str, Any]:
+    """Merge fields into the status record.
+    
+    Args:
+        claude_dir: Claude configuration directory, which must exist
+        **fields: Values to set
+    
+    Returns:
+        The new record
+    """
+    claude_dir = Path(claude_dir)
+    with file_lock(claude_dir / f"{STATUS_FILE}.lock"):
+        record = read_status(claude_dir) or {}
+        record.update(fields)
+        record["updated_at"] = datetime.now(timezone.utc).isoformat()
+        atomic_write(claude_dir / STATUS_FILE, json.dumps(record, indent=2))
+    return record
+
+
+def config_fields(
+    data: Mapping[str, Any], defaults: Mapping[str, Any]
+) -> Dict[str, Any]:
+    """Get the status fields derived from a saved configuration.
+    
+    Args:
+        data: Contents of the user config file
+        defaults: Built-in defaults for keys the file does not set
+    
+    Returns:
+        ``installed``, ``version``, ``profile`` and enabled ``components``
+    """
+    components = dict(defaults.get("components", {}))
+    components.update(data.get("components", {}))
+    return {
+        "installed": True,
+        "version": data.get("version", defaults.get("version")),
+        "profile": data.get("profile", defaults.get("profile")),
+        "components": [name for name, enabled in components.items() if enabled],
+    }
+
+
+def scan_status(config: "Config") -> Dict[str, Any]:
+    """Recompute the status from disk, checking every installed file.
+    
+    Args:
+        config: Configuration of the installation
+    
+    Returns:
+        A status record plus ``problems``, a list of descriptions of
+        missing component directories and modified or missing files
+    """
+    from .generations import GenerationStore
+    
+    if not config.is_installed():
+        return {
+            "installed": False,
+            "version": None,
+            "profile": None,
+            "components": [],
+            "generation": None,
+            "problems": [],
+        }
+    
+    record = config_fields(config.load(), config.get_defaults())
+    problems: List[str] = []
+    for name in record["components"]:
+        try:
+            path = config.get_component_path(name)
+        except ValueError:
+            continue
+        if not path.exists():
+            problems.append(f"{name}: {path} is missing")
+    
+    store = GenerationStore(config.claude_dir)
+    record["generation"] = store.current()
+    if record["generation"] is not None:
+        try:
+            manifest = store.manifest(record["generation"])
+        except OSError as e:
+            problems.append(f"generation {record['generation']}: {e}")
+        else:
+            for path in manifest.files():
+                rel = path.relative_to(manifest.root).as_posix()
+                if not path.exists():
+                    problems.append(f"{rel} is missing")
+                elif not manifest.is_intact(path):
+                    problems.append(f"{rel} was modified")
+    
+    record["problems"] = problems
+    return record
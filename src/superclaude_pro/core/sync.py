@@ -0,0 +1,327 @@
+"""Incremental, parallel installation of file trees.
+
+Component files (commands, personas, ...) are copied from the package into
+an install directory, which ``core.generations`` stages for each install.
+Every installed file is recorded in a manifest with its content hash and
+the size and mtime it had when written, so only files whose content changed
+are copied and local edits can be detected:
+    
+    manifest = Manifest.load(install_dir / MANIFEST_FILE)
+    plan = plan_sync(source_dir, install_dir / "commands", manifest)
+    with byte_progress(plan.copy_bytes, "Installing commands") as advance:
+        result = apply_sync(plan, manifest, on_progress=advance)
+    manifest.save()
+
+Planning hashes the source files on a thread pool; a destination file is
+only rewritten if its source hash differs from the manifest or the file was
+changed or removed since it was installed (detected by size and mtime, so
+unchanged installs are never re-read).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..utils.files import atomic_write
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_FILE = "superclaude.manifest.json"
+# Version 2 keys files by path relative to the manifest's directory
+MANIFEST_VERSION = 1
+
+_CHUNK_SIZE = 1 << 20
+
+ProgressCallback = Callable[[int], None]
+
+
+class Manifest:
+    """Content hashes of installed files.
+    
+    Files are keyed by their POSIX path relative to the directory holding
+    the manifest, so a manifest stays valid when that directory is moved
+    (a staged generation is renamed into place once complete). Methods take
+    and return full paths.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        entries: Optional[Dict[str, Dict[str, Any]]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Initialize manifest.
+        
+        Args:
+            path: Manifest file
+            entries: ``{"sha256", "size", "mtime_ns"}`` per relative path
+            metadata: Extra JSON-compatible values saved with the manifest
+        """
+        self.path = Path(path)
+        self.root = Path(os.path.abspath(self.path.parent))
+        self.entries: Dict[str, Dict[str, Any]] = dict(entries or {})
+        self.metadata: Dict[str, Any] = dict(metadata or {})
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def load(cls, path: Path) -> "Manifest":
+        """Load a manifest, empty if missing or unreadable.
+        
+        Args:
+            path: Manifest file
+        """
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                return cls(path, data.get("files", {}), data.get("metadata"))
+            logger.warning("Ignoring manifest with unknown version", path=str(path))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Ignoring unreadable manifest", path=str(path), error=str(e))
+        return cls(path)
+    
+    def save(self) -> None:
+        """Persist the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {
+                "version": MANIFEST_VERSION,
+                "files": self.entries,
+                "metadata": self.metadata,
+            }
+            atomic_write(self.path, json.dumps(data, indent=2, sort_keys=True))
+    
+    def get(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Get the entry of an installed file."""
+        return self.entries.get(self._key(path))
+    
+    def record(self, path: Path, digest: str) -> None:
+        """Record a file as installed with the given content hash.
+        
+        Args:
+            path: Installed file
+            digest: SHA-256 of its contents
+        """
+        st = os.stat(path)
+        with self._lock:
+            self.entries[self._key(path)] = {
+                "sha256": digest,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+            }
+    
+    def forget(self, path: Path) -> None:
+        """Remove a file's entry."""
+        with self._lock:
+            self.entries.pop(self._key(path), None)
+    
+    def files(self) -> List[Path]:
+        """Get the recorded files, sorted."""
+        return [self.root / name for name in sorted(self.entries)]
+    
+    def under(self, directory: Path) -> List[Path]:
+        """Get the recorded files inside a directory."""
+        prefix = self._key(directory) + "/"
+        if prefix == "./":
+            prefix = ""
+        return [self.root / name for name in self.entries if name.startswith(prefix)]
+    
+    def is_intact(self, path: Path) -> bool:
+        """Whether an installed file is unchanged since it was recorded."""
+        entry = self.get(path)
+        if entry is None:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]
+    
+    def _key(self, path: Path) -> str:
+        """Get the key of a path: POSIX and relative to the manifest's directory."""
+        relative = os.path.relpath(os.path.abspath(path), self.root)
+        return Path(relative).as_posix()
+
+
+@dataclass
+class SyncPlan:
+    """Files to copy, keep and remove to bring a destination up to date."""
+    
+    source: Path
+    destination: Path
+    # (source file, destination file, source hash, size)
+    copy: List[Tuple[Path, Path, str, int]] = field(default_factory=list)
+    unchanged: List[Path] = field(default_factory=list)
+    remove: List[Path] = field(default_factory=list)
+    workers: Optional[int] = None
+    
+    @property
+    def copy_bytes(self) -> int:
+        """Total bytes to copy."""
+        return sum(size for _, _, _, size in self.copy)
+
+
+@dataclass
+class SyncResult:
+    """Outcome of applying a plan."""
+    
+    copied: List[Path] = field(default_factory=list)
+    unchanged: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    bytes_copied: int = 0
+
+
+def hash_file(path: Path) -> str:
+    """Get the SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def plan_sync(
+    source: Path,
+    destination: Path,
+    manifest: Manifest,
+    force: bool = False,
+    workers: Optional[int] = None,
+) -> SyncPlan:
+    """Work out which files need copying, hashing sources in parallel.
+    
+    Args:
+        source: Directory or single file to install from
+        destination: Directory, or file for a file source, to install into
+        manifest: Manifest of installed files
+        force: Copy every file even if unchanged
+        workers: Thread pool size, chosen by ``ThreadPoolExecutor`` if None
+    
+    Returns:
+        The plan; nothing is written yet
+    """
+    source, destination = Path(source), Path(os.path.abspath(destination))
+    if source.is_file():
+        files = [source]
+    else:
+        files = sorted(p for p in source.rglob("*") if p.is_file())
+    plan = SyncPlan(source=source, destination=destination, workers=workers)
+    
+    def check(src: Path) -> Tuple[Path, Path, str, int, bool]:
+        dst = destination / src.relative_to(source) if src != source else destination
+        digest = hash_file(src)
+        entry = manifest.get(dst)
+        current = (
+            not force
+            and entry is not None
+            and entry["sha256"] == digest
+            and manifest.is_intact(dst)
+        )
+        return src, dst, digest, os.stat(src).st_size, current
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for src, dst, digest, size, current in pool.map(check, files):
+            if current:
+                plan.unchanged.append(dst)
+            else:
+                plan.copy.append((src, dst, digest, size))
+    
+    wanted = {dst for _, dst, _, _ in plan.copy} | set(plan.unchanged)
+    recorded = manifest.under(destination)
+    if manifest.get(destination) is not None:
+        recorded.append(destination)
+    plan.remove = sorted(p for p in recorded if p not in wanted)
+    return plan
+
+
+def apply_sync(
+    plan: SyncPlan,
+    manifest: Manifest,
+    on_progress: Optional[ProgressCallback] = None,
+) -> SyncResult:
+    """Copy changed files in parallel and remove files no longer shipped.
+    
+    Each file is written to a temporary name and renamed into place, so an
+    interrupted sync never leaves a half-written file. Files that were
+    modified since they were installed are not removed.
+    
+    Args:
+        plan: Plan from ``plan_sync()``
+        manifest: Manifest to update; call ``save()`` afterwards
+        on_progress: Called from worker threads with each chunk's size
+    
+    Returns:
+        What was done
+    """
+    result = SyncResult(unchanged=list(plan.unchanged))
+    
+    def copy(item: Tuple[Path, Path, str, int]) -> Tuple[Path, int]:
+        src, dst, digest, _ = item
+        written = copy_file(src, dst, on_progress)
+        manifest.record(dst, digest)
+        return dst, written
+    
+    with ThreadPoolExecutor(max_workers=plan.workers) as pool:
+        for dst, written in pool.map(copy, plan.copy):
+            result.copied.append(dst)
+            result.bytes_copied += written
+    
+    for path in plan.remove:
+        if manifest.is_intact(path):
+            path.unlink()
+            result.removed.append(path)
+        elif path.exists():
+            logger.warning("Keeping modified file no longer shipped", path=str(path))
+        manifest.forget(path)
+    
+    logger.debug(
+        "Synced files",
+        destination=str(plan.destination),
+        copied=len(result.copied),
+        unchanged=len(result.unchanged),
+        removed=len(result.removed),
+        bytes=result.bytes_copied,
+    )
+    return result
+
+
+def copy_file(
+    src: Path, dst: Path, on_progress: Optional[ProgressCallback] = None
+) -> int:
+    """Copy a file through a temporary name, reporting progress per chunk.
+    
+    Args:
+        src: File to copy
+        dst: Destination, replaced atomically; parents are created
+        on_progress: Called with the size of each copied chunk
+    
+    Returns:
+        Number of bytes copied
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    written = 0
+    try:
+        with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+            for chunk in iter(lambda: fsrc.read(_CHUNK_SIZE), b""):
+                fdst.write(chunk)
+                written += len(chunk)
+                if on_progress is not None:
+                    on_progress(len(chunk))
+        shutil.copymode(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return written
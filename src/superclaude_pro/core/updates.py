@@ -0,0 +1,219 @@
+"""Cached update checks against the package index.
+
+The latest release is read from the PyPI JSON API and cached in the Claude
+directory together with the response's ETag and Last-Modified headers:
+    
+    checker = UpdateChecker(config.claude_dir / UPDATE_CACHE_FILE)
+    newer = checker.check(__version__)
+
+Within the TTL the cache answers without touching the network. After it,
+the index is revalidated with a conditional request, which costs an empty
+304 response when nothing was released. With ``wait=False`` a stale answer
+is returned immediately and the cache is refreshed on a background thread
+(stale-while-revalidate), so callers never block on the network. A refresh
+still running when the interpreter exits is given ``EXIT_JOIN_TIMEOUT``
+seconds to write the cache.
+"""
+
+import atexit
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from ..utils.files import atomic_write
+from ..utils.http import get_http_client
+from ..utils.logger import get_logger
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = get_logger(__name__)
+
+INDEX_URL = "https://pypi.org/pypi/superclaude-pro/json"
+UPDATE_CACHE_FILE = "superclaude.update-cache.json"
+DEFAULT_TTL = 24 * 60 * 60
+# Seconds the interpreter waits at exit for a background refresh to finish
+EXIT_JOIN_TIMEOUT = 2.0
+
+_VERSION_RE = re.compile(r"v?(\d+(?:\.\d+)*)(.*)")
+
+
+def version_key(version: str) -> Tuple[Tuple[int, ...], int, str]:
+    """Get a sort key for a version string.
+    
+    Release numbers compare numerically (``3.10`` > ``3.9``, ``3.1`` ==
+    ``3.1.0``) and a pre-release suffix sorts before the plain release.
+    
+    Args:
+        version: Version such as ``"3.1.0"`` or ``"3.2.0rc1"``
+    """
+    match = _VERSION_RE.match(version.strip())
+    if match is None:
+        return ((), 0, version)
+    release = tuple(int(part) for part in match.group(1).split("."))
+    while release and release[-1] == 0:
+        release = release[:-1]
+    suffix = match.group(2)
+    return (release, 0 if suffix else 1, suffix)
+
+
+class UpdateChecker:
+    """Looks up the latest release through an on-disk cache."""
+    
+    def __init__(
+        self,
+        cache_path: Path,
+        url: str = INDEX_URL,
+        ttl: float = DEFAULT_TTL,
+        client: Optional["httpx.Client"] = None,
+    ) -> None:
+        """Initialize checker.
+        
+        Args:
+            cache_path: Cache file, e.g. ``claude_dir / UPDATE_CACHE_FILE``
+            url: Package index JSON URL
+            ttl: Seconds a lookup (successful or not) is trusted
+            client: HTTP client, the shared pooled client by default
+        """
+        self.cache_path = Path(cache_path)
+        self.url = url
+        self.ttl = ttl
+        self._client = client
+        self._lock = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
+        self._join_at_exit = False
+    
+    @property
+    def client(self) -> "httpx.Client":
+        """HTTP client used for lookups."""
+        return self._client if self._client is not None else get_http_client()
+    
+    def cached(self) -> Optional[Dict[str, Any]]:
+        """Get the cache entry for this index, None if there is none."""
+        try:
+            with open(self.cache_path, "rb") as f:
+                entry = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != self.url:
+            return None
+        return entry
+    
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Whether a cache entry is within the TTL."""
+        return time.time() - entry.get("checked_at", 0) < self.ttl
+    
+    def refresh(self) -> Optional[Dict[str, Any]]:
+        """Revalidate the cache against the index.
+        
+        Sends the cached ETag and Last-Modified so an unchanged index
+        answers 304 without a body. Network and server errors are logged
+        and recorded, so the next attempt waits for the TTL.
+        
+        Returns:
+            The new cache entry, or the old one if the lookup failed
+        """
+        import httpx
+        
+        entry = self.cached()
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
+        now = time.time()
+        try:
+            response = self.client.get(self.url, headers=headers)
+            if response.status_code == 304 and entry is not None:
+                new = dict(entry, checked_at=now)
+            else:
+                response.raise_for_status()
+                new = {
+                    "url": self.url,
+                    "version": response.json()["info"]["version"],
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "checked_at": now,
+                }
+        except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Update check failed", url=self.url, error=str(e))
+            new = dict(entry or {"url": self.url, "version": None}, checked_at=now)
+            self._save(new)
+            return entry
+        
+        self._save(new)
+        return new
+    
+    def refresh_in_background(self) -> None:
+        """Start a refresh on a daemon thread unless one is running.
+        
+        The thread is joined for up to ``EXIT_JOIN_TIMEOUT`` seconds at exit,
+        so a short-lived process still gets its cache refreshed.
+        """
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            # Create the shared client first: atexit runs hooks in reverse
+            # order, so the join below then runs before the client is closed
+            if self._client is None:
+                get_http_client()
+            if not self._join_at_exit:
+                atexit.register(self.join, EXIT_JOIN_TIMEOUT)
+                self._join_at_exit = True
+            self._refresher = threading.Thread(
+                target=self.refresh, name="superclaude-update-check", daemon=True
+            )
+            self._refresher.start()
+    
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for a background refresh to finish."""
+        refresher = self._refresher
+        if refresher is not None:
+            refresher.join(timeout)
+    
+    def latest_version(self, wait: bool = True) -> Optional[str]:
+        """Get the latest released version.
+        
+        Args:
+            wait: Revalidate a stale cache before answering; if False, answer
+                from the cache (None if empty) and revalidate in the background
+        
+        Returns:
+            The version, or None if it is not known
+        """
+        entry = self.cached()
+        if entry is not None and self.is_fresh(entry):
+            return entry.get("version")
+        if wait:
+            entry = self.refresh()
+        else:
+            self.refresh_in_background()
+        return entry.get("version") if entry is not None else None
+    
+    def check(self, current: str, wait: bool = True) -> Optional[str]:
+        """Get the latest version if it is newer than ``current``.
+        
+        Args:
+            current: Installed version
+            wait: See ``latest_version()``
+        
+        Returns:
+            The newer version, or None if up to date or unknown
+        """
+        latest = self.latest_version(wait=wait)
+        if latest is not None and version_key(latest) > version_key(current):
+            return latest
+        return None
+    
+    def _save(self, entry: Dict[str, Any]) -> None:
+        """Write the cache entry; failures only cost a future lookup."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(self.cache_path, json.dumps(entry), durable=False)
+        except OSError as e:
+            logger.warning("Failed to write update cache", error=str(e))
@@ -0,0 +1,27 @@
+"""MCP servers used by the installed commands."""
+
+from .cache import RESULT_CACHE_FILE, ToolCache, call_key
+from .manager import (
+    MCP_CACHE_FILE,
+    HandshakeCache,
+    MCPManager,
+    ServerStatus,
+    probe_servers,
+)
+from .servers import KNOWN_SERVERS, ServerSpec, server_specs
+from .transport import MCPError
+
+__all__ = [
+    "HandshakeCache",
+    "KNOWN_SERVERS",
+    "MCP_CACHE_FILE",
+    "MCPError",
+    "MCPManager",
+    "RESULT_CACHE_FILE",
+    "ServerSpec",
+    "ServerStatus",
+    "ToolCache",
+    "call_key",
+    "probe_servers",
+    "server_specs",
+]
@@ -0,0 +1,310 @@
+"""Cache of idempotent MCP tool call results.
+
+Documentation lookups such as context7's return the same result for the
+same library and version, so their results are worth keeping. Only tools
+with a TTL are cached: ``ttls`` maps ``"server/tool"`` or ``"server"`` (all
+of its tools) to seconds. Calls are keyed by a hash of the server, tool and
+canonical JSON arguments, so argument order and formatting do not matter:
+    
+    cache = ToolCache(ttls={"context7": 86400}, path=claude_dir / RESULT_CACHE_FILE)
+    result = cache.get("context7", "get-library-docs", {"libraryID": "/react"})
+    if result is None:
+        result = ...  # call the tool
+        cache.put("context7", "get-library-docs", {"libraryID": "/react"}, result)
+
+Results live in a size-bounded in-memory LRU and, with a ``path``, in a
+SQLite database that outlives the process and is shared by every process
+using the same file. Expired entries are never returned.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Tuple
+
+from ..utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from ..core.config import Config
+    from ..telemetry.collector import TelemetryCollector
+
+logger = get_logger(__name__)
+
+RESULT_CACHE_FILE = "superclaude.mcp-results.sqlite3"
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_DISK_ENTRIES = 10000
+# Documentation servers answer the same query identically for a day
+DEFAULT_TTLS: Dict[str, float] = {"context7": 24 * 60 * 60}
+# Cache name reported to telemetry
+TELEMETRY_NAME = "mcp_results"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    server TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+
+def call_key(server: str, tool: str, arguments: Optional[Mapping[str, Any]]) -> str:
+    """Get the content-addressed key of a tool call.
+    
+    Args:
+        server: Server name
+        tool: Tool name
+        arguments: Tool arguments; key order does not matter
+    
+    Returns:
+        Hex SHA-256 of the canonical JSON of the call
+    """
+    canonical = json.dumps(
+        [server, tool, arguments or {}],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ToolCache:
+    """Two-tier LRU/TTL cache of tool call results."""
+    
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        path: Optional[Path] = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize cache.
+        
+        Args:
+            ttls: Seconds to keep results, by ``"server/tool"`` or
+                ``"server"``; ``DEFAULT_TTLS`` if None
+            max_entries: Results kept in memory
+            path: SQLite database for the on-disk tier; memory only if None
+            max_disk_entries: Results kept on disk
+            clock: Wall-clock time source, shared with other processes
+        """
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self.max_disk_entries = max_disk_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._reported = (0, 0, 0)
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_failed = False
+        # Rows counted on open plus the rows this process wrote since
+        self._disk_rows = 0
+    
+    @classmethod
+    def for_config(cls, config: "Config") -> "ToolCache":
+        """Create the cache configured under ``mcp.cache``.
+        
+        ``mcp.cache.ttl`` adds to or overrides ``DEFAULT_TTLS`` (0 disables
+        a default), ``mcp.cache.max_entries`` bounds the memory tier and
+        ``mcp.cache.persist`` (default true) keeps results in
+        ``RESULT_CACHE_FILE`` under the Claude directory.
+        """
+        settings = config.get("mcp.cache", {}) or {}
+        ttls = dict(DEFAULT_TTLS)
+        ttls.update(settings.get("ttl", {}))
+        return cls(
+            ttls={name: float(ttl) for name, ttl in ttls.items() if ttl},
+            max_entries=int(settings.get("max_entries", DEFAULT_MAX_ENTRIES)),
+            path=(
+                config.claude_dir / RESULT_CACHE_FILE
+                if settings.get("persist", True)
+                else None
+            ),
+        )
+    
+    def ttl(self, server: str, tool: str) -> Optional[float]:
+        """Get the TTL of a tool's results, None if they are not cached."""
+        ttl = self.ttls.get(f"{server}/{tool}")
+        if ttl is None:
+            ttl = self.ttls.get(server)
+        return ttl if ttl else None
+    
+    def get(
+        self, server: str, tool: str, arguments: Optional[Mapping[str, Any]] = None
+    ) -> Optional[Any]:
+        """Get the cached result of a call.
+        
+        Returns:
+            The result, or None on a miss or if the tool is not cached
+        """
+        if self.ttl(server, tool) is None:
+            return None
+        key = call_key(server, tool, arguments)
+        now = self.clock()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[0] > now:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._memory[key]
+            stored = self._disk_get(key, now)
+            if stored is not None:
+                self._remember(key, stored)
+                self.hits += 1
+                return stored[1]
+            self.misses += 1
+            return None
+    
+    def put(
+        self,
+        server: str,
+        tool: str,
+        arguments: Optional[Mapping[str, Any]],
+        result: Any,
+    ) -> bool:
+        """Cache the result of a call.
+        
+        Results flagged ``isError`` are not cached.
+        
+        Returns:
+            Whether the result was cached
+        """
+        ttl = self.ttl(server, tool)
+        if ttl is None or (isinstance(result, dict) and result.get("isError")):
+            return False
+        key = call_key(server, tool, arguments)
+        now = self.clock()
+        entry = (now + ttl, result)
+        with self._lock:
+            self._remember(key, entry)
+            self._disk_put(key, server, tool, entry, now)
+        return True
+    
+    def clear(self) -> None:
+        """Drop every cached result, on disk too."""
+        with self._lock:
+            self._memory.clear()
+            db = self._connect()
+            if db is not None:
+                with db:
+                    db.execute("DELETE FROM results")
+                self._disk_rows = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get hit, miss and eviction counts and the memory tier size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "entries": len(self._memory),
+        }
+    
+    def report(self, collector: "TelemetryCollector") -> None:
+        """Send the counts accumulated since the last report to telemetry."""
+        current = (self.hits, self.misses, self.evictions)
+        hits, misses, evictions = (a - b for a, b in zip(current, self._reported))
+        if hits or misses or evictions:
+            collector.track_cache(TELEMETRY_NAME, hits, misses, evictions)
+        self._reported = current
+    
+    def close(self) -> None:
+        """Close the database; the cache reopens it if used again."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+    
+    def _remember(self, key: str, entry: Tuple[float, Any]) -> None:
+        """Add an entry to the memory tier, evicting the least recently used."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use; None without a usable one."""
+        if self._db is None and self.path is not None and not self._db_failed:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(
+                    str(self.path), timeout=5.0, check_same_thread=False
+                )
+                with db:
+                    db.executescript(_SCHEMA)
+                    db.execute(
+                        "DELETE FROM results WHERE expires <= ?", (self.clock(),)
+                    )
+                    (self._disk_rows,) = db.execute(
+                        "SELECT COUNT(*) FROM results"
+                    ).fetchone()
+                self._db = db
+            except sqlite3.Error as e:
+                # The memory tier still works; don't retry on every call
+                self._db_failed = True
+                logger.warning(
+                    "MCP result cache unavailable", path=str(self.path), error=str(e)
+                )
+        return self._db
+    
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, Any]]:
+        """Read a live entry from the disk tier, marking it used."""
+        db = self._connect()
+        if db is None:
+            return None
+        try:
+            row = db.execute(
+                "SELECT expires, value FROM results WHERE key = ? AND expires > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            with db:
+                db.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+            return row[0], json.loads(row[1])
+        except (sqlite3.Error, ValueError) as e:
+            logger.debug("Failed to read MCP result cache", error=str(e))
+            return None
+    
+    def _disk_put(
+        self, key: str, server: str, tool: str, entry: Tuple[float, Any], now: float
+    ) -> None:
+        """Write an entry to the disk tier, trimming it to its size bound."""
+        db = self._connect()
+        if db is None:
+            return
+        try:
+            value = json.dumps(entry[1], separators=(",", ":"))
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, server, tool, entry[0], now, value),
+                )
+                self._disk_rows += 1
+                # Replacements count too, so the table may be smaller; the
+                # trim only runs once it can be over the bound
+                if self._disk_rows > self.max_disk_entries:
+                    db.execute(
+                        "DELETE FROM results WHERE key IN (SELECT key FROM results "
+                        "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                        (self.max_disk_entries,),
+                    )
+                    self._disk_rows = self.max_disk_entries
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.debug("Failed to write MCP result cache", error=str(e))
@@ -0,0 +1,468 @@
+"""Concurrent startup and health probing of MCP servers.
+
+``MCPManager`` keeps one connection per server: stdio servers stay running
+and HTTP servers share a pooled ``httpx.AsyncClient``. Probing starts and
+initializes every server at once, each under its own timeout, so startup
+takes as long as the slowest server rather than the sum of all of them:
+    
+    async with MCPManager(server_specs(config), cache_path=...) as manager:
+        for status in await manager.probe_all():
+            print(status.name, status.healthy, status.latency_ms)
+
+The tool list a server reports is cached by server name and version. A
+server that reports a version already seen skips ``tools/list`` and the
+tools are taken from the cache. Results of idempotent tool calls are kept
+in an optional ``ToolCache``, and identical calls in flight share one
+request.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from ..utils.files import atomic_write
+from ..utils.logger import get_logger
+from .cache import ToolCache, call_key
+from .servers import DEFAULT_TIMEOUT, ServerSpec, server_specs
+from .transport import Connection, HttpConnection, StdioConnection
+
+if TYPE_CHECKING:
+    import httpx
+    
+    from ..core.config import Config
+    from ..telemetry.collector import TelemetryCollector
+
+logger = get_logger(__name__)
+
+PROTOCOL_VERSION = "2024-11-05"
+MCP_CACHE_FILE = "superclaude.mcp-cache.json"
+
+_CLIENT_INFO = {"name": "superclaude-pro", "version": "1"}
+
+
+@dataclass
+class ServerStatus:
+    """Outcome of probing one server."""
+    
+    name: str
+    healthy: bool
+    latency_ms: float = 0.0
+    version: Optional[str] = None
+    protocol_version: Optional[str] = None
+    capabilities: Dict[str, Any] = field(default_factory=dict)
+    tools: List[str] = field(default_factory=list)
+    # Whether the tool list came from the handshake cache
+    cached: bool = False
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+class HandshakeCache:
+    """Capabilities and tools of each server, by name and version."""
+    
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """Initialize cache.
+        
+        Args:
+            path: Cache file, e.g. ``claude_dir / MCP_CACHE_FILE``; in memory
+                only if None
+        """
+        self.path = Path(path) if path is not None else None
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+    
+    @staticmethod
+    def key(name: str, version: str) -> str:
+        """Get the cache key of a server version."""
+        return f"{name}@{version}"
+    
+    def get(self, name: str, version: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get the cached handshake of a server version.
+        
+        Returns:
+            ``{"capabilities", "tools"}``, or None if unknown; servers
+            without a version are never cached
+        """
+        if not version:
+            return None
+        return self._load().get(self.key(name, version))
+    
+    def put(self, name: str, version: Optional[str], entry: Dict[str, Any]) -> None:
+        """Cache the handshake of a server version."""
+        if not version:
+            return
+        entries = self._load()
+        # One entry per server: an upgrade replaces the old version
+        for key in [key for key in entries if key.rpartition("@")[0] == name]:
+            del entries[key]
+        entries[self.key(name, version)] = entry
+        self._dirty = True
+    
+    def save(self) -> None:
+        """Write the cache if it changed; failures are only logged."""
+        if self.path is None or not self._dirty:
+            return
+        try:
+            atomic_write(
+                self.path,
+                json.dumps(self._entries, separators=(",", ":")),
+                durable=False,
+            )
+            self._dirty = False
+        except OSError as e:
+            logger.warning(
+                "Failed to write MCP cache", path=str(self.path), error=str(e)
+            )
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the cache file once."""
+        if self._entries is None:
+            self._entries = {}
+            if self.path is not None:
+                try:
+                    data = json.loads(self.path.read_bytes())
+                    if isinstance(data, dict):
+                        self._entries = data
+                except FileNotFoundError:
+                    pass
+                except (OSError, ValueError) as e:
+                    logger.warning(
+                        "Ignoring unreadable MCP cache",
+                        path=str(self.path),
+                        error=str(e),
+                    )
+        return self._entries
+
+
+class MCPManager:
+    """Connections to a set of MCP servers."""
+    
+    def __init__(
+        self,
+        specs: Iterable[ServerSpec],
+        cache_path: Optional[Path] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        client: Optional["httpx.AsyncClient"] = None,
+        result_cache: Optional[ToolCache] = None,
+        telemetry: Optional["TelemetryCollector"] = None,
+    ) -> None:
+        """Initialize manager; nothing is started until used.
+        
+        Args:
+            specs: Servers to manage
+            cache_path: Handshake cache file; in memory only if None
+            timeout: Seconds a server may take to start and initialize,
+                unless its spec sets its own
+            client: HTTP client for HTTP servers, created on first use if
+                None (and then closed with the manager)
+            result_cache: Cache of tool call results; calls are not cached
+                if None
+            telemetry: Collector the result cache reports hits and misses
+                to when the manager closes; ``for_config()`` creates one
+                when telemetry is enabled
+        """
+        self.specs: Dict[str, ServerSpec] = {spec.name: spec for spec in specs}
+        self.timeout = timeout
+        self.cache = HandshakeCache(cache_path)
+        self.result_cache = result_cache
+        self.telemetry = telemetry
+        self._owns_telemetry = False
+        self._calls: Dict[str, "asyncio.Future[Any]"] = {}
+        self._client = client
+        self._owns_client = client is None
+        self._connections: Dict[str, Connection] = {}
+        self._statuses: Dict[str, ServerStatus] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    @classmethod
+    def for_config(
+        cls,
+        config: "Config",
+        timeout: Optional[float] = None,
+        telemetry: Optional["TelemetryCollector"] = None,
+    ) -> "MCPManager":
+        """Create a manager for the configured servers and caches.
+        
+        Args:
+            config: Configuration
+            timeout: Per-server timeout, ``mcp.timeout`` or the default if None
+            telemetry: Collector for result cache hit and miss counts; if
+                None and ``settings.telemetry`` is on, one is created for the
+                config and closed with the manager
+        """
+        if timeout is None:
+            timeout = float(config.get("mcp.timeout", DEFAULT_TIMEOUT))
+        owns_telemetry = telemetry is None and bool(
+            config.get("settings.telemetry", False)
+        )
+        if owns_telemetry:
+            from ..telemetry.collector import TelemetryCollector
+            
+            telemetry = TelemetryCollector(config)
+        manager = cls(
+            server_specs(config),
+            cache_path=config.claude_dir / MCP_CACHE_FILE,
+            timeout=timeout,
+            result_cache=ToolCache.for_config(config),
+            telemetry=telemetry,
+        )
+        manager._owns_telemetry = owns_telemetry
+        return manager
+    
+    async def __aenter__(self) -> "MCPManager":
+        """Enter the context."""
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close every connection."""
+        await self.close()
+    
+    def connection(self, name: str) -> Optional[Connection]:
+        """Get the open connection to a server, if any."""
+        connection = self._connections.get(name)
+        return connection if connection is not None and connection.alive else None
+    
+    async def probe_all(self) -> List[ServerStatus]:
+        """Probe every server concurrently.
+        
+        Returns:
+            One status per server, in spec order
+        """
+        statuses = await asyncio.gather(*(self.probe(name) for name in self.specs))
+        self.cache.save()
+        return list(statuses)
+    
+    async def probe(self, name: str) -> ServerStatus:
+        """Check that a server answers, starting it if needed.
+        
+        A server that is already connected is pinged; otherwise it is
+        started and initialized. Failures and timeouts are reported in the
+        status, never raised.
+        
+        Args:
+            name: Server name
+        
+        Raises:
+            KeyError: If the server is unknown
+        """
+        spec = self.specs[name]
+        timeout = spec.timeout if spec.timeout is not None else self.timeout
+        start = time.perf_counter()
+        try:
+            connection = self.connection(name)
+            if connection is not None:
+                await asyncio.wait_for(connection.request("ping"), timeout)
+                status = self._statuses[name]
+            else:
+                status = await asyncio.wait_for(self._connect(name), timeout)
+            status.healthy, status.error = True, None
+        except asyncio.TimeoutError:
+            await self._discard(name)
+            status = ServerStatus(name, False, error=f"timed out after {timeout:g}s")
+        except Exception as e:  # noqa: BLE001 - a broken server must not stop the rest
+            await self._discard(name)
+            status = ServerStatus(name, False, error=str(e) or type(e).__name__)
+        status.latency_ms = round((time.perf_counter() - start) * 1000, 3)
+        self._statuses[name] = status
+        if not status.healthy:
+            logger.warning("MCP server unavailable", server=name, error=status.error)
+        return status
+    
+    async def connect(self, name: str) -> Connection:
+        """Get an initialized connection to a server, reusing an open one.
+        
+        Args:
+            name: Server name
+        
+        Raises:
+            KeyError: If the server is unknown
+            asyncio.TimeoutError: If the server does not start in time
+            MCPError: If the server rejects the handshake
+        """
+        connection = self.connection(name)
+        if connection is None:
+            spec = self.specs[name]
+            timeout = spec.timeout if spec.timeout is not None else self.timeout
+            await asyncio.wait_for(self._connect(name), timeout)
+            connection = self._connections[name]
+        return connection
+    
+    async def call_tool(
+        self, server: str, tool: str, arguments: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Call a tool on a server.
+        
+        Tools with a TTL in the result cache are answered from it when
+        possible, and concurrent identical calls share one request.
+        
+        Args:
+            server: Server name
+            tool: Tool name
+            arguments: Tool arguments
+        
+        Returns:
+            The ``tools/call`` result
+        
+        Raises:
+            MCPError: If the server reports an error
+        """
+        cache = self.result_cache
+        if cache is None or cache.ttl(server, tool) is None:
+            return await self._call_tool(server, tool, arguments)
+        
+        key = call_key(server, tool, arguments)
+        pending = self._calls.get(key)
+        if pending is not None:
+            # Waiting on another caller's request counts as a hit
+            cache.hits += 1
+            return await asyncio.shield(pending)
+        result = cache.get(server, tool, arguments)
+        if result is not None:
+            return result
+        
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await self._call_tool(server, tool, arguments)
+            cache.put(server, tool, arguments, result)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieved here so an unawaited failure is not logged
+            future.exception()
+            raise
+        finally:
+            del self._calls[key]
+    
+    async def _call_tool(
+        self, server: str, tool: str, arguments: Optional[Dict[str, Any]]
+    ) -> Any:
+        """Send a ``tools/call`` request."""
+        connection = await self.connect(server)
+        return await connection.request(
+            "tools/call", {"name": tool, "arguments": arguments or {}}
+        )
+    
+    async def close(self) -> None:
+        """Close every connection, the HTTP client and owned collector."""
+        connections = list(self._connections.values())
+        self._connections.clear()
+        await asyncio.gather(
+            *(connection.close() for connection in connections), return_exceptions=True
+        )
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+        self.cache.save()
+        if self.result_cache is not None:
+            if self.telemetry is not None:
+                self.result_cache.report(self.telemetry)
+            self.result_cache.close()
+        if self.telemetry is not None and self._owns_telemetry:
+            self.telemetry.close()
+            self._owns_telemetry = False
+    
+    async def _connect(self, name: str) -> ServerStatus:
+        """Start and initialize a server, once even if called concurrently."""
+        lock = self._locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            if self.connection(name) is not None:
+                return self._statuses[name]
+            spec = self.specs[name]
+            if spec.transport == "http":
+                connection: Connection = HttpConnection(spec, self._http_client())
+            else:
+                connection = StdioConnection(spec)
+            try:
+                await connection.open()
+                status = await self._initialize(name, connection)
+            except BaseException:
+                # Including the cancellation of a timeout: a server that did
+                # not finish the handshake is stopped, never reused
+                await self._close(name, connection)
+                raise
+            self._connections[name] = connection
+            self._statuses[name] = status
+            return status
+    
+    async def _initialize(self, name: str, connection: Connection) -> ServerStatus:
+        """Run the MCP handshake, listing tools only on a cache miss."""
+        result = await connection.request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": _CLIENT_INFO,
+        })
+        await connection.notify("notifications/initialized")
+        version = (result.get("serverInfo") or {}).get("version")
+        capabilities = result.get("capabilities") or {}
+        status = ServerStatus(
+            name,
+            True,
+            version=version,
+            protocol_version=result.get("protocolVersion"),
+            capabilities=capabilities,
+        )
+        cached = self.cache.get(name, version)
+        if cached is not None:
+            status.tools = list(cached.get("tools", []))
+            status.cached = True
+        elif "tools" in capabilities:
+            listed = await connection.request("tools/list")
+            status.tools = [tool["name"] for tool in listed.get("tools", [])]
+            self.cache.put(name, version, {
+                "capabilities": capabilities,
+                "tools": status.tools,
+            })
+        return status
+    
+    def _http_client(self) -> "httpx.AsyncClient":
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            import httpx
+            
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+    
+    async def _discard(self, name: str) -> None:
+        """Drop a connection that failed."""
+        connection = self._connections.pop(name, None)
+        self._statuses.pop(name, None)
+        if connection is not None:
+            await self._close(name, connection)
+    
+    async def _close(self, name: str, connection: Connection) -> None:
+        """Close a connection; failures are only logged."""
+        try:
+            await connection.close()
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Failed to close MCP connection", server=name, error=str(e))
+
+
+def probe_servers(
+    config: "Config", timeout: Optional[float] = None
+) -> List[ServerStatus]:
+    """Probe the configured servers once, e.g. for a health check.
+    
+    Args:
+        config: Configuration
+        timeout: Per-server timeout, ``mcp.timeout`` or the default if None
+    
+    Returns:
+        One status per server
+    """
+    
+    async def run() -> List[ServerStatus]:
+        async with MCPManager.for_config(config, timeout=timeout) as manager:
+            return await manager.probe_all()
+    
+    return asyncio.run(run())
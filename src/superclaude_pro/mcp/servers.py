@@ -0,0 +1,130 @@
+"""MCP server definitions."""
+
+import shlex
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+from ..utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from ..core.config import Config
+
+logger = get_logger(__name__)
+
+# Seconds a server may take to start and answer the handshake
+DEFAULT_TIMEOUT = 10.0
+
+
+@dataclass(frozen=True)
+class ServerSpec:
+    """How to reach an MCP server.
+    
+    Servers with a ``url`` are spoken to over HTTP; the others are started
+    with ``command`` and spoken to over stdin/stdout.
+    """
+    
+    name: str
+    command: Tuple[str, ...] = ()
+    url: Optional[str] = None
+    env: Mapping[str, str] = field(default_factory=dict)
+    headers: Mapping[str, str] = field(default_factory=dict)
+    timeout: Optional[float] = None
+    
+    @property
+    def transport(self) -> str:
+        """``"http"`` or ``"stdio"``."""
+        return "http" if self.url else "stdio"
+    
+    @classmethod
+    def from_dict(
+        cls, name: str, data: Mapping[str, Any], base: Optional["ServerSpec"] = None
+    ) -> "ServerSpec":
+        """Build a spec from config values.
+        
+        Args:
+            name: Server name
+            data: ``command`` (list, or string split like a shell would),
+                ``url``, ``env``, ``headers`` and ``timeout``; missing keys
+                are taken from ``base``
+            base: Spec to override
+        
+        Raises:
+            ValueError: If the result has neither a command nor a URL
+        """
+        spec = base if base is not None else cls(name=name)
+        changes: Dict[str, Any] = {}
+        if "command" in data:
+            command = data["command"]
+            if isinstance(command, str):
+                command = shlex.split(command)
+            changes["command"] = tuple(command)
+        for key in ("url", "timeout"):
+            if key in data:
+                changes[key] = data[key]
+        for key in ("env", "headers"):
+            if key in data:
+                changes[key] = dict(data[key])
+        spec = replace(spec, name=name, **changes)
+        if not spec.command and not spec.url:
+            raise ValueError(f"MCP server {name!r} needs a command or a url")
+        return spec
+
+
+KNOWN_SERVERS: Dict[str, ServerSpec] = {
+    "context7": ServerSpec("context7", command=("npx", "-y", "@upstash/context7-mcp")),
+    "sequential": ServerSpec(
+        "sequential",
+        command=("npx", "-y", "@modelcontextprotocol/server-sequential-thinking"),
+    ),
+    "magic": ServerSpec("magic", command=("npx", "-y", "@21st-dev/magic")),
+    "playwright": ServerSpec("playwright", command=("npx", "-y", "@playwright/mcp")),
+}
+
+
+def server_specs(config: "Config") -> List[ServerSpec]:
+    """Get the specs of the servers enabled in ``mcp_servers``.
+    
+    Known servers use their built-in definition unless ``mcp.servers.<name>``
+    overrides it; other servers must be defined there. Both are read only
+    from the defaults, the user file and the environment: a project file
+    could otherwise make any checkout run commands, so its values are
+    logged and ignored.
+    
+    Args:
+        config: Configuration
+    
+    Returns:
+        Specs in ``mcp_servers`` order; invalid entries are logged and skipped
+    """
+    from ..core.layers import PROJECT_LAYER
+    
+    snapshot = config.snapshot()
+    ignored = sorted(
+        key
+        for key, layer in snapshot.provenance.items()
+        if layer == PROJECT_LAYER
+        and (key == "mcp_servers" or key.startswith("mcp.servers."))
+    )
+    if ignored:
+        logger.warning(
+            "Ignoring MCP servers set in the project config",
+            path=str(config.project_file),
+            keys=ignored,
+        )
+        snapshot = config.trusted_snapshot()
+    overrides = snapshot.get("mcp.servers", {}) or {}
+    specs = []
+    for name in snapshot.get("mcp_servers", ()):
+        base = KNOWN_SERVERS.get(name)
+        try:
+            if name in overrides:
+                specs.append(ServerSpec.from_dict(name, overrides[name], base=base))
+            elif base is not None:
+                specs.append(base)
+            else:
+                raise ValueError(
+                    f"Unknown MCP server {name!r}; define mcp.servers.{name}"
+                )
+        except (TypeError, ValueError) as e:
+            logger.warning("Skipping MCP server", server=name, error=str(e))
+    return specs
@@ -0,0 +1,246 @@
+"""JSON-RPC connections to MCP servers over stdio and HTTP."""
+
+import asyncio
+import itertools
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from .servers import ServerSpec
+
+if TYPE_CHECKING:
+    import httpx
+
+# Longest message line accepted from a stdio server
+_STDIO_LIMIT = 16 * 1024 * 1024
+
+
+class MCPError(Exception):
+    """An MCP server answered a request with an error."""
+    
+    def __init__(self, code: int, message: str) -> None:
+        """Initialize error.
+        
+        Args:
+            code: JSON-RPC error code
+            message: Error message
+        """
+        super().__init__(f"{message} (code {code})")
+        self.code = code
+
+
+class Connection(ABC):
+    """A JSON-RPC session with one server.
+    
+    Transports implement ``request()`` and ``notify()``, and override
+    ``open()``, ``close()`` and ``alive`` when they hold a resource.
+    """
+    
+    def __init__(self, spec: ServerSpec) -> None:
+        """Initialize connection.
+        
+        Args:
+            spec: Server to talk to
+        """
+        self.spec = spec
+        self._ids = itertools.count(1)
+    
+    @property
+    def alive(self) -> bool:
+        """Whether the connection can still be used."""
+        return True
+    
+    async def open(self) -> None:
+        """Establish the connection."""
+    
+    @abstractmethod
+    async def request(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Send a request and wait for its result.
+        
+        Raises:
+            MCPError: If the server answers with an error
+        """
+    
+    @abstractmethod
+    async def notify(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Send a notification."""
+    
+    async def close(self) -> None:
+        """Release the connection."""
+    
+    def _message(
+        self, method: str, params: Optional[Dict[str, Any]], request_id: Optional[int]
+    ) -> Dict[str, Any]:
+        """Build a JSON-RPC message."""
+        message: Dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if request_id is not None:
+            message["id"] = request_id
+        if params is not None:
+            message["params"] = params
+        return message
+
+
+def _result(message: Dict[str, Any]) -> Any:
+    """Get the result of a response message."""
+    error = message.get("error")
+    if error is not None:
+        raise MCPError(int(error.get("code", 0)), str(error.get("message", "error")))
+    return message.get("result", {})
+
+
+class StdioConnection(Connection):
+    """A server running as a subprocess, kept alive between requests.
+    
+    Messages are newline-delimited JSON. A reader task routes responses to
+    the waiting requests by id, so concurrent requests share one process.
+    """
+    
+    def __init__(self, spec: ServerSpec) -> None:
+        """Initialize connection; the process starts in ``open()``."""
+        super().__init__(spec)
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional["asyncio.Task[None]"] = None
+        self._pending: Dict[int, "asyncio.Future[Any]"] = {}
+    
+    @property
+    def alive(self) -> bool:
+        """Whether the server process is running."""
+        return self._process is not None and self._process.returncode is None
+    
+    @property
+    def pid(self) -> Optional[int]:
+        """Process id of the server."""
+        return self._process.pid if self._process is not None else None
+    
+    async def open(self) -> None:
+        """Start the server process."""
+        self._process = await asyncio.create_subprocess_exec(
+            *self.spec.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env={**os.environ, **self.spec.env},
+            limit=_STDIO_LIMIT,
+        )
+        self._reader = asyncio.ensure_future(self._read_loop())
+    
+    async def request(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Send a request and wait for its result."""
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._send(self._message(method, params, request_id))
+            return _result(await future)
+        finally:
+            self._pending.pop(request_id, None)
+    
+    async def notify(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Send a notification."""
+        await self._send(self._message(method, params, None))
+    
+    async def _send(self, message: Dict[str, Any]) -> None:
+        """Write one message to the server."""
+        if not self.alive:
+            raise ConnectionError(f"MCP server {self.spec.name!r} is not running")
+        stdin = self._process.stdin  # type: ignore[union-attr]
+        stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+        await stdin.drain()
+    
+    async def _read_loop(self) -> None:
+        """Route responses to pending requests until the server exits."""
+        stdout = self._process.stdout  # type: ignore[union-attr]
+        try:
+            while True:
+                line = await stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    # Servers may log to stdout; anything else is not ours
+                    continue
+                future = self._pending.get(message.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(message)
+        finally:
+            error = ConnectionError(f"MCP server {self.spec.name!r} exited")
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+    
+    async def close(self) -> None:
+        """Stop the server process."""
+        process = self._process
+        if process is None:
+            return
+        if process.returncode is None:
+            try:
+                process.stdin.close()  # type: ignore[union-attr]
+                await asyncio.wait_for(process.wait(), 1.0)
+            except (asyncio.TimeoutError, OSError):
+                process.kill()
+                await process.wait()
+        if self._reader is not None:
+            await self._reader
+
+
+class HttpConnection(Connection):
+    """A server reached over the MCP streamable HTTP transport.
+    
+    Requests go through a shared ``httpx.AsyncClient``, so connections to
+    the server are pooled and kept alive across requests.
+    """
+    
+    def __init__(self, spec: ServerSpec, client: "httpx.AsyncClient") -> None:
+        """Initialize connection.
+        
+        Args:
+            spec: Server to talk to; must have a ``url``
+            client: Pooled client
+        """
+        super().__init__(spec)
+        self.client = client
+        self.session_id: Optional[str] = None
+    
+    async def request(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Send a request and wait for its result."""
+        request_id = next(self._ids)
+        response = await self._post(self._message(method, params, request_id))
+        if response.headers.get("content-type", "").startswith("text/event-stream"):
+            for line in response.text.splitlines():
+                if line.startswith("data:"):
+                    message = json.loads(line[5:])
+                    if message.get("id") == request_id:
+                        return _result(message)
+            raise MCPError(-32603, f"No response to {method!r} in event stream")
+        return _result(response.json())
+    
+    async def notify(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Send a notification."""
+        await self._post(self._message(method, params, None))
+    
+    async def _post(self, message: Dict[str, Any]) -> "httpx.Response":
+        """POST a message, tracking the server's session id."""
+        headers = {"Accept": "application/json, text/event-stream", **self.spec.headers}
+        if self.session_id is not None:
+            headers["Mcp-Session-Id"] = self.session_id
+        response = await self.client.post(
+            self.spec.url, json=message, headers=headers  # type: ignore[arg-type]
+        )
+        response.raise_for_status()
+        self.session_id = response.headers.get("Mcp-Session-Id", self.session_id)
+        return response
@@ -0,0 +1,29 @@
+"""Orchestration of dependent tasks."""
+
+from .scheduler import (
+    CANCELLED,
+    DONE,
+    FAILED,
+    SKIPPED,
+    CycleError,
+    RunReport,
+    Scheduler,
+    Task,
+    TaskResult,
+    critical_path,
+    topological_order,
+)
+
+__all__ = [
+    "CANCELLED",
+    "DONE",
+    "FAILED",
+    "SKIPPED",
+    "CycleError",
+    "RunReport",
+    "Scheduler",
+    "Task",
+    "TaskResult",
+    "critical_path",
+    "topological_order",
+]
@@ -0,0 +1,576 @@
+"""Dependency-ordered task execution with bounded parallelism.
+
+Tasks declare the tasks they depend on; the scheduler runs them as a DAG,
+starting each task as soon as its dependencies have finished and a worker
+is free. Among ready tasks, higher ``priority`` starts first, then the
+order in which tasks were added:
+    
+    scheduler = Scheduler(max_workers=4)
+    scheduler.add("fetch", fetch_docs)
+    scheduler.add("index", build_index)
+    scheduler.add("analyze", analyze, deps=["fetch", "index"], priority=1)
+    report = scheduler.run()
+    print(report.wall_ms, report.critical_path())
+
+``run()`` executes tasks on a thread pool; ``run_async()`` runs coroutine
+functions on the event loop and plain functions on a thread pool. If a task
+fails, the tasks that depend on it are skipped while independent ones keep
+running (``fail_fast`` cancels everything instead). ``cancel()`` stops
+starting new tasks; under ``run_async()`` running tasks are cancelled too.
+"""
+
+import asyncio
+import heapq
+import inspect
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from ..utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from ..core.config import Config
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+# Task states
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+# Not started because a dependency failed or was skipped
+SKIPPED = "skipped"
+CANCELLED = "cancelled"
+
+
+class CycleError(ValueError):
+    """The task dependencies contain a cycle."""
+    
+    def __init__(self, cycle: List[str]) -> None:
+        """Initialize error.
+        
+        Args:
+            cycle: Task names along the cycle, first name repeated at the end
+        """
+        super().__init__(f"Dependency cycle: {' -> '.join(cycle)}")
+        self.cycle = cycle
+
+
+@dataclass(frozen=True)
+class Task:
+    """A unit of work and the tasks it waits for."""
+    
+    name: str
+    func: Callable[[], Any]
+    deps: Tuple[str, ...] = ()
+    priority: int = 0
+
+
+@dataclass
+class TaskResult:
+    """Outcome and timing of one task.
+    
+    Times are milliseconds since the start of the run; ``queued_ms`` is how
+    long the task waited for a worker after its dependencies finished.
+    """
+    
+    name: str
+    state: str = PENDING
+    result: Any = None
+    error: Optional[BaseException] = None
+    ready_ms: Optional[float] = None
+    started_ms: Optional[float] = None
+    finished_ms: Optional[float] = None
+    
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """Time the task ran, None if it never started."""
+        if self.started_ms is None or self.finished_ms is None:
+            return None
+        return self.finished_ms - self.started_ms
+    
+    @property
+    def queued_ms(self) -> Optional[float]:
+        """Time the task waited for a worker, None if it never started."""
+        if self.ready_ms is None or self.started_ms is None:
+            return None
+        return self.started_ms - self.ready_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary, without the result."""
+        return {
+            "name": self.name,
+            "state": self.state,
+            "error": repr(self.error) if self.error is not None else None,
+            "started_ms": _round(self.started_ms),
+            "duration_ms": _round(self.duration_ms),
+            "queued_ms": _round(self.queued_ms),
+        }
+
+
+@dataclass
+class RunReport:
+    """Results of a run, in the order tasks were added."""
+    
+    tasks: Dict[str, TaskResult]
+    deps: Dict[str, Tuple[str, ...]]
+    wall_ms: float = 0.0
+    max_workers: int = DEFAULT_MAX_WORKERS
+    peak_workers: int = 0
+    order: List[str] = field(default_factory=list)
+    
+    @property
+    def ok(self) -> bool:
+        """Whether every task finished successfully."""
+        return all(task.state == DONE for task in self.tasks.values())
+    
+    def results(self) -> Dict[str, Any]:
+        """Get the return value of each successful task."""
+        return {name: t.result for name, t in self.tasks.items() if t.state == DONE}
+    
+    def failed(self) -> Dict[str, BaseException]:
+        """Get the exception of each failed task."""
+        return {
+            name: task.error  # type: ignore[misc]
+            for name, task in self.tasks.items()
+            if task.state == FAILED
+        }
+    
+    def busy_ms(self) -> float:
+        """Get the total time tasks ran, i.e. the run's serial duration."""
+        return sum(task.duration_ms or 0.0 for task in self.tasks.values())
+    
+    def critical_path(self) -> Tuple[float, List[str]]:
+        """Get the longest chain of dependent tasks by measured duration.
+        
+        No schedule can finish faster than this chain, whatever the number
+        of workers.
+        
+        Returns:
+            (total duration in ms, task names along the chain)
+        """
+        durations = {name: t.duration_ms or 0.0 for name, t in self.tasks.items()}
+        return critical_path(self.deps, durations)
+    
+    def lower_bound_ms(self) -> float:
+        """Get the shortest possible wall time for these task durations.
+        
+        The larger of the critical path and the total work divided among
+        the workers.
+        """
+        return max(self.critical_path()[0], self.busy_ms() / self.max_workers)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        length, path = self.critical_path()
+        return {
+            "ok": self.ok,
+            "wall_ms": _round(self.wall_ms),
+            "busy_ms": _round(self.busy_ms()),
+            "critical_path_ms": _round(length),
+            "critical_path": path,
+            "peak_workers": self.peak_workers,
+            "tasks": [task.to_dict() for task in self.tasks.values()],
+        }
+
+
+def critical_path(
+    deps: Mapping[str, Iterable[str]], durations: Mapping[str, float]
+) -> Tuple[float, List[str]]:
+    """Get the longest chain through a DAG.
+    
+    Args:
+        deps: Dependencies of each task
+        durations: Duration of each task; missing tasks count as 0
+    
+    Returns:
+        (total duration, task names along the chain, first to last)
+    
+    Raises:
+        CycleError: If the dependencies contain a cycle
+    """
+    finish: Dict[str, float] = {}
+    via: Dict[str, Optional[str]] = {}
+    for name in topological_order(deps):
+        longest, previous = 0.0, None
+        for dep in deps.get(name, ()):
+            if finish[dep] > longest or previous is None:
+                longest, previous = finish[dep], dep
+        finish[name] = longest + durations.get(name, 0.0)
+        via[name] = previous
+    if not finish:
+        return 0.0, []
+    end: Optional[str] = max(finish, key=lambda name: finish[name])
+    length = finish[end]  # type: ignore[index]
+    path = []
+    while end is not None:
+        path.append(end)
+        end = via[end]
+    return length, path[::-1]
+
+
+def topological_order(
+    deps: Mapping[str, Iterable[str]], priorities: Optional[Mapping[str, int]] = None
+) -> List[str]:
+    """Order tasks so that each comes after its dependencies.
+    
+    Among tasks whose dependencies are all placed, higher priority comes
+    first, then mapping order.
+    
+    Args:
+        deps: Dependencies of each task
+        priorities: Priority of each task, 0 if missing
+    
+    Raises:
+        ValueError: If a task depends on an unknown task
+        CycleError: If the dependencies contain a cycle
+    """
+    priorities = priorities or {}
+    position = {name: i for i, name in enumerate(deps)}
+    dependents: Dict[str, List[str]] = {name: [] for name in deps}
+    remaining: Dict[str, int] = {}
+    for name, names in deps.items():
+        unique = set(names)
+        for dep in unique:
+            if dep not in dependents:
+                raise ValueError(f"Task {name!r} depends on unknown task {dep!r}")
+            dependents[dep].append(name)
+        remaining[name] = len(unique)
+    
+    ready = [
+        (-priorities.get(name, 0), position[name], name)
+        for name, count in remaining.items()
+        if not count
+    ]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        name = heapq.heappop(ready)[2]
+        order.append(name)
+        for dependent in dependents[name]:
+            remaining[dependent] -= 1
+            if not remaining[dependent]:
+                heapq.heappush(
+                    ready,
+                    (-priorities.get(dependent, 0), position[dependent], dependent),
+                )
+    if len(order) < len(deps):
+        raise CycleError(_find_cycle(deps, set(order)))
+    return order
+
+
+def _find_cycle(deps: Mapping[str, Iterable[str]], acyclic: Set[str]) -> List[str]:
+    """Find one cycle among the tasks not in ``acyclic``."""
+    # Every unordered task has an unordered dependency; follow them until
+    # a task repeats
+    start = next(name for name in deps if name not in acyclic)
+    seen: Dict[str, int] = {}
+    path: List[str] = []
+    name = start
+    while name not in seen:
+        seen[name] = len(path)
+        path.append(name)
+        name = next(dep for dep in deps[name] if dep not in acyclic)
+    cycle = path[seen[name]:] + [name]
+    # Report it in dependency order: a -> b means b waits for a
+    return cycle[::-1]
+
+
+class _Run:
+    """Bookkeeping shared by the thread and asyncio drivers."""
+    
+    def __init__(self, scheduler: "Scheduler") -> None:
+        """Validate the graph and mark tasks without dependencies ready."""
+        self.tasks = dict(scheduler.tasks)
+        self.fail_fast = scheduler.fail_fast
+        self.cancelled = scheduler._cancel
+        deps = {name: task.deps for name, task in self.tasks.items()}
+        # Validates the graph before anything runs
+        topological_order(deps)
+        self.position = {name: i for i, name in enumerate(self.tasks)}
+        self.dependents: Dict[str, List[str]] = {name: [] for name in self.tasks}
+        self.remaining: Dict[str, int] = {}
+        for name, task in self.tasks.items():
+            unique = set(task.deps)
+            for dep in unique:
+                self.dependents[dep].append(name)
+            self.remaining[name] = len(unique)
+        self.report = RunReport(
+            tasks={name: TaskResult(name) for name in self.tasks},
+            deps=deps,
+            max_workers=scheduler.max_workers,
+        )
+        self.ready: List[Tuple[int, int, str]] = []
+        self.running = 0
+        self.start = time.perf_counter()
+        for name, count in self.remaining.items():
+            if not count:
+                self._make_ready(name)
+    
+    def now_ms(self) -> float:
+        """Milliseconds since the run started."""
+        return (time.perf_counter() - self.start) * 1000
+    
+    def next_task(self) -> Optional[Task]:
+        """Take the best ready task and mark it running, None if none."""
+        if not self.ready or self.cancelled.is_set():
+            return None
+        name = heapq.heappop(self.ready)[2]
+        result = self.report.tasks[name]
+        result.state, result.started_ms = RUNNING, self.now_ms()
+        self.running += 1
+        self.report.peak_workers = max(self.report.peak_workers, self.running)
+        self.report.order.append(name)
+        return self.tasks[name]
+    
+    def finish(self, name: str, value: Any, error: Optional[BaseException]) -> None:
+        """Record a task's outcome and release or skip its dependents."""
+        result = self.report.tasks[name]
+        result.finished_ms = self.now_ms()
+        self.running -= 1
+        if isinstance(error, asyncio.CancelledError):
+            result.state = CANCELLED
+        elif error is not None:
+            result.state, result.error = FAILED, error
+            logger.warning("Task failed", task=name, error=str(error))
+            if self.fail_fast:
+                self.cancelled.set()
+        else:
+            result.state, result.result = DONE, value
+        for dependent in self.dependents[name]:
+            self.remaining[dependent] -= 1
+            if result.state != DONE:
+                self._skip(dependent)
+            elif not self.remaining[dependent]:
+                self._make_ready(dependent)
+    
+    @property
+    def finished(self) -> bool:
+        """Whether nothing is running or left to start."""
+        return not self.running and (not self.ready or self.cancelled.is_set())
+    
+    def close(self) -> RunReport:
+        """Mark tasks that never ran and return the report."""
+        for result in self.report.tasks.values():
+            if result.state == PENDING:
+                result.state = CANCELLED
+        self.report.wall_ms = self.now_ms()
+        return self.report
+    
+    def _make_ready(self, name: str) -> None:
+        """Queue a task whose dependencies have all finished."""
+        result = self.report.tasks[name]
+        if result.state != PENDING:
+            return
+        result.ready_ms = self.now_ms()
+        priority = self.tasks[name].priority
+        heapq.heappush(self.ready, (-priority, self.position[name], name))
+    
+    def _skip(self, name: str) -> None:
+        """Skip a task and, transitively, everything waiting for it."""
+        result = self.report.tasks[name]
+        if result.state != PENDING:
+            return
+        result.state = SKIPPED
+        for dependent in self.dependents[name]:
+            self._skip(dependent)
+
+
+class Scheduler:
+    """Runs a DAG of tasks with at most ``max_workers`` at a time."""
+    
+    def __init__(
+        self,
+        tasks: Iterable[Task] = (),
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        fail_fast: bool = False,
+    ) -> None:
+        """Initialize scheduler.
+        
+        Args:
+            tasks: Initial tasks
+            max_workers: Maximum number of tasks running at once
+            fail_fast: Cancel the remaining tasks when one fails
+        
+        Raises:
+            ValueError: If ``max_workers`` is below 1
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.fail_fast = fail_fast
+        self.tasks: Dict[str, Task] = {}
+        self._cancel = threading.Event()
+        for task in tasks:
+            self.add_task(task)
+    
+    @classmethod
+    def for_config(cls, config: "Config", **kwargs: Any) -> "Scheduler":
+        """Create a scheduler using ``orchestrator.max_workers``.
+        
+        Args:
+            config: Configuration
+            **kwargs: Passed to the constructor
+        """
+        kwargs.setdefault(
+            "max_workers",
+            int(config.get("orchestrator.max_workers", DEFAULT_MAX_WORKERS)),
+        )
+        return cls(**kwargs)
+    
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        deps: Iterable[str] = (),
+        priority: int = 0,
+    ) -> Task:
+        """Add a task.
+        
+        Args:
+            name: Unique task name
+            func: Function or coroutine function called without arguments
+            deps: Names of the tasks that must finish first; they may be
+                added later
+            priority: Higher runs first among ready tasks
+        
+        Raises:
+            ValueError: If a task with the same name exists
+        """
+        return self.add_task(Task(name, func, tuple(deps), priority))
+    
+    def add_task(self, task: Task) -> Task:
+        """Add a task; see ``add()``."""
+        if task.name in self.tasks:
+            raise ValueError(f"Duplicate task {task.name!r}")
+        self.tasks[task.name] = task
+        return task
+    
+    def order(self) -> List[str]:
+        """Get the order tasks would run in with one worker.
+        
+        Raises:
+            ValueError: If a task depends on an unknown task
+            CycleError: If the dependencies contain a cycle
+        """
+        return topological_order(
+            {name: task.deps for name, task in self.tasks.items()},
+            {name: task.priority for name, task in self.tasks.items()},
+        )
+    
+    def cancel(self) -> None:
+        """Stop starting tasks; safe to call from tasks and other threads."""
+        self._cancel.set()
+    
+    @property
+    def cancelled(self) -> bool:
+        """Whether the current run was cancelled; long tasks may poll it."""
+        return self._cancel.is_set()
+    
+    def run(self) -> RunReport:
+        """Run every task on a thread pool.
+        
+        Coroutine functions are run to completion on their worker thread.
+        
+        Raises:
+            ValueError: If a task depends on an unknown task
+            CycleError: If the dependencies contain a cycle
+        """
+        self._cancel.clear()
+        run = _Run(self)
+        futures: Dict[Future, str] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="superclaude-task"
+        ) as pool:
+            while not run.finished:
+                while run.running < self.max_workers:
+                    task = run.next_task()
+                    if task is None:
+                        break
+                    futures[pool.submit(_call, task.func)] = task.name
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures.pop(future)
+                    error = future.exception()
+                    run.finish(name, None if error else future.result(), error)
+        return run.close()
+    
+    async def run_async(self) -> RunReport:
+        """Run every task on the running event loop.
+        
+        Coroutine functions are awaited; plain functions run on a thread
+        pool of ``max_workers`` threads. ``cancel()`` also cancels the
+        running tasks (threads cannot be interrupted; their results are
+        discarded).
+        
+        Raises:
+            ValueError: If a task depends on an unknown task
+            CycleError: If the dependencies contain a cycle
+        """
+        self._cancel.clear()
+        run = _Run(self)
+        loop = asyncio.get_running_loop()
+        futures: Dict["asyncio.Future[Any]", str] = {}
+        pool: Optional[ThreadPoolExecutor] = None
+        try:
+            while not run.finished:
+                while run.running < self.max_workers:
+                    task = run.next_task()
+                    if task is None:
+                        break
+                    if inspect.iscoroutinefunction(task.func):
+                        future = asyncio.ensure_future(task.func())
+                    else:
+                        if pool is None:
+                            pool = ThreadPoolExecutor(
+                                max_workers=self.max_workers,
+                                thread_name_prefix="superclaude-task",
+                            )
+                        future = loop.run_in_executor(pool, _call, task.func)
+                    futures[future] = task.name
+                done, _ = await asyncio.wait(
+                    futures, timeout=0.05, return_when=asyncio.FIRST_COMPLETED
+                )
+                if self._cancel.is_set():
+                    for future in futures:
+                        future.cancel()
+                for future in done:
+                    name = futures.pop(future)
+                    if future.cancelled():
+                        run.finish(name, None, asyncio.CancelledError())
+                    else:
+                        error = future.exception()
+                        run.finish(name, None if error else future.result(), error)
+        finally:
+            for future in futures:
+                future.cancel()
+            if pool is not None:
+                pool.shutdown(wait=False)
+        return run.close()
+
+
+def _call(func: Callable[[], Any]) -> Any:
+    """Call a task function, running it to completion if it is a coroutine."""
+    if inspect.iscoroutinefunction(func):
+        return asyncio.run(func())
+    return func()
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    """Round milliseconds for reports."""
+    return round(value, 3) if value is not None else None
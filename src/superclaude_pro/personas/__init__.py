@@ -0,0 +1,6 @@
+"""Personas auto-activated by the request context."""
+
+from .builtin import BUILTIN_PERSONAS
+from .matcher import Persona, PersonaMatch, PersonaMatcher, tokenize
+
+__all__ = ["BUILTIN_PERSONAS", "Persona", "PersonaMatch", "PersonaMatcher", "tokenize"]
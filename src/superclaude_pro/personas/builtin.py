@@ -0,0 +1,121 @@
+"""The built-in personas and the context that activates them."""
+
+from typing import List
+
+from .matcher import Persona
+
+BUILTIN_PERSONAS: List[Persona] = [
+    Persona(
+        name="architect",
+        description="Systems design and long-term architecture",
+        keywords={
+            "architecture": 2.0, "design": 1.0, "microservices": 2.0,
+            "scalability": 2.0, "scalable": 1.5, "system": 0.5, "modular": 1.0,
+            "patterns": 1.0, "dependencies": 1.0, "structure": 1.0,
+        },
+        file_patterns=("*.adr.md", "docs/architecture/*", "ARCHITECTURE.md"),
+    ),
+    Persona(
+        name="frontend",
+        description="UI, UX and accessibility",
+        keywords={
+            "component": 1.5, "responsive": 2.0, "ui": 2.0, "ux": 2.0, "css": 2.0,
+            "accessibility": 2.0, "react": 2.0, "vue": 2.0, "frontend": 2.0,
+            "layout": 1.0, "navigation": 1.0, "dropdown": 1.0, "button": 1.0,
+        },
+        file_patterns=(
+            "*.tsx", "*.jsx", "*.vue", "*.svelte", "*.css", "*.scss", "*.html",
+        ),
+    ),
+    Persona(
+        name="backend",
+        description="APIs, data and server-side reliability",
+        keywords={
+            "api": 2.0, "endpoint": 2.0, "database": 2.0, "server": 1.5, "backend": 2.0,
+            "rest": 1.5, "graphql": 2.0, "sql": 1.5, "migration": 1.0, "queue": 1.0,
+            "cache": 1.0, "redis": 1.5,
+        },
+        file_patterns=("*.sql", "*/api/*", "*/models/*", "*/migrations/*", "*.proto"),
+    ),
+    Persona(
+        name="security",
+        description="Threat modelling and vulnerability review",
+        keywords={
+            "security": 2.0, "vulnerability": 2.0, "vulnerabilities": 2.0,
+            "authentication": 2.0, "authorization": 2.0, "auth": 1.5, "exploit": 2.0,
+            "xss": 2.0, "csrf": 2.0, "injection": 2.0, "encryption": 1.5,
+            "secrets": 1.5, "password": 1.0, "token": 1.0,
+        },
+        file_patterns=("*auth*", "*.pem", "*.key", "*security*"),
+    ),
+    Persona(
+        name="performance",
+        description="Profiling and optimization",
+        keywords={
+            "performance": 2.0, "slow": 2.0, "optimize": 2.0, "optimization": 2.0,
+            "latency": 2.0, "bottleneck": 2.0, "bottlenecks": 2.0, "memory": 1.0,
+            "profile": 1.5, "benchmark": 1.5, "fast": 1.0, "speed": 1.0,
+        },
+        file_patterns=("*bench*", "*.prof"),
+    ),
+    Persona(
+        name="analyzer",
+        description="Root-cause analysis and investigation",
+        keywords={
+            "analyze": 2.0, "analysis": 2.0, "investigate": 2.0, "debug": 1.5,
+            "troubleshoot": 2.0, "root": 1.0, "cause": 1.0, "why": 0.5, "bug": 1.0,
+            "error": 1.0, "crash": 1.5,
+        },
+        file_patterns=("*.log",),
+    ),
+    Persona(
+        name="qa",
+        description="Testing and quality assurance",
+        keywords={
+            "test": 2.0, "tests": 2.0, "testing": 2.0, "coverage": 2.0, "e2e": 2.0,
+            "qa": 2.0, "quality": 1.0, "fixtures": 1.5, "mocks": 1.5, "regression": 1.5,
+            "edge": 0.5,
+        },
+        file_patterns=("test_*.py", "*_test.py", "*.test.*", "*.spec.*", "tests/*"),
+    ),
+    Persona(
+        name="refactorer",
+        description="Code quality and technical debt",
+        keywords={
+            "refactor": 2.0, "refactoring": 2.0, "cleanup": 2.0, "clean": 1.0,
+            "duplication": 2.0, "complexity": 1.5, "simplify": 2.0, "debt": 1.5,
+            "readability": 1.5, "maintainability": 1.5,
+        },
+    ),
+    Persona(
+        name="devops",
+        description="Infrastructure, CI/CD and deployment",
+        keywords={
+            "deploy": 2.0, "deployment": 2.0, "docker": 2.0, "kubernetes": 2.0,
+            "k8s": 2.0, "ci": 1.5, "cd": 1.0, "pipeline": 1.5, "infrastructure": 2.0,
+            "terraform": 2.0, "monitoring": 1.5, "helm": 2.0,
+        },
+        file_patterns=(
+            "Dockerfile", "docker-compose*.yml", "*.tf", ".github/workflows/*",
+            "Makefile", "*.helm.yaml",
+        ),
+    ),
+    Persona(
+        name="mentor",
+        description="Explanations and guided learning",
+        keywords={
+            "explain": 2.0, "learn": 2.0, "understand": 1.5, "teach": 2.0,
+            "tutorial": 2.0, "how": 0.5, "beginner": 2.0, "guide": 1.0,
+        },
+    ),
+    Persona(
+        name="scribe",
+        description="Documentation and writing",
+        keywords={
+            "document": 2.0, "documentation": 2.0, "docs": 2.0, "readme": 2.0,
+            "changelog": 2.0, "write": 0.5, "guide": 1.0, "comments": 1.0,
+            "docstrings": 2.0,
+        },
+        file_patterns=("*.md", "*.rst", "docs/*"),
+    ),
+]
@@ -0,0 +1,325 @@
+"""Persona auto-activation from the request context.
+
+Each persona lists weighted keywords and file patterns. ``PersonaMatcher``
+compiles them once into:
+
+- an inverted index from token to ``(persona, weight)`` postings, and
+- file matchers: exact file names and ``*.ext`` patterns go into
+  dictionaries, the remaining globs into a single regex whose optional
+  lookaheads report every matching pattern in one pass.
+
+Scoring a request then costs one dictionary lookup per distinct token and
+per file, independent of the number of personas and rules:
+    
+    matcher = PersonaMatcher(BUILTIN_PERSONAS)
+    matcher.activate("Review this auth code for XSS", files=["login.tsx"])
+    # [PersonaMatch('security', 3.5), PersonaMatch('frontend', 2.0)]
+"""
+
+import fnmatch
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ..utils.logger import get_logger
+from ..utils.mdindex import MarkdownIndex
+
+logger = get_logger(__name__)
+
+# Score added to a persona when any file matches one of its patterns
+DEFAULT_FILE_WEIGHT = 2.0
+# Minimum score for a persona to activate
+DEFAULT_THRESHOLD = 2.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+_GLOB_CHARS = frozenset("*?[")
+
+# A request: its text, or its text and the files it touches
+Context = Union[str, Tuple[str, Sequence[str]]]
+
+
+@dataclass(frozen=True)
+class Persona:
+    """A persona and the context that activates it.
+    
+    Keywords are matched against lower-cased word tokens of the request.
+    File patterns are globs; patterns without ``/`` match the file name,
+    others match the path or any trailing part of it.
+    """
+    
+    name: str
+    keywords: Mapping[str, float] = field(default_factory=dict)
+    file_patterns: Tuple[str, ...] = ()
+    description: str = ""
+
+
+class PersonaMatch(NamedTuple):
+    """A persona activated for a request."""
+    
+    name: str
+    score: float
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-cased word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class PersonaMatcher:
+    """Scores requests against a set of personas."""
+    
+    def __init__(
+        self,
+        personas: Iterable[Persona],
+        file_weight: float = DEFAULT_FILE_WEIGHT,
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> None:
+        """Compile the personas' keywords and file patterns.
+        
+        Args:
+            personas: Personas to match; a later persona replaces an earlier
+                one with the same name
+            file_weight: Score a matching file adds to a persona (once)
+            threshold: Default minimum score to activate
+        """
+        by_name = {persona.name: persona for persona in personas}
+        self.personas: List[Persona] = list(by_name.values())
+        self.file_weight = file_weight
+        self.threshold = threshold
+        
+        self._postings: Dict[str, List[Tuple[str, float]]] = {}
+        for persona in self.personas:
+            for keyword, weight in persona.keywords.items():
+                for token in tokenize(keyword):
+                    self._postings.setdefault(token, []).append((persona.name, weight))
+        
+        self._file_names: Dict[str, List[str]] = {}
+        self._suffixes: Dict[str, List[str]] = {}
+        name_globs: List[Tuple[str, str]] = []
+        path_globs: List[Tuple[str, str]] = []
+        for persona in self.personas:
+            for pattern in persona.file_patterns:
+                if "/" in pattern:
+                    path_globs.append((persona.name, pattern))
+                elif not _GLOB_CHARS & set(pattern):
+                    self._file_names.setdefault(pattern, []).append(persona.name)
+                elif pattern.startswith("*.") and not _GLOB_CHARS & set(pattern[2:]):
+                    self._suffixes.setdefault(pattern[1:], []).append(persona.name)
+                else:
+                    name_globs.append((persona.name, pattern))
+        self._name_globs = _compile_globs(name_globs, prefix="")
+        # Path patterns also match below any directory
+        self._path_globs = _compile_globs(path_globs, prefix="(?:.*/)?")
+        # Requests touch the same files again and again
+        self._match_file = lru_cache(maxsize=4096)(  # type: ignore[method-assign]
+            self._match_file
+        )
+    
+    @classmethod
+    def from_directory(
+        cls, directory: Path, include_builtin: bool = True, **kwargs: float
+    ) -> "PersonaMatcher":
+        """Create a matcher from installed persona files.
+        
+        Persona files are markdown with frontmatter, e.g.::
+            
+            ---
+            name: security
+            keywords: [security, "auth:1.5", xss]
+            file_patterns: ["*.pem"]
+            ---
+        
+        Keywords default to weight 1.0; ``word:weight`` sets another. The
+        frontmatter is read through a ``MarkdownIndex``, so unchanged files
+        are not parsed again.
+        
+        Args:
+            directory: Personas directory, e.g. ``~/.claude/personas``
+            include_builtin: Start from the built-in personas, which files
+                with the same name replace
+            **kwargs: Passed to the constructor
+        """
+        from .builtin import BUILTIN_PERSONAS
+        
+        personas = list(BUILTIN_PERSONAS) if include_builtin else []
+        for rel, doc in sorted(MarkdownIndex(directory).documents().items()):
+            meta = doc["meta"]
+            keywords: Dict[str, float] = {}
+            for item in _as_list(meta.get("keywords")):
+                word, sep, weight = str(item).rpartition(":")
+                if not sep:
+                    word, weight = str(item), ""
+                try:
+                    keywords[word] = float(weight) if weight else 1.0
+                except ValueError:
+                    logger.warning(
+                        "Ignoring invalid keyword weight", persona=rel, keyword=item
+                    )
+            patterns = tuple(str(p) for p in _as_list(meta.get("file_patterns")))
+            personas.append(Persona(
+                name=str(meta.get("name") or Path(rel).stem),
+                keywords=keywords,
+                file_patterns=patterns,
+                description=str(meta.get("description") or doc["summary"]),
+            ))
+        return cls(personas, **kwargs)
+    
+    def score(self, text: str, files: Sequence[str] = ()) -> Dict[str, float]:
+        """Score every persona with any evidence in the request.
+        
+        Args:
+            text: Request text
+            files: Paths the request touches
+        
+        Returns:
+            Score by persona name; personas without evidence are omitted
+        """
+        scores: Dict[str, float] = {}
+        postings = self._postings
+        for token in set(_TOKEN_RE.findall(text.lower())):
+            for name, weight in postings.get(token, ()):
+                scores[name] = scores.get(name, 0.0) + weight
+        if files:
+            for name in self._match_files(files):
+                scores[name] = scores.get(name, 0.0) + self.file_weight
+        return scores
+    
+    def activate(
+        self,
+        text: str,
+        files: Sequence[str] = (),
+        threshold: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[PersonaMatch]:
+        """Get the personas a request activates, best first.
+        
+        Args:
+            text: Request text
+            files: Paths the request touches
+            threshold: Minimum score, the matcher's default if None
+            limit: Maximum number of personas
+        
+        Returns:
+            Matches sorted by score, then name
+        """
+        return self._rank(self.score(text, files), threshold, limit)
+    
+    def activate_many(
+        self,
+        contexts: Iterable[Context],
+        threshold: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[List[PersonaMatch]]:
+        """Activate personas for many requests.
+        
+        Repeated requests are scored once.
+        
+        Args:
+            contexts: Request texts, or (text, files) pairs
+            threshold: Minimum score, the matcher's default if None
+            limit: Maximum number of personas per request
+        
+        Returns:
+            The matches of each request, in order
+        """
+        seen: Dict[str, List[PersonaMatch]] = {}
+        results: List[List[PersonaMatch]] = []
+        score, rank = self.score, self._rank
+        for context in contexts:
+            if isinstance(context, str):
+                matches = seen.get(context)
+                if matches is None:
+                    matches = seen[context] = rank(score(context), threshold, limit)
+                # Callers get their own list
+                results.append(list(matches))
+            else:
+                text, files = context
+                results.append(rank(score(text, files), threshold, limit))
+        return results
+    
+    def _rank(
+        self, scores: Dict[str, float], threshold: Optional[float], limit: Optional[int]
+    ) -> List[PersonaMatch]:
+        """Turn scores into sorted matches above the threshold."""
+        minimum = self.threshold if threshold is None else threshold
+        matches = sorted(
+            (
+                PersonaMatch(name, score)
+                for name, score in scores.items()
+                if score >= minimum
+            ),
+            key=lambda match: (-match.score, match.name),
+        )
+        return matches[:limit] if limit is not None else matches
+    
+    def _match_files(self, files: Sequence[str]) -> List[str]:
+        """Get the personas whose file patterns match any of the files."""
+        matched: Dict[str, None] = {}
+        for file in files:
+            matched.update(dict.fromkeys(self._match_file(str(file))))
+        return list(matched)
+    
+    def _match_file(self, file: str) -> Tuple[str, ...]:
+        """Get the personas whose file patterns match a file; memoized."""
+        matched: Dict[str, None] = {}
+        path = file.replace("\\", "/")
+        name = path.rsplit("/", 1)[-1]
+        for persona in self._file_names.get(name, ()):
+            matched[persona] = None
+        dot = name.find(".")
+        while dot != -1:
+            for persona in self._suffixes.get(name[dot:], ()):
+                matched[persona] = None
+            dot = name.find(".", dot + 1)
+        for globs, subject in ((self._name_globs, name), (self._path_globs, path)):
+            if globs is None:
+                continue
+            regex, owners = globs
+            hit = regex.match(subject)
+            for group, persona in owners:
+                if hit.group(group) is not None:
+                    matched[persona] = None
+        return tuple(matched)
+
+
+def _compile_globs(
+    globs: List[Tuple[str, str]], prefix: str
+) -> Optional[Tuple[Pattern[str], List[Tuple[str, str]]]]:
+    """Compile globs into one regex of optional lookaheads, one per glob.
+    
+    Matching it at the start of a string always succeeds; group ``_gi`` is
+    set if glob ``i`` matched. The groups are named because
+    ``fnmatch.translate`` adds groups of its own for some globs on older
+    Pythons, which would shift positional group numbers.
+    
+    Returns:
+        (regex, (group name, persona name) per glob), or None without globs
+    """
+    if not globs:
+        return None
+    owners = [(f"_g{index}", name) for index, (name, _) in enumerate(globs)]
+    regex = "".join(
+        f"(?=(?P<{group}>{prefix}{fnmatch.translate(pattern)}))?"
+        for (group, _), (_, pattern) in zip(owners, globs)
+    )
+    return re.compile(regex), owners
+
+
+def _as_list(value: object) -> List[object]:
+    """Get a frontmatter value as a list."""
+    if value is None or value == "":
+        return []
+    return value if isinstance(value, list) else [value]
@@ -4,11 +4,12 @@ from typing import Optional
 
 try:
     from .collector import TelemetryCollector
-    from .metrics import Metrics
+    from .metrics import LatencyHistogram, Metrics
     TELEMETRY_AVAILABLE = True
 except ImportError:
     TELEMETRY_AVAILABLE = False
     TelemetryCollector = None
+    LatencyHistogram = None
     Metrics = None
 
-__all__ = ["TelemetryCollector", "Metrics", "TELEMETRY_AVAILABLE"]
\ No newline at end of file
+__all__ = ["TelemetryCollector", "Metrics", "LatencyHistogram", "TELEMETRY_AVAILABLE"]
\ No newline at end of file
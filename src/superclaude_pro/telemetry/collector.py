@@ -1,44 +1,140 @@
 """Telemetry collector for anonymous usage statistics."""
 
+import atexit
 import json
 import platform
+import threading
+import time
 import uuid
+import weakref
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import structlog
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from ..core.config import Config
 from ..utils.logger import get_logger
+from .flusher import DROP_OLDEST, BackgroundFlusher
+from .metrics import SESSION_EVENT, Metrics
+from .sampling import EventSampler
+from .sanitizer import DEFAULT_SANITIZER, ErrorSanitizer
+from .store import EventStore
 
 logger = get_logger(__name__)
 
+# Counts kept in memory are merged into the persisted rollup once this many
+# events have been written, or this many seconds after the last merge
+ROLLUP_EVERY = 1000
+ROLLUP_INTERVAL = 30.0
+
+
+def _close_at_exit(close: "weakref.WeakMethod[Callable[[], None]]") -> None:
+    """Close a collector at exit if it is still alive."""
+    method = close()
+    if method is not None:
+        method()
+
+
+@lru_cache(maxsize=None)
+def _platform_context() -> Dict[str, str]:
+    """Get platform details, computed once per process."""
+    return {
+        "python_version": platform.python_version(),
+        "platform": platform.system(),
+        "platform_version": platform.version(),
+    }
+
 
 class TelemetryCollector:
     """Collects anonymous telemetry data if enabled."""
     
-    def __init__(self, config: Config) -> None:
+    def __init__(
+        self,
+        config: Config,
+        background: bool = False,
+        buffer_size: int = 1000,
+        overflow: str = DROP_OLDEST,
+    ) -> None:
         """Initialize telemetry collector.
         
         Args:
             config: Application configuration
+            background: Buffer events in memory and write them from a
+                background thread instead of on the caller's thread
+            buffer_size: Maximum number of buffered events in background mode
+            overflow: Policy when the buffer is full, ``drop_oldest`` or ``block``
         """
         self.config = config
         self.enabled = config.get("settings.telemetry", False)
         self.session_id = str(uuid.uuid4())
+        # Legacy single-array store, migrated into the event store on startup
         self.metrics_file = config.claude_dir / ".telemetry" / "metrics.json"
+        self.store = EventStore(config.claude_dir / ".telemetry" / "events")
+        self.rollup_file = config.claude_dir / ".telemetry" / "rollup.json"
+        self._pending_metrics = Metrics()
+        self._pending_events = 0
+        self._pending_lock = threading.Lock()
+        self._last_rollup = time.monotonic()
+        self.rollup_every = ROLLUP_EVERY
+        self.rollup_interval = ROLLUP_INTERVAL
+        self._context: Optional[Dict[str, Any]] = None
+        self._session_recorded = False
+        self.sanitizer = DEFAULT_SANITIZER
+        self.sampler: Optional[EventSampler] = None
+        self.flusher: Optional[BackgroundFlusher] = None
         
         if self.enabled:
             self._ensure_telemetry_dir()
             self._load_or_create_client_id()
+            self._ensure_rollup()
+            self._migrate_legacy_metrics()
+            settings = config.get("settings", {})
+            self.sanitizer = ErrorSanitizer.from_config(
+                settings.get("telemetry_redact_patterns")
+            )
+            self.sampler = EventSampler.from_config(settings)
+            if background:
+                self.flusher = BackgroundFlusher(
+                    self._write_batch, capacity=buffer_size, overflow=overflow
+                )
+            # Registered after the flusher's hook, so it runs first. Held
+            # weakly, so collectors that are never closed can still be freed
+            self._exit_hook = partial(_close_at_exit, weakref.WeakMethod(self.close))
+            atexit.register(self._exit_hook)
             logger.info("Telemetry enabled", session_id=self.session_id)
         else:
             logger.debug("Telemetry disabled")
     
     def _ensure_telemetry_dir(self) -> None:
         """Ensure telemetry directory exists."""
-        self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
+        self.store.ensure_dir()
+    
+    def _migrate_legacy_metrics(self) -> None:
+        """Move events from the old ``metrics.json`` array into the store."""
+        if not self.metrics_file.exists():
+            return
+        
+        try:
+            with open(self.metrics_file, "r") as f:
+                events = json.load(f)
+            if isinstance(events, list):
+                events = events[-self.store.max_events:]
+                self.store.append_many(events)
+                self._update_metrics(events)
+            self.metrics_file.unlink()
+            logger.debug("Migrated legacy telemetry", events=len(events))
+        except Exception as e:
+            logger.debug("Failed to migrate legacy telemetry", error=str(e))
+    
+    def _ensure_rollup(self) -> None:
+        """Build the metrics rollup from stored events if it does not exist."""
+        if self.rollup_file.exists():
+            return
+        
+        try:
+            Metrics.build(self.rollup_file, self.store.iter_events())
+        except Exception as e:
+            logger.debug("Failed to build telemetry rollup", error=str(e))
     
     def _load_or_create_client_id(self) -> None:
         """Load or create anonymous client ID."""
@@ -64,17 +160,26 @@ class TelemetryCollector:
         if not self.enabled:
             return
         
+        weight = 1.0
+        if self.sampler is not None:
+            sampled = self.sampler.weigh(event_name)
+            if sampled is None:
+                return
+            weight = sampled
+        
+        # Client and platform context live in the session record
         event = {
             "timestamp": datetime.utcnow().isoformat(),
             "session_id": self.session_id,
-            "client_id": self.client_id,
             "event": event_name,
             "properties": properties or {},
-            "context": self._get_context(),
         }
+        if weight != 1.0:
+            # Number of real events this stored event stands for
+            event["sample_weight"] = weight
         
         self._store_event(event)
-        logger.debug("Event tracked", event=event_name)
+        logger.debug("Event tracked", event_name=event_name)
     
     def track_command(
         self,
@@ -98,6 +203,31 @@ class TelemetryCollector:
             },
         )
     
+    def track_cache(
+        self,
+        cache: str,
+        hits: int,
+        misses: int,
+        evictions: int = 0,
+    ) -> None:
+        """Track cache effectiveness.
+        
+        Args:
+            cache: Cache name
+            hits: Lookups answered from the cache since the last report
+            misses: Lookups not answered from the cache
+            evictions: Entries dropped to stay within the size bound
+        """
+        self.track_event(
+            "cache_stats",
+            {
+                "cache": cache,
+                "hits": hits,
+                "misses": misses,
+                "evictions": evictions,
+            },
+        )
+    
     def track_error(
         self,
         error_type: str,
@@ -121,17 +251,31 @@ class TelemetryCollector:
         )
     
     def _get_context(self) -> Dict[str, Any]:
-        """Get telemetry context.
+        """Get telemetry context, computed once per session.
         
         Returns:
             Context dictionary
         """
+        if self._context is None:
+            self._context = {
+                "version": self.config.version,
+                **_platform_context(),
+                "profile": self.config.get("profile", "unknown"),
+            }
+        return self._context
+    
+    def _session_record(self) -> Dict[str, Any]:
+        """Build the record that carries this session's shared context.
+        
+        Returns:
+            Session record, written once before the session's first event
+        """
         return {
-            "version": self.config.version,
-            "python_version": platform.python_version(),
-            "platform": platform.system(),
-            "platform_version": platform.version(),
-            "profile": self.config.get("profile", "unknown"),
+            "timestamp": datetime.utcnow().isoformat(),
+            "session_id": self.session_id,
+            "client_id": self.client_id,
+            "event": SESSION_EVENT,
+            "context": self._get_context(),
         }
     
     def _sanitize_error(self, error_message: str) -> str:
@@ -139,19 +283,11 @@ class TelemetryCollector:
         
         Args:
             error_message: Original error message
-            
+        
         Returns:
             Sanitized error message
         """
-        # Remove file paths
-        import re
-        sanitized = re.sub(r'[\/]\S+[\/]\S+', '<path>', error_message)
-        
-        # Remove potential secrets (basic patterns)
-        sanitized = re.sub(r'[a-zA-Z0-9]{20,}', '<redacted>', sanitized)
-        
-        # Limit length
-        return sanitized[:500]
+        return self.sanitizer.sanitize(error_message)
     
     def _store_event(self, event: Dict[str, Any]) -> None:
         """Store event locally.
@@ -159,26 +295,116 @@ class TelemetryCollector:
         Args:
             event: Event data
         """
+        records = [event]
+        needs_header = not self._session_recorded
+        if needs_header:
+            records.insert(0, self._session_record())
+            self._session_recorded = True
+        
+        if self.flusher is not None:
+            for record in records:
+                self.flusher.submit(record)
+            return
+        
         try:
-            # Read existing events
-            if self.metrics_file.exists():
-                with open(self.metrics_file, "r") as f:
-                    events = json.load(f)
-            else:
-                events = []
-            
-            # Add new event
-            events.append(event)
-            
-            # Keep only last 1000 events
-            if len(events) > 1000:
-                events = events[-1000:]
-            
-            # Write back
-            with open(self.metrics_file, "w") as f:
-                json.dump(events, f, indent=2)
+            self.store.append_many(records)
         except Exception as e:
             logger.debug("Failed to store telemetry", error=str(e))
+            if needs_header:
+                self._session_recorded = False
+            return
+        self._update_metrics(records)
+    
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Stream stored events with their session context attached.
+        
+        Events whose session record has been compacted away get a
+        ``None`` context.
+        
+        Yields:
+            Events, oldest first
+        """
+        self.flush()
+        sessions: Dict[str, Dict[str, Any]] = {}
+        for record in self.store.iter_events():
+            if record.get("event") == SESSION_EVENT:
+                sessions[record["session_id"]] = {
+                    "client_id": record.get("client_id"),
+                    **record.get("context", {}),
+                }
+                continue
+            if "context" not in record:
+                record["context"] = sessions.get(record.get("session_id", ""))
+            yield record
+    
+    def _write_batch(self, events: List[Dict[str, Any]]) -> None:
+        """Write a batch of buffered events to the store.
+        
+        Args:
+            events: Events to write
+        """
+        self.store.append_many(events)
+        self._update_metrics(events)
+    
+    def _update_metrics(self, events: List[Dict[str, Any]]) -> None:
+        """Count written events towards the metrics rollup.
+        
+        Counts are kept in memory and merged into the persisted rollup every
+        ``rollup_every`` events or ``rollup_interval`` seconds, and on
+        ``flush()``/``close()``, so a write does not pay for a locked
+        read-merge-write of the rollup file.
+        
+        Args:
+            events: Events just written to the store
+        """
+        with self._pending_lock:
+            for event in events:
+                if event.get("event") != SESSION_EVENT:
+                    self._pending_metrics.record(event)
+                    self._pending_events += 1
+            due = (
+                self._pending_events >= self.rollup_every
+                or time.monotonic() - self._last_rollup >= self.rollup_interval
+            )
+        if due:
+            self._merge_rollup()
+    
+    def _merge_rollup(self) -> None:
+        """Add the in-memory counts to the persisted rollup.
+        
+        Counts that cannot be persisted are kept and retried with the next
+        merge.
+        """
+        with self._pending_lock:
+            pending = self._pending_metrics
+            self._pending_metrics = Metrics()
+            self._pending_events = 0
+            self._last_rollup = time.monotonic()
+        if not pending:
+            return
+        
+        try:
+            pending.accumulate(self.rollup_file)
+        except Exception as e:
+            logger.debug("Failed to update telemetry rollup", error=str(e))
+            with self._pending_lock:
+                pending.merge(self._pending_metrics)
+                self._pending_metrics = pending
+    
+    def flush(self) -> None:
+        """Write any buffered events and counts to disk."""
+        if self.flusher is not None:
+            self.flusher.flush()
+        if self.enabled:
+            self._merge_rollup()
+    
+    def close(self) -> None:
+        """Flush buffered events and counts and stop the background writer."""
+        if self.flusher is not None:
+            self.flusher.close()
+        if self.enabled:
+            self._merge_rollup()
+            atexit.unregister(self._exit_hook)
     
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get summary of collected metrics.
@@ -186,44 +412,18 @@ class TelemetryCollector:
         Returns:
             Metrics summary
         """
-        if not self.enabled or not self.metrics_file.exists():
+        if not self.enabled:
             return {}
         
+        self.flush()
         try:
-            with open(self.metrics_file, "r") as f:
-                events = json.load(f)
-            
-            # Calculate summary
-            command_counts = {}
-            error_counts = {}
-            total_commands = 0
-            total_errors = 0
-            
-            for event in events:
-                if event["event"] == "command_executed":
-                    cmd = event["properties"]["command"]
-                    command_counts[cmd] = command_counts.get(cmd, 0) + 1
-                    total_commands += 1
-                elif event["event"] == "error_occurred":
-                    err_type = event["properties"]["error_type"]
-                    error_counts[err_type] = error_counts.get(err_type, 0) + 1
-                    total_errors += 1
-            
-            return {
-                "total_events": len(events),
-                "total_commands": total_commands,
-                "total_errors": total_errors,
-                "top_commands": sorted(
-                    command_counts.items(),
-                    key=lambda x: x[1],
-                    reverse=True,
-                )[:10],
-                "top_errors": sorted(
-                    error_counts.items(),
-                    key=lambda x: x[1],
-                    reverse=True,
-                )[:5],
-            }
+            # Served from the rollup maintained as events are written
+            metrics = Metrics.load(self.rollup_file)
+            with self._pending_lock:
+                metrics.merge(self._pending_metrics)
+            if not metrics:
+                return {}
+            return metrics.summary()
         except Exception as e:
             logger.debug("Failed to get metrics summary", error=str(e))
             return {}
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""Background batching of telemetry writes."""
+
+import atexit
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+OVERFLOW_POLICIES = (DROP_OLDEST, BLOCK)
+
+
+class BackgroundFlusher:
+    """Buffers events in memory and writes them in batches on a daemon thread.
+    
+    Submitting an event only appends to a bounded buffer; the flusher thread
+    hands batches to ``sink`` when ``batch_size`` events are waiting or every
+    ``interval`` seconds, whichever comes first. The buffer is drained at
+    interpreter exit.
+    
+    When the buffer is full, ``overflow`` decides what happens: ``drop_oldest``
+    discards the oldest buffered event, ``block`` waits for space (up to
+    ``block_timeout`` seconds, then drops the new event). Dropped events are
+    counted in ``dropped``.
+    """
+    
+    def __init__(
+        self,
+        sink: Callable[[List[Dict[str, Any]]], None],
+        capacity: int = 1000,
+        batch_size: int = 100,
+        interval: float = 1.0,
+        overflow: str = DROP_OLDEST,
+        block_timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize and start the flusher.
+        
+        Args:
+            sink: Callable that persists a batch of events
+            capacity: Maximum number of buffered events
+            batch_size: Number of buffered events that triggers a flush
+            interval: Maximum seconds between flushes
+            overflow: Overflow policy, ``drop_oldest`` or ``block``
+            block_timeout: Seconds to wait for space under the ``block`` policy
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        
+        self.sink = sink
+        self.capacity = capacity
+        self.batch_size = max(1, min(batch_size, capacity))
+        self.interval = interval
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        
+        self.submitted = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.failed = 0
+        
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="superclaude-telemetry-flusher", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def submit(self, event: Dict[str, Any]) -> bool:
+        """Queue an event for writing.
+        
+        Args:
+            event: Event data
+        
+        Returns:
+            False if the event was dropped
+        """
+        with self._cond:
+            if self._closed:
+                self.dropped += 1
+                return False
+            
+            if len(self._buffer) >= self.capacity:
+                if self.overflow == DROP_OLDEST:
+                    self._buffer.popleft()
+                    self.dropped += 1
+                elif not self._cond.wait_for(
+                    lambda: len(self._buffer) < self.capacity or self._closed,
+                    timeout=self.block_timeout,
+                ) or self._closed:
+                    self.dropped += 1
+                    return False
+            
+            self._buffer.append(event)
+            self.submitted += 1
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify_all()
+            return True
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write all buffered events now and wait for them to be written.
+        
+        Args:
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            True if the buffer was fully drained
+        """
+        with self._cond:
+            if not self._thread.is_alive():
+                return not self._buffer
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._buffer and not self._in_flight, timeout=timeout
+            )
+    
+    def close(self, timeout: float = 5.0) -> None:
+        """Drain the buffer and stop the flusher thread.
+        
+        Args:
+            timeout: Maximum seconds to wait for the drain
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+        
+        if self._buffer:
+            logger.debug("Telemetry buffer not fully drained", pending=len(self._buffer))
+    
+    def stats(self) -> Dict[str, int]:
+        """Get flusher counters."""
+        with self._cond:
+            return {
+                "submitted": self.submitted,
+                "flushed": self.flushed,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "pending": len(self._buffer),
+            }
+    
+    def _run(self) -> None:
+        """Flusher thread main loop."""
+        deadline = time.monotonic() + self.interval
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed
+                    or self._flush_requested
+                    or len(self._buffer) >= self.batch_size,
+                    timeout=max(0.0, deadline - time.monotonic()),
+                )
+                if not self._buffer:
+                    self._flush_requested = False
+                    self._cond.notify_all()
+                    if self._closed:
+                        return
+                    deadline = time.monotonic() + self.interval
+                    continue
+                
+                count = min(len(self._buffer), self.batch_size)
+                batch = [self._buffer.popleft() for _ in range(count)]
+                self._in_flight = count
+                # Wake producers blocked on a full buffer
+                self._cond.notify_all()
+            
+            try:
+                self.sink(batch)
+                written, failed = count, 0
+            except Exception as e:
+                logger.debug("Failed to flush telemetry batch", error=str(e))
+                written, failed = 0, count
+            
+            with self._cond:
+                self.flushed += written
+                self.failed += failed
+                self._in_flight = 0
+                if not self._buffer:
+                    deadline = time.monotonic() + self.interval
+                self._cond.notify_all()
@@ -0,0 +1,396 @@
+"""Incrementally maintained telemetry rollups."""
+
+import heapq
+import json
+from array import array
+from datetime import datetime
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.files import atomic_write, file_lock
+
+# Record carrying per-session context; not counted as a usage event
+SESSION_EVENT = "session_started"
+
+# Number of most recent days kept in the per-day counters
+DAILY_RETENTION = 90
+
+# Latency histogram layout: 2**SUB_BITS linear sub-buckets per power of two,
+# i.e. at most 1/16 (6.25%) relative error, for values up to 2**MAX_BITS ms
+SUB_BITS = 4
+SUB_BUCKETS = 1 << SUB_BITS
+MAX_BITS = 40
+BUCKET_COUNT = SUB_BUCKETS * (MAX_BITS - SUB_BITS + 1)
+MAX_VALUE = (1 << MAX_BITS) - 1
+
+
+class LatencyHistogram:
+    """Constant-memory, mergeable histogram of durations in milliseconds.
+    
+    Uses an HDR-style log-linear layout held in an ``array``: values below 32
+    are counted exactly, larger values fall into one of 16 linear buckets per
+    power of two. Histograms with the same layout merge by adding bucket
+    counts, so they can be combined across sessions and machines.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = array("Q", bytes(8 * BUCKET_COUNT))
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+    
+    @staticmethod
+    def bucket_index(value: int) -> int:
+        """Get the bucket index of a value."""
+        if value < SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - SUB_BITS - 1
+        return SUB_BUCKETS * (shift + 1) + (value >> shift) - SUB_BUCKETS
+    
+    @staticmethod
+    def bucket_upper_bound(index: int) -> int:
+        """Get the largest value counted in a bucket."""
+        if index < SUB_BUCKETS:
+            return index
+        shift = index // SUB_BUCKETS - 1
+        mantissa = index % SUB_BUCKETS + SUB_BUCKETS
+        return ((mantissa + 1) << shift) - 1
+    
+    def record(self, value: float) -> None:
+        """Record one duration.
+        
+        Args:
+            value: Duration in milliseconds
+        """
+        value = min(max(int(value), 0), MAX_VALUE)
+        self.counts[self.bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+    
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts to this one.
+        
+        Args:
+            other: Histogram to add
+        """
+        if not other.count:
+            return
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)  # type: ignore[type-var]
+        self.max = other.max if self.max is None else max(self.max, other.max)  # type: ignore[type-var]
+    
+    def percentile(self, p: float) -> Optional[int]:
+        """Get the value at a percentile.
+        
+        Args:
+            p: Percentile between 0 and 100
+        
+        Returns:
+            Upper bound of the bucket holding the percentile (capped at the
+            exact maximum), or None if nothing was recorded
+        """
+        if not self.count:
+            return None
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.bucket_upper_bound(index), self.max)  # type: ignore[type-var]
+        return self.max
+    
+    def summary(self) -> Dict[str, Any]:
+        """Get count, mean, p50/p90/p99 and max."""
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 1) if self.count else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict with sparse bucket counts."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {
+                str(index): count for index, count in enumerate(self.counts) if count
+            },
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Deserialize a histogram produced by ``to_dict()``."""
+        histogram = cls()
+        for index, count in data.get("buckets", {}).items():
+            histogram.counts[int(index)] = count
+        histogram.count = data.get("count", 0)
+        histogram.total = data.get("total", 0)
+        histogram.min = data.get("min")
+        histogram.max = data.get("max")
+        return histogram
+
+
+class Metrics:
+    """Additive counters over telemetry events.
+    
+    Counts are kept per command, error type, day and cache. Rollups are
+    mergeable, so each process records its own delta and adds it to the
+    persisted rollup with ``accumulate()``; a summary then costs a read of
+    the rollup plus a top-k heap selection over distinct keys, independent
+    of how many events were ever recorded.
+    """
+    
+    def __init__(self, data: Optional[Dict[str, Any]] = None) -> None:
+        """Initialize metrics.
+        
+        Args:
+            data: Serialized metrics as returned by ``to_dict()``
+        """
+        data = data or {}
+        self.total_events: int = data.get("total_events", 0)
+        self.total_commands: int = data.get("total_commands", 0)
+        self.total_errors: int = data.get("total_errors", 0)
+        # Stored events that stand for more than one real event
+        self.weighted_events: int = data.get("weighted_events", 0)
+        self.command_counts: Dict[str, int] = dict(data.get("command_counts", {}))
+        self.error_counts: Dict[str, int] = dict(data.get("error_counts", {}))
+        self.daily: Dict[str, Dict[str, int]] = {
+            day: dict(counts) for day, counts in data.get("daily", {}).items()
+        }
+        self.latency: Dict[str, LatencyHistogram] = {
+            cmd: LatencyHistogram.from_dict(hist)
+            for cmd, hist in data.get("latency", {}).items()
+        }
+        self.cache_counts: Dict[str, Dict[str, int]] = {
+            cache: dict(counts)
+            for cache, counts in data.get("cache_counts", {}).items()
+        }
+    
+    @classmethod
+    def from_events(cls, events: Iterable[Dict[str, Any]]) -> "Metrics":
+        """Build metrics by scanning events.
+        
+        Args:
+            events: Stored telemetry events
+        """
+        metrics = cls()
+        for event in events:
+            metrics.record(event)
+        return metrics
+    
+    def __bool__(self) -> bool:
+        """Whether any event has been recorded."""
+        return self.total_events > 0
+    
+    def record(self, event: Dict[str, Any]) -> None:
+        """Count a single event.
+        
+        Sampled events count by their ``sample_weight``, so totals are
+        estimates of the true counts.
+        
+        Args:
+            event: Telemetry event
+        """
+        name = event.get("event")
+        if name == SESSION_EVENT:
+            return
+        properties = event.get("properties") or {}
+        weight = event.get("sample_weight", 1)
+        day = str(event.get("timestamp") or datetime.utcnow().isoformat())[:10]
+        daily = self.daily.setdefault(day, {"events": 0, "commands": 0, "errors": 0})
+        
+        if weight != 1:
+            self.weighted_events += 1
+        self.total_events += weight
+        daily["events"] += weight
+        if name == "command_executed":
+            cmd = properties.get("command", "unknown")
+            self.command_counts[cmd] = self.command_counts.get(cmd, 0) + weight
+            self.total_commands += weight
+            daily["commands"] += weight
+            duration_ms = properties.get("duration_ms")
+            if duration_ms is not None:
+                if cmd not in self.latency:
+                    self.latency[cmd] = LatencyHistogram()
+                self.latency[cmd].record(duration_ms)
+        elif name == "error_occurred":
+            err_type = properties.get("error_type", "unknown")
+            self.error_counts[err_type] = self.error_counts.get(err_type, 0) + weight
+            self.total_errors += weight
+            daily["errors"] += weight
+        elif name == "cache_stats":
+            counts = self.cache_counts.setdefault(
+                properties.get("cache", "unknown"),
+                {"hits": 0, "misses": 0, "evictions": 0},
+            )
+            for key in ("hits", "misses", "evictions"):
+                counts[key] = counts.get(key, 0) + properties.get(key, 0) * weight
+    
+    def merge(self, other: "Metrics") -> None:
+        """Add another rollup's counts to this one.
+        
+        Args:
+            other: Metrics to add
+        """
+        self.total_events += other.total_events
+        self.total_commands += other.total_commands
+        self.total_errors += other.total_errors
+        self.weighted_events += other.weighted_events
+        _add_counts(self.command_counts, other.command_counts)
+        _add_counts(self.error_counts, other.error_counts)
+        for day, counts in other.daily.items():
+            _add_counts(self.daily.setdefault(day, {}), counts)
+        for cache, counts in other.cache_counts.items():
+            _add_counts(self.cache_counts.setdefault(cache, {}), counts)
+        for cmd, histogram in other.latency.items():
+            if cmd not in self.latency:
+                self.latency[cmd] = LatencyHistogram()
+            self.latency[cmd].merge(histogram)
+        
+        if len(self.daily) > DAILY_RETENTION:
+            for day in sorted(self.daily)[:-DAILY_RETENTION]:
+                del self.daily[day]
+    
+    def top_commands(self, k: int = 10) -> List[Tuple[str, int]]:
+        """Get the ``k`` most used commands."""
+        return heapq.nlargest(k, self.command_counts.items(), key=itemgetter(1))
+    
+    def top_errors(self, k: int = 5) -> List[Tuple[str, int]]:
+        """Get the ``k`` most frequent error types."""
+        return heapq.nlargest(k, self.error_counts.items(), key=itemgetter(1))
+    
+    def summary(self) -> Dict[str, Any]:
+        """Get a metrics summary.
+        
+        Counts are rounded to integers; ``estimated`` tells whether any of
+        them were extrapolated from sampled events.
+        """
+        return {
+            "total_events": round(self.total_events),
+            "total_commands": round(self.total_commands),
+            "total_errors": round(self.total_errors),
+            "top_commands": [(cmd, round(n)) for cmd, n in self.top_commands(10)],
+            "top_errors": [(err, round(n)) for err, n in self.top_errors(5)],
+            "estimated": self.weighted_events > 0,
+            "daily": {
+                day: {key: round(n) for key, n in counts.items()}
+                for day, counts in sorted(self.daily.items())
+            },
+            "latency": {
+                cmd: histogram.summary()
+                for cmd, histogram in sorted(self.latency.items())
+            },
+            "caches": {
+                cache: _cache_summary(counts)
+                for cache, counts in sorted(self.cache_counts.items())
+            },
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize metrics to a JSON-compatible dict."""
+        return {
+            "total_events": self.total_events,
+            "total_commands": self.total_commands,
+            "total_errors": self.total_errors,
+            "weighted_events": self.weighted_events,
+            "command_counts": self.command_counts,
+            "error_counts": self.error_counts,
+            "daily": self.daily,
+            "latency": {
+                cmd: histogram.to_dict() for cmd, histogram in self.latency.items()
+            },
+            "cache_counts": self.cache_counts,
+        }
+    
+    @classmethod
+    def load(cls, path: Path) -> "Metrics":
+        """Load a persisted rollup, empty if missing or unreadable.
+        
+        Args:
+            path: Rollup file
+        """
+        try:
+            with open(path, "r") as f:
+                return cls(json.load(f))
+        except (OSError, ValueError):
+            return cls()
+    
+    def save(self, path: Path) -> None:
+        """Persist the rollup.
+        
+        Args:
+            path: Rollup file
+        """
+        atomic_write(path, json.dumps(self.to_dict()), durable=False)
+    
+    def accumulate(self, path: Path) -> None:
+        """Add these counts to the rollup persisted at ``path``.
+        
+        The update is done under a file lock, so concurrent processes each
+        adding their own delta never lose counts.
+        
+        Args:
+            path: Rollup file
+        """
+        with file_lock(_lock_path(path)):
+            rollup = Metrics.load(path)
+            rollup.merge(self)
+            rollup.save(path)
+    
+    @classmethod
+    def build(cls, path: Path, events: Iterable[Dict[str, Any]]) -> bool:
+        """Persist a rollup built from events unless one exists.
+        
+        The check and the build happen under the lock ``accumulate()``
+        takes, so when several processes start at once only one of them
+        builds the rollup and no event is counted twice.
+        
+        Args:
+            path: Rollup file
+            events: Stored events, only read if the rollup is built
+        
+        Returns:
+            Whether the rollup was built
+        """
+        with file_lock(_lock_path(path)):
+            if path.exists():
+                return False
+            cls.from_events(events).save(path)
+            return True
+
+
+def _lock_path(path: Path) -> Path:
+    """Get the lock file guarding a rollup."""
+    return path.with_name(path.name + ".lock")
+
+
+def _add_counts(target: Dict[str, int], counts: Dict[str, int]) -> None:
+    """Add counters into ``target`` in place."""
+    for key, count in counts.items():
+        target[key] = target.get(key, 0) + count
+
+
+def _cache_summary(counts: Dict[str, int]) -> Dict[str, Any]:
+    """Get rounded cache counts and the hit rate."""
+    hits, misses = counts.get("hits", 0), counts.get("misses", 0)
+    return {
+        "hits": round(hits),
+        "misses": round(misses),
+        "evictions": round(counts.get("evictions", 0)),
+        "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None,
+    }
@@ -0,0 +1,158 @@
+"""Sampling and rate limiting of telemetry events."""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Key matching any event name without its own setting
+WILDCARD = "*"
+
+# Events that are never sampled or rate limited
+ALWAYS_KEEP: FrozenSet[str] = frozenset({"error_occurred"})
+
+
+class TokenBucket:
+    """Token bucket allowing ``rate`` events per second with bursts of ``burst``."""
+    
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity, defaults to one second worth of tokens
+            clock: Monotonic time source
+        """
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(rate, 1.0))
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+    
+    def try_acquire(self) -> bool:
+        """Take a token if one is available."""
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class EventSampler:
+    """Decides which events to keep and how much each kept event counts.
+    
+    Each event name can have a sampling rate (probability of keeping it) and
+    a token-bucket rate limit. A kept event's weight is the number of events
+    it stands for: ``1 / rate`` for sampled events, plus the weight of any
+    events of the same name dropped by the rate limiter since the last kept
+    one. Summing weights therefore gives an unbiased estimate of the true
+    event count. Events in ``ALWAYS_KEEP`` bypass both mechanisms.
+    """
+    
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        limits: Optional[Dict[str, Dict[str, float]]] = None,
+        rng: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize sampler.
+        
+        Args:
+            rates: Sampling rate in ``[0, 1]`` per event name, ``"*"`` for
+                the default
+            limits: ``{"per_second": ..., "burst": ...}`` per event name,
+                ``"*"`` for the default
+            rng: Source of uniform random numbers in ``[0, 1)``
+            clock: Monotonic time source for rate limits
+        
+        Raises:
+            ValueError: If a rate limit has no ``per_second`` value
+        """
+        for name, limit in (limits or {}).items():
+            if "per_second" not in limit:
+                raise ValueError(f"Rate limit for {name!r} needs 'per_second'")
+        self.rates = {name: min(max(float(rate), 0.0), 1.0) for name, rate in (rates or {}).items()}
+        self.limits = dict(limits or {})
+        self.rng = rng
+        self.clock = clock
+        self.sampled_out = 0
+        self.rate_limited = 0
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._carry: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> Optional["EventSampler"]:
+        """Build a sampler from ``settings``, or None if nothing is configured.
+        
+        Args:
+            settings: The ``settings`` config section, read for
+                ``telemetry_sampling`` and ``telemetry_rate_limits``
+        """
+        rates = settings.get("telemetry_sampling") or {}
+        limits = settings.get("telemetry_rate_limits") or {}
+        if not rates and not limits:
+            return None
+        try:
+            return cls(rates=rates, limits=limits)
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.warning("Ignoring invalid telemetry sampling settings", error=str(e))
+            return None
+    
+    @property
+    def dropped(self) -> int:
+        """Total events dropped by sampling or rate limiting."""
+        return self.sampled_out + self.rate_limited
+    
+    def weigh(self, event_name: str) -> Optional[float]:
+        """Decide whether to keep an event.
+        
+        Args:
+            event_name: Name of the event
+        
+        Returns:
+            Weight to store with the event, or None to drop it
+        """
+        if event_name in ALWAYS_KEEP:
+            return 1.0
+        
+        rate = self.rates.get(event_name, self.rates.get(WILDCARD, 1.0))
+        with self._lock:
+            if rate < 1.0 and self.rng() >= rate:
+                self.sampled_out += 1
+                return None
+            weight = 1.0 / rate
+            
+            bucket = self._bucket(event_name)
+            if bucket is not None and not bucket.try_acquire():
+                self._carry[event_name] = self._carry.get(event_name, 0.0) + weight
+                self.rate_limited += 1
+                return None
+            return weight + self._carry.pop(event_name, 0.0)
+    
+    def stats(self) -> Dict[str, int]:
+        """Get drop counters."""
+        return {"sampled_out": self.sampled_out, "rate_limited": self.rate_limited}
+    
+    def _bucket(self, event_name: str) -> Optional[TokenBucket]:
+        """Get the rate limiter of an event name, if any."""
+        bucket = self._buckets.get(event_name)
+        if bucket is None:
+            limit = self.limits.get(event_name, self.limits.get(WILDCARD))
+            if not limit:
+                return None
+            bucket = TokenBucket(limit["per_second"], limit.get("burst"), clock=self.clock)
+            self._buckets[event_name] = bucket
+        return bucket
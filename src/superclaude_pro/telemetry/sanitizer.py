@@ -0,0 +1,211 @@
+"""Redaction of sensitive data from telemetry error messages."""
+
+import re
+import warnings
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (pattern, replacement) pairs, applied in priority order
+DEFAULT_RULES: Tuple[Tuple[str, str], ...] = (
+    # File paths
+    (r"[\/]\S+[\/]\S+", "<path>"),
+    # Potential secrets (basic patterns); the lookbehind only tries runs from
+    # their start, giving the same matches without rescanning inside words
+    (r"(?<![a-zA-Z0-9])[a-zA-Z0-9]{20,}", "<redacted>"),
+)
+
+DEFAULT_MAX_LENGTH = 500
+
+# Input scanned beyond ``max_length`` before looking for a token boundary,
+# so replacements that shorten the text still fill the output
+_SCAN_FACTOR = 2
+# Longest stretch searched for whitespace before cutting mid-token
+_BOUNDARY_SEARCH = 4096
+
+_WHITESPACE = re.compile(r"\s")
+
+# Global inline flags, e.g. ``(?i)``, at the start of a pattern
+_GLOBAL_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+# Escaped backslashes, numbered backreferences and numbered conditionals
+_GROUP_REFS = re.compile(r"\\\\|\\[1-9]|\(\?\(\d")
+
+RuleSpec = Union[str, Dict[str, Any], Sequence[str]]
+
+
+def _alternative(name: str, pattern: str) -> str:
+    """Wrap a rule's pattern as a named branch of the combined expression.
+    
+    A leading global flag group such as ``(?i)`` is made scoped, so it only
+    applies to its own rule. Numbered backreferences are rejected because
+    group numbers shift once the rules are combined; use named groups.
+    
+    Args:
+        name: Group name of the branch
+        pattern: Rule pattern
+    
+    Returns:
+        The wrapped pattern
+    
+    Raises:
+        re.error: If the pattern is invalid or cannot be combined
+    """
+    flags = _GLOBAL_FLAGS.match(pattern)
+    if flags:
+        pattern = f"(?{flags.group(1)}:{pattern[flags.end():]})"
+    if any(ref.group() != "\\\\" for ref in _GROUP_REFS.finditer(pattern)):
+        raise re.error("numbered backreferences are not supported", pattern)
+    
+    alternative = f"(?P<{name}>{pattern})"
+    with warnings.catch_warnings():
+        # Before Python 3.11 misplaced global flags only warn, then apply
+        # to every rule
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            re.compile(alternative)
+        except DeprecationWarning as e:
+            raise re.error(str(e), pattern) from None
+    return alternative
+
+
+class ErrorSanitizer:
+    """Single-pass, precompiled redaction engine.
+    
+    All rules are combined into one alternation, compiled once, so a message
+    is scanned once regardless of how many rules exist. At each position the
+    earliest listed rule that matches wins. Input is cut down to a window
+    of twice ``max_length`` before scanning, growing it only if redaction
+    shrank the text below ``max_length``. Cuts are made at a whitespace
+    boundary (or far enough into a token that it is still redacted as a
+    whole), so large tracebacks are never scanned in full and a secret is
+    never split into an unredacted fragment.
+    """
+    
+    def __init__(
+        self,
+        rules: Iterable[Tuple[str, str]] = DEFAULT_RULES,
+        max_length: int = DEFAULT_MAX_LENGTH,
+    ) -> None:
+        """Initialize sanitizer.
+        
+        Args:
+            rules: (pattern, replacement) pairs in priority order
+            max_length: Maximum length of sanitized messages
+        
+        Raises:
+            re.error: If a pattern is not a valid regular expression
+        """
+        self.rules = tuple(rules)
+        self.max_length = max_length
+        self._replacements: Dict[str, str] = {}
+        
+        alternatives = []
+        for index, (pattern, replacement) in enumerate(self.rules):
+            name = f"_r{index}"
+            alternatives.append(_alternative(name, pattern))
+            self._replacements[name] = replacement
+        self._pattern: Optional["re.Pattern[str]"] = (
+            re.compile("|".join(alternatives)) if alternatives else None
+        )
+        self._window = max_length * _SCAN_FACTOR
+        replacements = self._replacements
+        self._repl: Callable[["re.Match[str]"], str] = lambda m: replacements[m.lastgroup]  # type: ignore[index]
+    
+    @classmethod
+    def from_config(
+        cls,
+        specs: Optional[Iterable[RuleSpec]],
+        max_length: int = DEFAULT_MAX_LENGTH,
+    ) -> "ErrorSanitizer":
+        """Build a sanitizer with user-defined rules ahead of the defaults.
+        
+        Each spec is either a pattern string (replaced with ``<redacted>``), a
+        ``{"pattern": ..., "replacement": ...}`` mapping or a
+        ``[pattern, replacement]`` pair. A leading flag group such as ``(?i)``
+        applies to its own rule only. Invalid specs, including patterns with
+        numbered backreferences, are logged and skipped.
+        
+        Args:
+            specs: User-defined rules, e.g. from
+                ``settings.telemetry_redact_patterns``
+            max_length: Maximum length of sanitized messages
+        """
+        if not specs and max_length == DEFAULT_MAX_LENGTH:
+            return DEFAULT_SANITIZER
+        
+        rules: List[Tuple[str, str]] = []
+        alternatives: List[str] = []
+        for spec in specs or ():
+            try:
+                if isinstance(spec, str):
+                    rule = (spec, "<redacted>")
+                elif isinstance(spec, dict):
+                    rule = (spec["pattern"], spec.get("replacement", "<redacted>"))
+                else:
+                    pattern, replacement = spec
+                    rule = (pattern, replacement)
+                alternative = _alternative(f"_r{len(rules)}", rule[0])
+                # Group names must also be unique across the combined rules
+                re.compile("|".join([*alternatives, alternative]))
+            except (KeyError, TypeError, ValueError, re.error) as e:
+                logger.warning("Ignoring invalid redaction rule", rule=str(spec), error=str(e))
+                continue
+            rules.append(rule)
+            alternatives.append(alternative)
+        
+        return cls(rules=[*rules, *DEFAULT_RULES], max_length=max_length)
+    
+    def sanitize(self, message: str) -> str:
+        """Redact sensitive data and truncate.
+        
+        Args:
+            message: Original message
+        
+        Returns:
+            Sanitized message of at most ``max_length`` characters
+        """
+        if len(message) <= self._window:
+            # Fast path: nothing to cut
+            if self._pattern is None:
+                return message[: self.max_length]
+            return self._pattern.sub(self._repl, message)[: self.max_length]
+        
+        window = self._window
+        while len(message) > window:
+            # Replacements may shrink the text, so grow the window until
+            # the sanitized prefix fills the output
+            sanitized = self._sub(self._cut(message, window))
+            if len(sanitized) >= self.max_length:
+                return sanitized[: self.max_length]
+            window *= _SCAN_FACTOR * 2
+        
+        return self._sub(message)[: self.max_length]
+    
+    def _sub(self, message: str) -> str:
+        """Apply all rules in a single pass."""
+        if self._pattern is None:
+            return message
+        return self._pattern.sub(self._repl, message)
+    
+    @staticmethod
+    def _cut(message: str, window: int) -> str:
+        """Cut a message at the first whitespace from ``window`` on."""
+        boundary = _WHITESPACE.search(message, window, window + _BOUNDARY_SEARCH)
+        return message[: boundary.start() if boundary else window + _BOUNDARY_SEARCH]
+
+
+DEFAULT_SANITIZER = ErrorSanitizer()
+
+
+def sanitize_error(message: str) -> str:
+    """Sanitize a message with the default rules.
+    
+    Args:
+        message: Original message
+    
+    Returns:
+        Sanitized message
+    """
+    return DEFAULT_SANITIZER.sanitize(message)
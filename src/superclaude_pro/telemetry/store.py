@@ -0,0 +1,231 @@
+"""Append-only JSONL event store for telemetry."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ..utils.files import atomic_write, file_lock
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+
+
+class EventStore:
+    """Segmented, append-only store of JSON events.
+    
+    Events are appended as single JSON lines with ``O_APPEND`` writes, so
+    concurrent processes never clobber each other and storing an event costs
+    one write instead of a read-modify-write of the whole history. When the
+    active segment grows past ``segment_bytes`` a new segment is started and
+    older segments are compacted down to the newest ``max_events`` events and
+    at most ``max_bytes`` bytes. The bounds are therefore enforced at rotation
+    time and may be exceeded by up to one segment in between.
+    """
+    
+    def __init__(
+        self,
+        directory: Path,
+        max_events: int = 1000,
+        max_bytes: int = 1024 * 1024,
+        segment_bytes: int = 64 * 1024,
+    ) -> None:
+        """Initialize event store.
+        
+        Args:
+            directory: Directory holding the segment files
+            max_events: Number of most recent events to retain
+            max_bytes: Maximum total size of retained segments
+            segment_bytes: Size at which the active segment is rotated
+        """
+        self.directory = Path(directory)
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.lock_path = self.directory / ".lock"
+        self._active: Optional[Path] = None
+    
+    def ensure_dir(self) -> None:
+        """Ensure the store directory exists."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+    
+    def segments(self) -> List[Path]:
+        """Get segment files, oldest first."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [
+            self.directory / name
+            for name in sorted(names)
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        ]
+    
+    def append(self, event: Dict[str, Any]) -> None:
+        """Append a single event.
+        
+        Args:
+            event: JSON-serializable event data
+        """
+        self.append_many([event])
+    
+    def append_many(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Append several events with a single write.
+        
+        Args:
+            events: JSON-serializable event data
+        """
+        payload = "".join(
+            json.dumps(event, separators=(",", ":")) + "\n" for event in events
+        ).encode("utf-8")
+        if not payload:
+            return
+        
+        if self._active is None:
+            self.ensure_dir()
+        # Shared with other appenders, exclusive against rotation, so no
+        # append can land in a segment that is being compacted
+        with file_lock(self.lock_path, shared=True):
+            path = self._active
+            if path is None or self._sealed(path):
+                path = self._current_segment()
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, payload)
+                size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+        
+        self._active = path
+        if size >= self.segment_bytes:
+            self._rotate(path)
+    
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Stream stored events, oldest first.
+        
+        Lines that cannot be decoded (e.g. torn by a crash mid-write) are
+        skipped.
+        """
+        for segment in self.segments():
+            try:
+                with open(segment, "rb") as f:
+                    for line in f:
+                        try:
+                            yield json.loads(line)
+                        except ValueError:
+                            continue
+            except FileNotFoundError:
+                # Removed by a concurrent compaction
+                continue
+    
+    def clear(self) -> None:
+        """Delete all stored events."""
+        for segment in self.segments():
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+        self._active = None
+    
+    def _current_segment(self) -> Path:
+        """Get the newest segment, creating the first one if needed."""
+        self.ensure_dir()
+        segments = self.segments()
+        if segments:
+            return segments[-1]
+        return self._segment_path(1)
+    
+    def _sealed(self, path: Path) -> bool:
+        """Check whether another process has rotated past a segment."""
+        return self._segment_path(self._segment_number(path) + 1).exists()
+    
+    def _segment_path(self, number: int) -> Path:
+        """Get the path of a numbered segment."""
+        return self.directory / f"{SEGMENT_PREFIX}{number:08d}{SEGMENT_SUFFIX}"
+    
+    @staticmethod
+    def _segment_number(path: Path) -> int:
+        """Get the sequence number of a segment path."""
+        return int(path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+    
+    def _rotate(self, full: Path) -> None:
+        """Start a new segment after ``full`` and compact the older ones."""
+        try:
+            with file_lock(self.lock_path):
+                segments = self.segments()
+                if segments and segments[-1] != full:
+                    # Another process already rotated past this segment
+                    self._active = segments[-1]
+                    return
+                
+                path = self._segment_path(self._segment_number(full) + 1)
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o644)
+                os.close(fd)
+                self._active = path
+                self._compact(segments)
+        except OSError as e:
+            logger.debug("Failed to rotate telemetry segment", error=str(e))
+    
+    def _compact(self, sealed: List[Path]) -> None:
+        """Drop events beyond the retention bounds from sealed segments.
+        
+        Args:
+            sealed: Segments no longer being appended to, oldest first
+        """
+        kept_events = 0
+        kept_bytes = 0
+        
+        for index in range(len(sealed) - 1, -1, -1):
+            segment = sealed[index]
+            lines = self._read_lines(segment)
+            size = sum(len(line) for line in lines)
+            
+            if (
+                kept_events + len(lines) <= self.max_events
+                and kept_bytes + size <= self.max_bytes
+            ):
+                kept_events += len(lines)
+                kept_bytes += size
+                continue
+            
+            # Trim the boundary segment to its newest lines, drop the rest
+            keep = self._newest_within(
+                lines,
+                self.max_events - kept_events,
+                self.max_bytes - kept_bytes,
+            )
+            if keep:
+                atomic_write(segment, b"".join(keep))
+            else:
+                segment.unlink()
+            for older in sealed[:index]:
+                older.unlink()
+            logger.debug(
+                "Compacted telemetry store",
+                removed_segments=index + (0 if keep else 1),
+            )
+            return
+    
+    @staticmethod
+    def _read_lines(segment: Path) -> List[bytes]:
+        """Read complete lines of a segment."""
+        with open(segment, "rb") as f:
+            return [line for line in f if line.endswith(b"\n")]
+    
+    @staticmethod
+    def _newest_within(
+        lines: List[bytes], max_events: int, max_bytes: int
+    ) -> List[bytes]:
+        """Select the newest lines fitting both bounds."""
+        size = 0
+        start = len(lines)
+        while start > 0 and len(lines) - start < max_events:
+            line_size = len(lines[start - 1])
+            if size + line_size > max_bytes:
+                break
+            size += line_size
+            start -= 1
+        return lines[start:]
@@ -1,5 +1,32 @@
-"""Utility modules for SuperClaude Pro."""
+"""Utility modules for SuperClaude Pro.
 
-from .logger import setup_logging, get_logger
+Helpers are imported from their modules on first access, so importing one
+of them (the CLI only needs the logger) does not load all the others.
+"""
 
-__all__ = ["setup_logging", "get_logger"]
\ No newline at end of file
+from importlib import import_module
+from typing import Any
+
+# Names resolved on first access: name -> module
+_LAZY_IMPORTS = {
+    "setup_logging": "logger",
+    "get_logger": "logger",
+    "atomic_write": "files",
+    "file_lock": "files",
+    "byte_progress": "progress",
+    "get_http_client": "http",
+    "close_http_client": "http",
+    "MarkdownIndex": "mdindex",
+    "parse_frontmatter": "mdindex",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import helpers on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(f"{__name__}.{_LAZY_IMPORTS[name]}"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
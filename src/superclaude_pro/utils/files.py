@@ -0,0 +1,115 @@
+"""Crash-safe file helpers for SuperClaude Pro."""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+def _current_umask() -> int:
+    """Read the process umask (it can only be read by setting it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once: os.umask() briefly changes process state, so not per write
+_UMASK = _current_umask()
+
+
+def atomic_write(path: Path, data: Union[str, bytes], durable: bool = True) -> None:
+    """Atomically replace a file's contents.
+    
+    The data is written to a temporary file in the same directory, flushed
+    to disk and renamed over the target, so readers only ever see the old
+    or the new contents, never a truncated file. The new file keeps the
+    permissions of the one it replaces; new files get the usual
+    ``0o666 & ~umask`` rather than the private mode of a temporary file.
+    
+    Args:
+        path: File to write
+        data: New contents
+        durable: Also fsync the data and directory so the new contents
+            survive a power loss; the swap itself is atomic either way
+    """
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except OSError:
+        mode = 0o666 & ~_UMASK
+    
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    
+    if durable:
+        _fsync_dir(path.parent)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename by syncing its directory (no-op where unsupported)."""
+    if fcntl is None:  # pragma: no cover - Windows
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def file_lock(path: Path, shared: bool = False) -> Iterator[None]:
+    """Hold an advisory lock on a lock file.
+    
+    Blocks until the lock is available. The lock file is created if needed
+    and left in place afterwards.
+    
+    Args:
+        path: Lock file path
+        shared: Take a shared lock, held alongside other shared locks but
+            never alongside an exclusive one. Exclusive on Windows.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
@@ -0,0 +1,46 @@
+"""Shared HTTP client."""
+
+import atexit
+import threading
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+# Seconds to wait for a server; network calls must never stall the CLI long
+DEFAULT_TIMEOUT = 5.0
+
+_client: Optional["httpx.Client"] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> "httpx.Client":
+    """Get the process-wide HTTP client, creating it on first use.
+    
+    Reusing one client keeps connections (and TLS sessions) pooled across
+    requests. httpx is only imported here, so commands that never touch the
+    network do not pay for it. The client is closed at interpreter exit.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            import httpx
+            
+            from .. import __version__
+            
+            _client = httpx.Client(
+                timeout=DEFAULT_TIMEOUT,
+                follow_redirects=True,
+                headers={"User-Agent": f"superclaude-pro/{__version__}"},
+            )
+            atexit.register(close_http_client)
+        return _client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -1,17 +1,69 @@
-"""Enhanced logging system for SuperClaude Pro."""
+"""Enhanced logging system for SuperClaude Pro.
 
+structlog and Rich are imported on first real use rather than at import
+time, so modules that only hold a logger stay cheap to import (the CLI's
+fast paths depend on this).
+"""
+
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import structlog
+    from rich.console import Console
+
+# Global console instance, created by setup_logging() unless set beforehand
+console: Optional["Console"] = None
+
+# Listener draining the log queue when logging runs in background mode
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Handlers installed by the last setup_logging(), on the root logger or the
+# listener
+_handlers: List[logging.Handler] = []
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for an in-process listener.
+    
+    The stock ``prepare()`` formats the record and strips ``exc_info`` so it
+    can be pickled; records here never leave the process, so only the message
+    arguments are merged and everything else (including tracebacks for Rich)
+    is left for the handlers on the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message arguments so the record is safe to hand off."""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def shutdown_logging() -> None:
+    """Stop the background log listener, writing out queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
-import structlog
-from rich.console import Console
-from rich.logging import RichHandler
 
-# Global console instance
-console = Console(stderr=True)
+atexit.register(shutdown_logging)
+
+
+def _remove_handlers() -> None:
+    """Stop the listener and close the handlers of a previous setup."""
+    shutdown_logging()
+    root = logging.getLogger()
+    for handler in _handlers:
+        root.removeHandler(handler)
+        handler.close()
+    _handlers.clear()
 
 
 def setup_logging(
@@ -19,6 +71,7 @@ def setup_logging(
     log_file: Optional[Path] = None,
     json_logs: bool = False,
     correlation_id: Optional[str] = None,
+    background: bool = False,
 ) -> None:
     """Configure structured logging for SuperClaude Pro.
     
@@ -27,7 +80,13 @@ def setup_logging(
         log_file: Optional log file path
         json_logs: Output logs in JSON format
         correlation_id: Optional correlation ID for request tracking
+        background: Hand records to a queue and let a listener thread do
+            the Rich rendering and file I/O; queued records are written out
+            at exit or by ``shutdown_logging()``
     """
+    global _listener, console
+    import structlog
+    
     # Determine log level
     level = logging.DEBUG if debug else logging.INFO
     
@@ -65,6 +124,11 @@ def setup_logging(
         handler = logging.StreamHandler(sys.stderr)
         handler.setFormatter(logging.Formatter("%(message)s"))
     else:
+        from rich.console import Console
+        from rich.logging import RichHandler
+        
+        if console is None:
+            console = Console(stderr=True)
         processors.append(structlog.dev.ConsoleRenderer())
         handler = RichHandler(
             console=console,
@@ -73,12 +137,7 @@ def setup_logging(
             markup=True,
         )
     
-    # Configure Python's logging
-    logging.basicConfig(
-        level=level,
-        handlers=[handler],
-        force=True,
-    )
+    handlers: List[logging.Handler] = [handler]
     
     # Add file handler if specified
     if log_file:
@@ -92,7 +151,27 @@ def setup_logging(
                     "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
                 )
             )
-        logging.getLogger().addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Close what a previous setup installed, including listener handlers
+    _remove_handlers()
+    _handlers.extend(handlers)
+    
+    if background:
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+        handlers = [_LocalQueueHandler(log_queue)]
+        _handlers.extend(handlers)
+    
+    # Configure Python's logging
+    logging.basicConfig(
+        level=level,
+        handlers=handlers,
+        force=True,
+    )
     
     # Configure structlog
     structlog.configure(
@@ -110,10 +189,64 @@ def setup_logging(
         level=logging.getLevelName(level),
         json_logs=json_logs,
         log_file=str(log_file) if log_file else None,
+        background=background,
     )
 
 
-def get_logger(name: Optional[str] = None, **kwargs: Any) -> structlog.BoundLogger:
+class _DeferredLogger:
+    """Logger proxy that imports structlog on first use.
+    
+    Debug calls made while structlog is not configured yet are dropped
+    without importing it, so library code can log freely on hot, quiet
+    paths. Other calls made before ``setup_logging()`` go to stderr:
+    unconfigured structlog prints to stdout, where commands write their
+    (possibly machine-readable) output. Once configured, every call goes
+    to the real structlog logger.
+    """
+    
+    def __init__(self, name: Optional[str], context: Dict[str, Any]) -> None:
+        """Initialize proxy.
+        
+        Args:
+            name: Logger name
+            context: Context to bind once resolved
+        """
+        self._name = name
+        self._context = context
+        self._logger: Optional[Any] = None
+    
+    def _resolve(self) -> Any:
+        """Get the underlying structlog logger."""
+        if self._logger is None:
+            import structlog
+            
+            logger = structlog.get_logger(self._name)
+            if self._context:
+                logger = logger.bind(**self._context)
+            self._logger = logger
+        return self._logger
+    
+    def debug(self, *args: Any, **kwargs: Any) -> Any:
+        """Log at debug level if logging has been configured."""
+        structlog = sys.modules.get("structlog")
+        if structlog is None or not structlog.is_configured():
+            return None
+        return self._resolve().debug(*args, **kwargs)
+    
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the structlog logger."""
+        import structlog
+        
+        if not structlog.is_configured():
+            # Not cached: sys.stderr may be replaced, and logging set up later
+            logger = structlog.wrap_logger(structlog.PrintLogger(sys.stderr))
+            if self._context:
+                logger = logger.bind(**self._context)
+            return getattr(logger, name)
+        return getattr(self._resolve(), name)
+
+
+def get_logger(name: Optional[str] = None, **kwargs: Any) -> "structlog.BoundLogger":
     """Get a logger instance with optional context.
     
     Args:
@@ -123,18 +256,13 @@ def get_logger(name: Optional[str] = None, **kwargs: Any) -> structlog.BoundLogg
     Returns:
         Configured logger instance
     """
-    logger = structlog.get_logger(name)
-    
-    if kwargs:
-        logger = logger.bind(**kwargs)
-    
-    return logger
+    return _DeferredLogger(name, kwargs)  # type: ignore[return-value]
 
 
 class LogContext:
     """Context manager for temporary log context."""
     
-    def __init__(self, logger: structlog.BoundLogger, **kwargs: Any) -> None:
+    def __init__(self, logger: "structlog.BoundLogger", **kwargs: Any) -> None:
         """Initialize log context.
         
         Args:
@@ -145,14 +273,18 @@ class LogContext:
         self.context = kwargs
         self.token: Optional[Any] = None
     
-    def __enter__(self) -> structlog.BoundLogger:
+    def __enter__(self) -> "structlog.BoundLogger":
         """Enter context and bind values."""
+        import structlog
+        
         self.token = structlog.contextvars.bind_contextvars(**self.context)
         return self.logger
     
     def __exit__(self, *args: Any) -> None:
         """Exit context and unbind values."""
         if self.token:
+            import structlog
+            
             structlog.contextvars.unbind_contextvars(self.token)
 
 
@@ -186,7 +318,7 @@ def log_duration(func):
     return wrapper
 
 
-def log_errors(logger: Optional[structlog.BoundLogger] = None):
+def log_errors(logger: Optional["structlog.BoundLogger"] = None):
     """Decorator to log exceptions."""
     def decorator(func):
         def wrapper(*args, **kwargs):
@@ -0,0 +1,234 @@
+"""Cached frontmatter index of a directory of markdown files.
+
+Commands and personas are markdown files whose YAML-style frontmatter
+describes them. Parsing every file on each lookup is wasteful, so the
+parsed frontmatter is kept in a JSON index next to the directory:
+    
+    index = MarkdownIndex(config.get_component_path("commands"))
+    for path, doc in index.documents().items():
+        print(path, doc["meta"].get("description"))
+
+Loading the index only stats the directories: adding, removing or
+atomically replacing a file changes its directory's mtime, which triggers
+a rescan. A rescan re-reads only files whose size or mtime changed, and
+re-parses only those whose content hash changed. In-place edits that keep
+the directory mtime are picked up by ``refresh(verify=True)``.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .files import atomic_write
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_VERSION = 1
+
+Document = Dict[str, Any]
+
+
+def parse_frontmatter(text: str) -> Tuple[Dict[str, Any], str]:
+    """Split a markdown document into frontmatter and body.
+    
+    Supports the subset of YAML used by command and persona files:
+    ``key: value`` pairs, inline lists (``[a, b]``) and ``- item`` lists.
+    
+    Args:
+        text: Document contents
+    
+    Returns:
+        (metadata, body); metadata is empty without a frontmatter block
+    """
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}, text
+    try:
+        end = next(i for i in range(1, len(lines)) if lines[i].strip() == "---")
+    except StopIteration:
+        return {}, text
+    
+    meta: Dict[str, Any] = {}
+    key: Optional[str] = None
+    for line in lines[1:end]:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if stripped.startswith("- ") and isinstance(meta.get(key), list):
+            meta[key].append(_scalar(stripped[2:]))
+        elif ":" in line:
+            key, _, value = line.partition(":")
+            key = key.strip()
+            meta[key] = _scalar(value) if value.strip() else []
+    return meta, "\n".join(lines[end + 1:])
+
+
+def _scalar(value: str) -> Any:
+    """Parse a frontmatter value: quoted or plain string, or inline list."""
+    value = value.strip()
+    if value.startswith("[") and value.endswith("]"):
+        return [_scalar(item) for item in value[1:-1].split(",") if item.strip()]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _summary(body: str) -> str:
+    """Get the first non-empty line of a body, without heading markers."""
+    for line in body.splitlines():
+        line = line.strip().lstrip("#").strip()
+        if line:
+            return line
+    return ""
+
+
+class MarkdownIndex:
+    """Parsed frontmatter of every ``*.md`` file under a directory."""
+    
+    def __init__(self, directory: Path, index_path: Optional[Path] = None) -> None:
+        """Initialize index.
+        
+        Args:
+            directory: Directory to index; may be a symlink
+            index_path: Index file, ``.<name>.index.json`` beside the
+                directory by default (never inside it, so an installed
+                generation stays untouched)
+        """
+        self.directory = Path(directory)
+        self.index_path = Path(
+            index_path
+            if index_path is not None
+            else self.directory.parent / f".{self.directory.name}.index.json"
+        )
+        self._documents: Optional[Dict[str, Document]] = None
+        # Files parsed by the last scan, for diagnostics
+        self.parsed = 0
+    
+    def documents(self) -> Dict[str, Document]:
+        """Get ``{"meta", "summary", ...}`` for each file, by relative path.
+        
+        The result is cached in memory; call ``refresh()`` to pick up
+        changes made since.
+        """
+        if self._documents is None:
+            self.refresh()
+        return self._documents  # type: ignore[return-value]
+    
+    def refresh(self, verify: bool = False) -> bool:
+        """Reload the index, rescanning the directory if it changed.
+        
+        Args:
+            verify: Also stat every file, catching in-place edits
+        
+        Returns:
+            Whether the directory was rescanned
+        """
+        stored = self._read_index()
+        root = os.path.realpath(self.directory)
+        if (
+            stored is not None
+            and stored["root"] == root
+            and not verify
+            and self._dirs_unchanged(root, stored["dirs"])
+        ):
+            self._documents = stored["files"]
+            return False
+        
+        if not os.path.isdir(root):
+            self._documents = {}
+            return True
+        
+        old = stored["files"] if stored is not None else {}
+        dirs: Dict[str, int] = {}
+        files: Dict[str, Document] = {}
+        self.parsed = 0
+        self._scan(root, "", old, dirs, files)
+        if stored is None or stored["files"] != files or stored["dirs"] != dirs:
+            self._write_index({"root": root, "dirs": dirs, "files": files})
+        self._documents = files
+        return True
+    
+    def _scan(
+        self,
+        path: str,
+        rel: str,
+        old: Dict[str, Document],
+        dirs: Dict[str, int],
+        files: Dict[str, Document],
+    ) -> None:
+        """Index one directory and its subdirectories."""
+        # Stat before listing, so a change during the scan is seen next time
+        dirs[rel] = os.stat(path).st_mtime_ns
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        for entry in entries:
+            entry_rel = f"{rel}/{entry.name}" if rel else entry.name
+            if entry.is_dir():
+                self._scan(entry.path, entry_rel, old, dirs, files)
+            elif entry.name.endswith(".md") and entry.is_file():
+                files[entry_rel] = self._document(entry.path, old.get(entry_rel))
+    
+    def _document(self, path: str, previous: Optional[Document]) -> Document:
+        """Get a file's entry, reusing the previous one if still valid."""
+        st = os.stat(path)
+        if (
+            previous is not None
+            and previous["size"] == st.st_size
+            and previous["mtime_ns"] == st.st_mtime_ns
+        ):
+            return previous
+        
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        stat = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+        if previous is not None and previous["sha256"] == digest:
+            return dict(previous, **stat)
+        
+        self.parsed += 1
+        meta, body = parse_frontmatter(raw.decode("utf-8", errors="replace"))
+        return dict(stat, meta=meta, summary=_summary(body))
+    
+    @staticmethod
+    def _dirs_unchanged(root: str, dirs: Dict[str, int]) -> bool:
+        """Whether every indexed directory still has its recorded mtime."""
+        for rel, mtime_ns in dirs.items():
+            try:
+                if os.stat(os.path.join(root, rel)).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return bool(dirs)
+    
+    def _read_index(self) -> Optional[Dict[str, Any]]:
+        """Read the index file, None if missing, stale or unreadable."""
+        try:
+            with open(self.index_path, "rb") as f:
+                data = json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable index", path=str(self.index_path), error=str(e)
+            )
+            return None
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        return data
+    
+    def _write_index(self, data: Dict[str, Any]) -> None:
+        """Write the index file; failures only cost a rescan next time."""
+        try:
+            atomic_write(
+                self.index_path,
+                json.dumps(dict(data, version=INDEX_VERSION), separators=(",", ":")),
+                durable=False,
+            )
+        except OSError as e:
+            logger.warning(
+                "Failed to write index", path=str(self.index_path), error=str(e)
+            )
+
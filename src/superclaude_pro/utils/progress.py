@@ -0,0 +1,39 @@
+"""Progress display for long-running file operations."""
+
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+
+@contextmanager
+def byte_progress(total: int, description: str) -> Iterator[Callable[[int], None]]:
+    """Show a transfer progress bar fed with byte counts.
+    
+    Args:
+        total: Total number of bytes expected
+        description: Label shown next to the bar
+    
+    Yields:
+        Thread-safe callback advancing the bar by a number of bytes
+    """
+    from rich.progress import (
+        BarColumn,
+        DownloadColumn,
+        Progress,
+        TextColumn,
+        TimeRemainingColumn,
+        TransferSpeedColumn,
+    )
+    
+    from . import logger
+    
+    with Progress(
+        TextColumn("{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        TimeRemainingColumn(),
+        console=logger.console,
+        transient=True,
+    ) as progress:
+        task = progress.add_task(description, total=total)
+        yield lambda n: progress.advance(task, n)
@@ -59,10 +59,16 @@ def isolate_tests(monkeypatch, temp_dir: Path):
     
     # Ensure we don't accidentally modify real files
     real_home = Path.home()
+    original_mkdir = Path.mkdir
     
     def safe_mkdir(self, *args, **kwargs):
         if str(self).startswith(str(real_home)) and str(temp_dir) not in str(self):
             raise RuntimeError(f"Test tried to create directory in real home: {self}")
-        return Path.mkdir(self, *args, **kwargs)
+        return original_mkdir(self, *args, **kwargs)
     
-    monkeypatch.setattr(Path, "mkdir", safe_mkdir)
\ No newline at end of file
+    monkeypatch.setattr(Path, "mkdir", safe_mkdir)
+    
+    yield
+    
+    # Don't leak shared configs between tests
+    Config.clear_shared()
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""Stand-in MCP server for tests and benchmarks.
+
+Speaks newline-delimited JSON-RPC on stdin/stdout, or with ``--http`` the
+streamable HTTP transport on a free local port (printed on the first line
+of stdout). Run ``python tests/mcp_stub.py --help`` for the options.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+TOOLS = [
+    {"name": "echo", "description": "Return the arguments", "inputSchema": {}},
+    {"name": "add", "description": "Add a and b", "inputSchema": {}},
+]
+
+
+def handle(
+    args: argparse.Namespace, message: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Answer one JSON-RPC message; None for notifications."""
+    method = message.get("method")
+    if args.log:
+        with open(args.log, "a") as f:
+            f.write(f"{os.getpid()} {method}\n")
+    if "id" not in message:
+        return None
+    if method == "initialize":
+        time.sleep(args.delay)
+        result: Any = {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {"tools": {}},
+            "serverInfo": {"name": "stub", "version": args.version},
+        }
+    elif method == "tools/list":
+        result = {"tools": TOOLS}
+    elif method == "ping":
+        result = {}
+    elif method == "tools/call":
+        params = message.get("params", {})
+        arguments = params.get("arguments", {})
+        if params.get("name") == "add":
+            text = str(arguments.get("a", 0) + arguments.get("b", 0))
+        else:
+            text = json.dumps(arguments, sort_keys=True)
+        result = {"content": [{"type": "text", "text": text}]}
+    else:
+        return {
+            "jsonrpc": "2.0",
+            "id": message["id"],
+            "error": {"code": -32601, "message": f"Method not found: {method}"},
+        }
+    return {"jsonrpc": "2.0", "id": message["id"], "result": result}
+
+
+def serve_stdio(args: argparse.Namespace) -> None:
+    """Answer messages from stdin until it closes."""
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        response = handle(args, json.loads(line))
+        if response is not None:
+            sys.stdout.write(json.dumps(response) + "\n")
+            sys.stdout.flush()
+
+
+def serve_http(args: argparse.Namespace) -> None:
+    """Answer POSTed messages, replying as an event stream."""
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", 0))
+            response = handle(args, json.loads(self.rfile.read(length)))
+            if response is None:
+                self.send_response(202)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = f"event: message\ndata: {json.dumps(response)}\n\n".encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Mcp-Session-Id", "stub-session")
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args: Any) -> None:
+            pass
+    
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    print(httpd.server_port, flush=True)
+    httpd.serve_forever()
+
+
+def main() -> None:
+    """Parse options and serve."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--delay", type=float, default=0.0, help="Seconds to initialize"
+    )
+    parser.add_argument("--version", default="1.0.0", help="Reported server version")
+    parser.add_argument("--hang", action="store_true", help="Never answer anything")
+    parser.add_argument("--log", help="Append '<pid> <method>' per message to a file")
+    parser.add_argument("--http", action="store_true", help="Serve over HTTP")
+    args = parser.parse_args()
+    if args.hang:
+        time.sleep(3600)
+    elif args.http:
+        serve_http(args)
+    else:
+        serve_stdio(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Micro-benchmark: validated config loading vs plain ``json.load``.
+
+Run with ``python tests/perf/bench_config_load.py``.
+"""
+
+import json
+import tempfile
+import timeit
+from pathlib import Path
+
+from superclaude_pro.core.config import Config
+from superclaude_pro.core.schema import ConfigModel
+
+
+def config_data(extra_keys: int) -> dict:
+    """Get a realistic config with some unknown keys."""
+    data = Config(claude_dir=Path(tempfile.gettempdir())).get_defaults()
+    data["settings"]["telemetry_sampling"] = {"command_executed": 0.5, "*": 1.0}
+    data["extra"] = {f"key{n}": {"enabled": True, "value": n} for n in range(extra_keys)}
+    return data
+
+
+def bench(func, number: int) -> float:
+    """Get microseconds per call."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    """Print per-load timings for each approach."""
+    print(f"{'keys':>6}{'json.load':>12}{'+validate':>12}{'from bytes':>12}{'model()':>10}  µs")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "superclaude.json"
+        for extra_keys in (0, 100, 1000):
+            path.write_text(json.dumps(config_data(extra_keys), indent=2))
+            number = 2000 if extra_keys < 1000 else 200
+
+            def plain() -> None:
+                with open(path, "r") as f:
+                    json.load(f)
+
+            def two_pass() -> None:
+                with open(path, "r") as f:
+                    ConfigModel.model_validate(json.load(f)).model_dump(exclude_unset=True)
+
+            def one_pass() -> None:
+                with open(path, "rb") as f:
+                    ConfigModel.model_validate_json(f.read()).model_dump(exclude_unset=True)
+
+            # Validated once, then every read is a cached lookup
+            config = Config(claude_dir=Path(tmp))
+            config.model()
+
+            print(
+                f"{extra_keys:>6}{bench(plain, number):>12.1f}{bench(two_pass, number):>12.1f}"
+                f"{bench(one_pass, number):>12.1f}{bench(config.model, number):>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
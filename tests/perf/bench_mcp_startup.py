@@ -0,0 +1,71 @@
+"""Benchmark: MCP server startup, one at a time vs concurrently.
+
+Run with ``python tests/perf/bench_mcp_startup.py [--servers N] [--delay S]``.
+Each stand-in server takes ``--delay`` seconds to initialize, like an npx
+server resolving its package. Also times a second probe, which pings the
+running servers, and a cold start served from the handshake cache.
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from superclaude_pro.mcp import MCPManager, ServerSpec
+
+STUB = str(Path(__file__).resolve().parents[1] / "mcp_stub.py")
+
+
+async def sequential(specs: List[ServerSpec], cache: Path) -> float:
+    """Start and initialize the servers one after another."""
+    start = time.perf_counter()
+    async with MCPManager(specs, cache_path=cache) as manager:
+        for spec in specs:
+            assert (await manager.probe(spec.name)).healthy
+    return time.perf_counter() - start
+
+
+async def concurrent(specs: List[ServerSpec], cache: Path) -> List[float]:
+    """Probe all servers at once, then again over the open connections."""
+    timings = []
+    async with MCPManager(specs, cache_path=cache) as manager:
+        for _ in range(2):
+            start = time.perf_counter()
+            assert all(status.healthy for status in await manager.probe_all())
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--servers", type=int, default=6)
+    parser.add_argument("--delay", type=float, default=0.3)
+    args = parser.parse_args()
+    specs = [
+        ServerSpec(f"s{i}", command=(sys.executable, STUB, "--delay", str(args.delay)))
+        for i in range(args.servers)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The sequential run fills this cache for the cached run
+        cache = Path(tmp) / "cache.json"
+        seq = asyncio.run(sequential(specs, cache))
+        conc, reprobe = asyncio.run(concurrent(specs, Path(tmp) / "empty.json"))
+        cached, _ = asyncio.run(concurrent(specs, cache))
+
+    print(f"servers: {args.servers}  initialize delay: {args.delay * 1e3:.0f} ms")
+    for name, seconds in (
+        ("sequential", seq),
+        ("concurrent", conc),
+        ("cached", cached),
+        ("reprobe", reprobe),
+    ):
+        print(f"{name:<12}{seconds * 1e3:>10.1f} ms{seq / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark: orchestrator scheduling against the critical-path bound.
+
+Run with ``python tests/perf/bench_orchestrator.py [--tasks N] [--workers W]``.
+Builds a random layered DAG of sleep tasks (I/O-like) and hashing tasks
+(CPU work that releases the GIL), runs it serially and with the thread and
+asyncio drivers, and compares wall time with the lower bound: the longer of
+the critical path and the total work spread over the workers, using each
+run's measured task durations. ``ideal`` is the best this machine allows
+for the uncontended durations of the serial run: the critical path, the
+total work over the workers, or the hashing work over the CPU cores.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+from superclaude_pro.orchestrator import RunReport, Scheduler, critical_path
+
+BLOCK = b"\0" * (1 << 20)
+
+
+def sleep_task(seconds: float) -> Callable[[], None]:
+    """Task that waits, like a network call."""
+    return lambda: time.sleep(seconds)
+
+
+def cpu_task(megabytes: int) -> Callable[[], str]:
+    """Task that hashes data; hashlib releases the GIL on large buffers."""
+
+    def run() -> str:
+        digest = hashlib.sha256()
+        for _ in range(megabytes):
+            digest.update(BLOCK)
+        return digest.hexdigest()
+
+    return run
+
+
+# (name, function, dependencies, priority, is CPU-bound)
+Graph = List[Tuple[str, Callable[[], object], List[str], int, bool]]
+
+
+def build_graph(size: int, seed: int = 7) -> Graph:
+    """Generate layers of tasks, each depending on up to 3 earlier tasks."""
+    rng = random.Random(seed)
+    tasks: Graph = []
+    for i in range(size):
+        name = f"t{i:03d}"
+        cpu = rng.random() < 0.5
+        if cpu:
+            func: Callable[[], object] = cpu_task(rng.randint(2, 12))
+        else:
+            func = sleep_task(rng.uniform(0.005, 0.03))
+        earlier = [t[0] for t in tasks[max(0, i - 12):]]
+        deps = rng.sample(earlier, k=min(len(earlier), rng.randint(0, 3)))
+        tasks.append((name, func, deps, rng.randint(0, 2), cpu))
+    return tasks
+
+
+def scheduler_for(graph: Graph, workers: int) -> Scheduler:
+    """Create a scheduler for a generated graph."""
+    scheduler = Scheduler(max_workers=workers)
+    for name, func, deps, priority, _ in graph:
+        scheduler.add(name, func, deps=deps, priority=priority)
+    return scheduler
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=120)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+    graph = build_graph(args.tasks)
+
+    reports: Dict[str, RunReport] = {
+        "serial": scheduler_for(graph, 1).run(),
+        "threads": scheduler_for(graph, args.workers).run(),
+        "asyncio": asyncio.run(scheduler_for(graph, args.workers).run_async()),
+    }
+
+    serial = reports["serial"]
+    durations = {name: t.duration_ms or 0.0 for name, t in serial.tasks.items()}
+    path_ms, path = critical_path(serial.deps, durations)
+    cpu_ms = sum(durations[name] for name, *_, cpu in graph if cpu)
+    cores = min(args.workers, os.cpu_count() or 1)
+    ideal = max(path_ms, serial.busy_ms() / args.workers, cpu_ms / cores)
+    print(f"tasks: {args.tasks}  workers: {args.workers}  cores: {os.cpu_count()}")
+    print(f"{'run':<10}{'wall ms':>10}{'bound ms':>10}{'vs bound':>10}{'speedup':>9}")
+    for name, report in reports.items():
+        bound = report.lower_bound_ms()
+        print(
+            f"{name:<10}{report.wall_ms:>10.1f}{bound:>10.1f}"
+            f"{report.wall_ms / bound:>9.2f}x{serial.wall_ms / report.wall_ms:>8.1f}x"
+        )
+    print(
+        f"critical path: {len(path)} tasks, {path_ms:.1f} ms  "
+        f"hashing: {cpu_ms:.1f} ms  ideal: {ideal:.1f} ms"
+    )
+    for name in ("threads", "asyncio"):
+        print(f"{name} wall / ideal: {reports[name].wall_ms / ideal:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark: persona activation over a synthetic corpus of 100k prompts.
+
+Run with ``python tests/perf/bench_personas.py [--size N]``. Compares the
+inverted index against scoring every persona's every rule per prompt.
+"""
+
+import argparse
+import fnmatch
+import random
+import re
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from superclaude_pro.personas import BUILTIN_PERSONAS, PersonaMatcher
+
+FILLER = (
+    "the a please can you this that with for and code file function module "
+    "project change update make add fix new old value data user list thing"
+).split()
+FILES = ["src/App.tsx", "api/users.py", "Dockerfile", "tests/test_api.py", "README.md"]
+
+
+def corpus(size: int, seed: int = 42) -> List[Tuple[str, Sequence[str]]]:
+    """Generate prompts mixing filler words with persona keywords."""
+    rng = random.Random(seed)
+    keywords = [k for persona in BUILTIN_PERSONAS for k in persona.keywords]
+    prompts = []
+    for _ in range(size):
+        words = rng.choices(FILLER, k=rng.randint(5, 30))
+        words += rng.choices(keywords, k=rng.randint(0, 4))
+        rng.shuffle(words)
+        files = rng.sample(FILES, k=rng.randint(0, 2))
+        prompts.append((" ".join(words), files))
+    return prompts
+
+
+def naive_activate(text: str, files: Sequence[str], threshold: float = 2.0) -> List[str]:
+    """Score every persona by checking each of its rules against the prompt."""
+    lower = text.lower()
+    scores: Dict[str, float] = {}
+    for persona in BUILTIN_PERSONAS:
+        score = sum(
+            weight
+            for keyword, weight in persona.keywords.items()
+            if re.search(rf"\b{re.escape(keyword)}\b", lower)
+        )
+        if any(
+            fnmatch.fnmatch(file.rsplit("/", 1)[-1], pattern) or fnmatch.fnmatch(file, pattern)
+            for file in files
+            for pattern in persona.file_patterns
+        ):
+            score += 2.0
+        if score >= threshold:
+            scores[persona.name] = score
+    return sorted(scores, key=lambda name: (-scores[name], name))
+
+
+def main() -> None:
+    """Print throughput of the index, batch scoring and the naive matcher."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    prompts = corpus(args.size)
+    start = time.perf_counter()
+    matcher = PersonaMatcher(BUILTIN_PERSONAS)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [matcher.activate(text, files) for text, files in prompts]
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = matcher.activate_many(prompts)
+    batched = time.perf_counter() - start
+    assert batch == single
+
+    sample = prompts[: max(1, args.size // 10)]
+    start = time.perf_counter()
+    for text, files in sample:
+        naive_activate(text, files)
+    naive = (time.perf_counter() - start) * len(prompts) / len(sample)
+
+    print(f"prompts: {len(prompts):,}  index build: {build * 1e3:.2f} ms")
+    for name, seconds in (("indexed", indexed), ("batch", batched), ("naive*", naive)):
+        print(
+            f"{name:<10}{seconds:>10.2f} s{len(prompts) / seconds:>14,.0f} prompts/s"
+            f"{naive / seconds:>9.1f}x"
+        )
+    print("* naive timed on a 10% sample and extrapolated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Micro-benchmark: telemetry error sanitizer vs the original two-pass version.
+
+Run with ``python tests/perf/bench_sanitizer.py``.
+"""
+
+import re
+import timeit
+
+from superclaude_pro.telemetry.sanitizer import ErrorSanitizer, sanitize_error
+
+
+def legacy_sanitize(error_message: str) -> str:
+    """Original implementation: import, two full passes, then truncate."""
+    import re
+    sanitized = re.sub(r'[\/]\S+[\/]\S+', '<path>', error_message)
+    sanitized = re.sub(r'[a-zA-Z0-9]{20,}', '<redacted>', sanitized)
+    return sanitized[:500]
+
+
+SAMPLES = {
+    "short": "FileNotFoundError: /home/user/.claude/superclaude.json not found",
+    "secret": "Auth failed for token abcdefghijklmnopqrstuvwxyz0123456789 at /srv/app/api.py",
+    "traceback": "\n".join(
+        f'  File "/usr/lib/python3.11/site-packages/pkg/module{n}.py", line {n}, in func{n}'
+        for n in range(2000)
+    ),
+}
+
+CUSTOM = ErrorSanitizer.from_config([r"sk-[A-Za-z0-9]{32}", r"ghp_[A-Za-z0-9]{36}"])
+
+
+def bench(func, message: str, number: int) -> float:
+    """Get microseconds per call."""
+    return min(timeit.repeat(lambda: func(message), number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    """Print per-call timings for each sample."""
+    # Make sure the comparison is apples to apples
+    for message in SAMPLES.values():
+        assert sanitize_error(message) == legacy_sanitize(message)
+
+    print(f"{'sample':<12}{'chars':>10}{'legacy µs':>14}{'engine µs':>14}{'custom µs':>14}{'speedup':>10}")
+    for name, message in SAMPLES.items():
+        number = 200 if len(message) > 10000 else 20000
+        legacy = bench(legacy_sanitize, message, number)
+        engine = bench(sanitize_error, message, number)
+        custom = bench(CUSTOM.sanitize, message, number)
+        print(
+            f"{name:<12}{len(message):>10}{legacy:>14.2f}{engine:>14.2f}"
+            f"{custom:>14.2f}{legacy / engine:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
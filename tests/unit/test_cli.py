@@ -1,12 +1,19 @@
 """Tests for CLI commands."""
 
+import json
+import subprocess
+import sys
 from pathlib import Path
+from typing import Iterator
 from unittest.mock import Mock, patch
 
 import pytest
 from click.testing import CliRunner
 
+from superclaude_pro import __version__
 from superclaude_pro.cli import cli
+from superclaude_pro.core.config import Config
+from superclaude_pro.core.status import STATUS_FILE
 
 
 class TestCLI:
@@ -17,6 +24,7 @@ class TestCLI:
         result = cli_runner.invoke(cli, ["--version"])
         assert result.exit_code == 0
         assert "version" in result.output.lower()
+        assert __version__ in result.output
     
     def test_cli_help(self, cli_runner: CliRunner):
         """Test help output."""
@@ -27,7 +35,7 @@ class TestCLI:
         assert "update" in result.output
         assert "uninstall" in result.output
     
-    @patch("superclaude_pro.cli.Installer")
+    @patch("superclaude_pro.cli.Installer", create=True)
     def test_install_command_default(self, mock_installer_class: Mock, cli_runner: CliRunner):
         """Test install command with defaults."""
         mock_installer = Mock()
@@ -39,7 +47,7 @@ class TestCLI:
         mock_installer.install.assert_called_once_with(profile="quick", force=False)
         assert "installed successfully" in result.output
     
-    @patch("superclaude_pro.cli.Installer")
+    @patch("superclaude_pro.cli.Installer", create=True)
     def test_install_command_with_options(self, mock_installer_class: Mock, cli_runner: CliRunner):
         """Test install command with options."""
         mock_installer = Mock()
@@ -50,7 +58,7 @@ class TestCLI:
         assert result.exit_code == 0
         mock_installer.install.assert_called_once_with(profile="developer", force=True)
     
-    @patch("superclaude_pro.cli.Installer")
+    @patch("superclaude_pro.cli.Installer", create=True)
     def test_install_command_failure(self, mock_installer_class: Mock, cli_runner: CliRunner):
         """Test install command when installation fails."""
         mock_installer = Mock()
@@ -63,7 +71,7 @@ class TestCLI:
         assert "Installation failed" in result.output
         assert "Installation error" in result.output
     
-    @patch("superclaude_pro.cli.Installer")
+    @patch("superclaude_pro.cli.Installer", create=True)
     def test_update_command(self, mock_installer_class: Mock, cli_runner: CliRunner):
         """Test update command."""
         mock_installer = Mock()
@@ -75,21 +83,29 @@ class TestCLI:
         mock_installer.update.assert_called_once()
         assert "Updated successfully" in result.output
     
-    @patch("superclaude_pro.cli.Installer")
-    def test_update_check_only(self, mock_installer_class: Mock, cli_runner: CliRunner):
+    @patch("superclaude_pro.core.updates.UpdateChecker.check")
+    def test_update_check_only(self, mock_check: Mock, cli_runner: CliRunner):
         """Test update command with --check flag."""
-        mock_installer = Mock()
-        mock_installer.check_for_updates.return_value = True
-        mock_installer_class.return_value = mock_installer
+        mock_check.return_value = "9.0.0"
         
         result = cli_runner.invoke(cli, ["update", "--check"])
         
         assert result.exit_code == 0
-        mock_installer.check_for_updates.assert_called_once()
-        mock_installer.update.assert_not_called()
-        assert "Update available" in result.output
+        assert mock_check.call_args.kwargs["wait"] is True
+        assert "Update available: 9.0.0" in result.output
+    
+    @patch("superclaude_pro.core.updates.UpdateChecker.check")
+    def test_update_check_offline(self, mock_check: Mock, cli_runner: CliRunner):
+        """Test --offline answers without waiting for the network."""
+        mock_check.return_value = None
+        
+        result = cli_runner.invoke(cli, ["update", "--check", "--offline"])
+        
+        assert result.exit_code == 0
+        assert mock_check.call_args.kwargs["wait"] is False
+        assert "latest version" in result.output
     
-    @patch("superclaude_pro.cli.Installer")
+    @patch("superclaude_pro.cli.Installer", create=True)
     def test_uninstall_command_confirmed(self, mock_installer_class: Mock, cli_runner: CliRunner):
         """Test uninstall command with confirmation."""
         mock_installer = Mock()
@@ -101,7 +117,7 @@ class TestCLI:
         mock_installer.uninstall.assert_called_once()
         assert "Uninstalled successfully" in result.output
     
-    @patch("superclaude_pro.cli.Installer")
+    @patch("superclaude_pro.cli.Installer", create=True)
     def test_uninstall_command_cancelled(self, mock_installer_class: Mock, cli_runner: CliRunner):
         """Test uninstall command when cancelled."""
         result = cli_runner.invoke(cli, ["uninstall"], input="n\n")
@@ -109,26 +125,124 @@ class TestCLI:
         assert result.exit_code == 1
         assert "Aborted" in result.output
     
-    @patch("superclaude_pro.cli.Installer")
-    def test_status_command(self, mock_installer_class: Mock, cli_runner: CliRunner):
-        """Test status command."""
-        mock_installer = Mock()
-        mock_installer.get_status.return_value = {
-            "installed": True,
-            "version": "3.1.0",
-            "profile": "developer",
-            "components": ["commands", "personas", "mcp"]
-        }
-        mock_installer_class.return_value = mock_installer
+    def test_status_command(self, cli_runner: CliRunner, mock_home_dir: Path):
+        """Test status reads the record written when the config was saved."""
+        Config.shared().set("profile", "developer")
+        Config.clear_shared()
         
-        result = cli_runner.invoke(cli, ["status"])
+        with patch.object(Config, "_parse_file") as mock_parse:
+            result = cli_runner.invoke(cli, ["status"])
         
         assert result.exit_code == 0
+        mock_parse.assert_not_called()
         assert "SuperClaude Pro Status" in result.output
         assert "3.1.0" in result.output
         assert "developer" in result.output
     
-    @patch("superclaude_pro.cli.Installer")
+    def test_status_command_writes_nothing(self, cli_runner: CliRunner, mock_home_dir: Path):
+        """Test that status writes nothing when not installed."""
+        result = cli_runner.invoke(cli, ["status"])
+        cli_runner.invoke(cli, ["status"])
+        
+        assert "Installed: False" in result.output
+        assert not (mock_home_dir / ".claude").exists()
+    
+    def test_status_json(self, cli_runner: CliRunner, mock_home_dir: Path):
+        """Test status --json prints the record."""
+        Config.shared().set("components.mcp", False)
+        
+        result = cli_runner.invoke(cli, ["status", "--json"])
+        
+        assert result.exit_code == 0
+        status = json.loads(result.output)
+        assert status["installed"] is True
+        assert status["components"] == ["commands", "personas", "orchestrator"]
+    
+    def test_status_verify_reports_missing_components(
+        self, cli_runner: CliRunner, mock_home_dir: Path
+    ):
+        """Test status --verify checks the disk and refreshes a stale record."""
+        config = Config.shared()
+        config.set("profile", "developer")
+        (config.claude_dir / STATUS_FILE).write_text("{}")
+        
+        result = cli_runner.invoke(cli, ["status", "--verify", "--json"])
+        
+        assert result.exit_code == 1
+        status = json.loads(result.output)
+        assert "commands: " in status["problems"][0]
+        assert json.loads((config.claude_dir / STATUS_FILE).read_text())["profile"] == "developer"
+    
+    def test_status_notices_hand_edited_config(
+        self, cli_runner: CliRunner, mock_home_dir: Path
+    ):
+        """Test a config changed behind the record's back is rescanned once."""
+        config = Config.shared()
+        config.set("profile", "developer")
+        (config.claude_dir / "commands" / "sc").mkdir(parents=True)
+        data = json.loads(config.config_path.read_text())
+        data["profile"] = "minimal"
+        data["components"] = {"commands": True, "personas": False, "mcp": False}
+        config.config_path.write_text(json.dumps(data))
+        
+        result = cli_runner.invoke(cli, ["status", "--json"])
+        
+        assert result.exit_code == 0
+        assert json.loads(result.output)["profile"] == "minimal"
+        Config.clear_shared()
+        with patch.object(Config, "_parse_file") as mock_parse:
+            again = cli_runner.invoke(cli, ["status", "--json"])
+        mock_parse.assert_not_called()
+        assert json.loads(again.output)["profile"] == "minimal"
+    
+    def test_status_notices_deleted_config(
+        self, cli_runner: CliRunner, mock_home_dir: Path
+    ):
+        """Test deleting the config turns the record into not installed."""
+        config = Config.shared()
+        config.set("profile", "developer")
+        config.config_path.unlink()
+        
+        result = cli_runner.invoke(cli, ["status", "--json"])
+        
+        assert result.exit_code == 0
+        assert json.loads(result.output)["installed"] is False
+        record = json.loads((config.claude_dir / STATUS_FILE).read_text())
+        assert record["installed"] is False
+    
+    def test_status_persists_scan_of_old_install(
+        self, cli_runner: CliRunner, mock_home_dir: Path
+    ):
+        """Test an install predating the record is scanned once, then served."""
+        config = Config.shared()
+        config.set("profile", "developer")
+        (config.claude_dir / STATUS_FILE).unlink()
+        Config.clear_shared()
+        
+        cli_runner.invoke(cli, ["status", "--json"])
+        with patch.object(Config, "_parse_file") as mock_parse:
+            result = cli_runner.invoke(cli, ["status", "--json"])
+        
+        mock_parse.assert_not_called()
+        assert json.loads(result.output)["profile"] == "developer"
+    
+    def test_status_exit_code_matches_across_formats(
+        self, cli_runner: CliRunner, mock_home_dir: Path
+    ):
+        """Test problems found by a rescan fail both the panel and JSON output."""
+        config = Config.shared()
+        config.set("profile", "developer")
+        (config.claude_dir / STATUS_FILE).unlink()
+        
+        panel = cli_runner.invoke(cli, ["status"])
+        (config.claude_dir / STATUS_FILE).unlink()
+        as_json = cli_runner.invoke(cli, ["status", "--json"])
+        
+        assert panel.exit_code == as_json.exit_code == 1
+        assert "commands: " in panel.output
+        assert json.loads(as_json.output)["problems"]
+    
+    @patch("superclaude_pro.cli.Installer", create=True)
     def test_component_enable(self, mock_installer_class: Mock, cli_runner: CliRunner):
         """Test enabling a component."""
         mock_installer = Mock()
@@ -140,7 +254,7 @@ class TestCLI:
         mock_installer.enable_component.assert_called_once_with("mcp")
         assert "Enabled mcp" in result.output
     
-    @patch("superclaude_pro.cli.Installer")
+    @patch("superclaude_pro.cli.Installer", create=True)
     def test_component_disable(self, mock_installer_class: Mock, cli_runner: CliRunner):
         """Test disabling a component."""
         mock_installer = Mock()
@@ -150,4 +264,236 @@ class TestCLI:
         
         assert result.exit_code == 0
         mock_installer.disable_component.assert_called_once_with("mcp")
-        assert "Disabled mcp" in result.output
\ No newline at end of file
+        assert "Disabled mcp" in result.output
+    
+    @patch("superclaude_pro.core.generations.GenerationStore")
+    def test_rollback_command(self, mock_store_class: Mock, cli_runner: CliRunner):
+        """Test rollback switches to the previous installation."""
+        mock_store_class.return_value.rollback.return_value = "000001"
+        
+        result = cli_runner.invoke(cli, ["rollback"])
+        
+        assert result.exit_code == 0
+        assert "Rolled back to installation 000001" in result.output
+    
+    @patch("superclaude_pro.core.generations.GenerationStore")
+    def test_rollback_command_failure(self, mock_store_class: Mock, cli_runner: CliRunner):
+        """Test rollback failure is reported."""
+        mock_store_class.return_value.rollback.side_effect = RuntimeError("nothing")
+        
+        result = cli_runner.invoke(cli, ["rollback"])
+        
+        assert result.exit_code == 1
+        assert "Rollback failed" in result.output
+    
+    @patch("superclaude_pro.cli.TelemetryCollector")
+    def test_stats_command(self, mock_collector_class: Mock, cli_runner: CliRunner):
+        """Test stats command shows latency percentiles."""
+        mock_collector = Mock(enabled=True)
+        mock_collector.get_metrics_summary.return_value = {
+            "total_events": 3,
+            "total_commands": 3,
+            "total_errors": 0,
+            "latency": {
+                "install": {"count": 3, "mean": 120.0, "p50": 110, "p90": 150, "p99": 151, "max": 151},
+            },
+            "caches": {
+                "mcp_results": {"hits": 3, "misses": 1, "evictions": 0, "hit_rate": 0.75},
+            },
+        }
+        mock_collector_class.return_value = mock_collector
+        
+        result = cli_runner.invoke(cli, ["stats"])
+        
+        assert result.exit_code == 0
+        assert "Command latency" in result.output
+        assert "install" in result.output
+        assert "151" in result.output
+        assert "Cache mcp_results: 3 hits, 1 misses (75% hit rate)" in result.output
+    
+    @patch("superclaude_pro.cli.TelemetryCollector")
+    def test_stats_command_disabled(self, mock_collector_class: Mock, cli_runner: CliRunner):
+        """Test stats command when telemetry is disabled."""
+        mock_collector_class.return_value = Mock(enabled=False)
+        
+        result = cli_runner.invoke(cli, ["stats"])
+        
+        assert result.exit_code == 0
+        assert "Telemetry is disabled" in result.output
+    
+    @patch("superclaude_pro.mcp.probe_servers")
+    def test_mcp_command_json(self, mock_probe: Mock, cli_runner: CliRunner):
+        """Test mcp command reports each server and fails if one is down."""
+        from superclaude_pro.mcp import ServerStatus
+        
+        mock_probe.return_value = [
+            ServerStatus("context7", True, latency_ms=12.5, version="1.0.0", tools=["a"]),
+            ServerStatus("magic", False, error="timed out after 10s"),
+        ]
+        
+        result = cli_runner.invoke(cli, ["mcp", "--json", "--timeout", "2"])
+        
+        assert result.exit_code == 1
+        assert mock_probe.call_args.kwargs["timeout"] == 2.0
+        statuses = json.loads(result.output)
+        assert [s["name"] for s in statuses] == ["context7", "magic"]
+        assert statuses[1]["error"] == "timed out after 10s"
+    
+    @patch("superclaude_pro.mcp.probe_servers")
+    def test_mcp_command_table(self, mock_probe: Mock, cli_runner: CliRunner):
+        """Test mcp command shows a table of healthy servers."""
+        from superclaude_pro.mcp import ServerStatus
+        
+        mock_probe.return_value = [ServerStatus("context7", True, version="1.0.0")]
+        
+        result = cli_runner.invoke(cli, ["mcp"])
+        
+        assert result.exit_code == 0
+        assert "context7" in result.output
+        assert "healthy" in result.output
+
+
+class TestJsonOutput:
+    """Test that --json output is not mixed with log messages."""
+    
+    @pytest.fixture(autouse=True)
+    def unconfigured_logging(self) -> Iterator[None]:
+        """Run each test as a fresh process would, before setup_logging()."""
+        import structlog
+        
+        structlog.reset_defaults()
+        yield
+        structlog.reset_defaults()
+    
+    def test_stats_json_is_parseable(self, cli_runner: CliRunner, mock_home_dir: Path):
+        """Test the "Telemetry enabled" message stays off stdout."""
+        Config(claude_dir=mock_home_dir / ".claude").set("settings.telemetry", True)
+        
+        result = cli_runner.invoke(cli, ["stats", "--json"])
+        
+        assert result.exit_code == 0
+        assert isinstance(json.loads(result.stdout), dict)
+        assert "Telemetry enabled" in result.stderr
+    
+    def test_mcp_json_is_parseable(self, cli_runner: CliRunner, mock_home_dir: Path):
+        """Test the warning about an unavailable server stays off stdout."""
+        config = Config(claude_dir=mock_home_dir / ".claude")
+        config.set("mcp_servers", ["broken"])
+        config.set("mcp.servers", {"broken": {"command": "/nonexistent/mcp-server"}})
+        
+        result = cli_runner.invoke(cli, ["mcp", "--json"])
+        
+        assert result.exit_code == 1
+        (status,) = json.loads(result.stdout)
+        assert status["name"] == "broken" and not status["healthy"]
+        assert "MCP server unavailable" in result.stderr
+
+
+class TestStartup:
+    """Test that CLI startup stays cheap."""
+    
+    # Modules only needed once a command actually runs
+    HEAVY_MODULES = [
+        "rich",
+        "structlog",
+        "pydantic",
+        "httpx",
+        "importlib.metadata",
+        "superclaude_pro.core.config",
+        "superclaude_pro.core.installer",
+        "superclaude_pro.telemetry",
+    ]
+    
+    def _loaded_after(self, code: str) -> list:
+        """Run code in a fresh interpreter and get the heavy modules it loaded."""
+        script = (
+            f"import sys\n{code}\n"
+            f"import json\n"
+            f"print(json.dumps([m for m in {self.HEAVY_MODULES!r} if m in sys.modules]))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        return json.loads(result.stdout.strip().splitlines()[-1])
+    
+    def test_import_is_lightweight(self):
+        """Test importing the CLI does not import heavy dependencies."""
+        assert self._loaded_after("import superclaude_pro.cli") == []
+    
+    def test_help_is_lightweight(self):
+        """Test --help does not import heavy dependencies."""
+        code = (
+            "from superclaude_pro.cli import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+        assert self._loaded_after(code) == []
+    
+    def test_version_is_lightweight(self):
+        """Test --version needs neither importlib.metadata nor the core modules."""
+        code = (
+            "from superclaude_pro.cli import cli\n"
+            "try:\n"
+            "    cli(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+        assert self._loaded_after(code) == []
+    
+    def test_import_time_budget(self):
+        """Test importing the CLI stays within its import-time budget."""
+        # Measured with -X importtime: ~195ms before deferring imports,
+        # ~55ms after (about 35ms of it click); the budget leaves room for
+        # slower machines but not for Rich or structlog coming back
+        budget_us = 120_000
+        
+        def import_us() -> int:
+            code = "import superclaude_pro.cli"
+            command = [sys.executable, "-X", "importtime", "-c", code]
+            result = subprocess.run(command, capture_output=True, text=True, check=True)
+            for line in result.stderr.splitlines():
+                fields = line.split("|")
+                if len(fields) == 3 and fields[2].strip() == "superclaude_pro.cli":
+                    return int(fields[1])
+            raise AssertionError("superclaude_pro.cli not in -X importtime output")
+        
+        assert min(import_us() for _ in range(3)) < budget_us
+    
+    def test_status_json_is_lightweight(self, mock_home_dir: Path):
+        """Test status --json reads the record without Rich or pydantic."""
+        (mock_home_dir / ".claude").mkdir()
+        (mock_home_dir / ".claude" / STATUS_FILE).write_text('{"installed": true}')
+        code = (
+            "import pathlib\n"
+            f"pathlib.Path.home = lambda: pathlib.Path({str(mock_home_dir)!r})\n"
+            "from superclaude_pro.cli import cli\n"
+            "try:\n"
+            "    cli(['status', '--json'])\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+        loaded = self._loaded_after(code)
+        
+        assert not {"rich", "pydantic", "structlog"} & set(loaded)
+    
+    def test_lazy_names_resolve(self):
+        """Test deferred names are importable from the CLI module."""
+        import superclaude_pro.cli as cli_module
+        from superclaude_pro.core.config import Config
+        
+        assert cli_module.Config is Config
+        with pytest.raises(AttributeError):
+            cli_module.DoesNotExist
+    
+    def test_unimportable_lazy_name_is_missing(self, monkeypatch: pytest.MonkeyPatch):
+        """Test a deferred name whose module is missing raises AttributeError."""
+        import superclaude_pro.cli as cli_module
+        
+        lazy = cli_module._LAZY_IMPORTS
+        monkeypatch.setitem(lazy, "Gone", ("no_such_module", "Gone"))
+        assert not hasattr(cli_module, "Gone")
+        with pytest.raises(AttributeError) as info:
+            cli_module.Gone
+        assert isinstance(info.value.__cause__, ImportError)
@@ -0,0 +1,119 @@
+"""Tests for the command registry and its markdown index."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from superclaude_pro.commands import CommandRegistry
+from superclaude_pro.core.config import Config
+from superclaude_pro.utils import mdindex
+from superclaude_pro.utils.mdindex import MarkdownIndex, parse_frontmatter
+
+
+@pytest.fixture
+def commands_dir(mock_claude_dir: Path) -> Path:
+    """Create an installed commands directory."""
+    directory = mock_claude_dir / "commands" / "sc"
+    (directory / "git").mkdir(parents=True)
+    (directory / "analyze.md").write_text(
+        "---\ndescription: Analyze code quality\naliases: [review, audit]\n---\n# Analyze\n"
+    )
+    (directory / "build.md").write_text("# Build the project\n\nBody text.\n")
+    (directory / "git" / "commit.md").write_text(
+        "---\nname: commit\naliases:\n  - ci\n---\nCommit changes\n"
+    )
+    return directory
+
+
+class TestFrontmatter:
+    """Test parse_frontmatter."""
+    
+    def test_values_and_lists(self):
+        """Test scalars, quoted strings, inline and block lists."""
+        meta, body = parse_frontmatter(
+            "---\nname: 'x'\ntags: [a, \"b\"]\nsteps:\n  - one\n  - two\n---\nBody"
+        )
+        
+        assert meta == {"name": "x", "tags": ["a", "b"], "steps": ["one", "two"]}
+        assert body == "Body"
+    
+    def test_without_frontmatter(self):
+        """Test documents without a frontmatter block are all body."""
+        assert parse_frontmatter("# Title\n---\n") == ({}, "# Title\n---\n")
+
+
+class TestCommandRegistry:
+    """Test CommandRegistry."""
+    
+    def test_resolve_by_name_alias_and_prefix(self, commands_dir: Path):
+        """Test commands resolve by name, alias and /sc: prefix."""
+        registry = CommandRegistry(commands_dir)
+        
+        assert registry.names() == ["analyze", "build", "commit"]
+        assert registry.resolve("/sc:analyze") is registry.resolve("review")
+        assert registry.resolve("sc:ci").path == commands_dir / "git" / "commit.md"
+        assert registry.resolve("build").description == "Build the project"
+        assert "missing" not in registry
+    
+    def test_index_avoids_reparsing(self, commands_dir: Path):
+        """Test a second registry reads the index without parsing any file."""
+        CommandRegistry(commands_dir).names()
+        
+        with patch.object(mdindex, "parse_frontmatter") as mock_parse:
+            registry = CommandRegistry(commands_dir)
+            assert len(registry) == 3
+        
+        mock_parse.assert_not_called()
+        assert (commands_dir.parent / ".sc.index.json").exists()
+    
+    def test_added_file_is_picked_up(self, commands_dir: Path):
+        """Test a new file invalidates the index and only it is parsed."""
+        CommandRegistry(commands_dir).names()
+        (commands_dir / "test.md").write_text("---\naliases: t\n---\nRun tests\n")
+        
+        registry = CommandRegistry(commands_dir)
+        
+        assert registry.resolve("t").name == "test"
+        assert registry.index.parsed == 1
+    
+    def test_in_place_edit_needs_verify(self, commands_dir: Path):
+        """Test verify catches edits that keep the directory mtime."""
+        registry = CommandRegistry(commands_dir)
+        registry.names()
+        dir_mtime = os.stat(commands_dir).st_mtime_ns
+        (commands_dir / "build.md").write_text("---\naliases: [b]\n---\nBuild\n")
+        os.utime(commands_dir, ns=(dir_mtime, dir_mtime))
+        
+        registry.refresh()
+        assert "b" not in registry
+        
+        registry.refresh(verify=True)
+        assert "b" in registry
+    
+    def test_touched_file_is_not_reparsed(self, commands_dir: Path):
+        """Test a new mtime with the same content reuses the parsed entry."""
+        index = MarkdownIndex(commands_dir)
+        index.refresh()
+        os.utime(commands_dir / "build.md", ns=(1, 1))
+        
+        index.refresh(verify=True)
+        
+        assert index.parsed == 0
+        assert index.documents()["build.md"]["mtime_ns"] == 1
+    
+    def test_alias_conflicts_lose_to_names(self, commands_dir: Path):
+        """Test an alias cannot shadow a command name."""
+        (commands_dir / "x.md").write_text("---\naliases: [build]\n---\nX\n")
+        
+        registry = CommandRegistry(commands_dir)
+        
+        assert registry.resolve("build").name == "build"
+    
+    def test_for_config_and_missing_directory(self, config: Config):
+        """Test a registry for a config without installed commands is empty."""
+        registry = CommandRegistry.for_config(config)
+        
+        assert registry.directory == config.claude_dir / "commands" / "sc"
+        assert registry.commands() == []
@@ -1,24 +1,54 @@
 """Tests for configuration management."""
 
 import json
+import os
+import stat
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from superclaude_pro.core.config import Config
+from superclaude_pro.utils import files
 
 
 class TestConfig:
     """Test Config class."""
     
-    def test_init_creates_claude_dir(self, temp_dir: Path):
-        """Test that initialization creates the Claude directory."""
+    def test_init_does_not_touch_disk(self, temp_dir: Path):
+        """Test that initialization and reads create nothing."""
         claude_dir = temp_dir / ".claude"
-        assert not claude_dir.exists()
         
         config = Config(claude_dir=claude_dir)
-        assert claude_dir.exists()
+        assert config.get("profile") == "quick"
+        assert config.get_installed_components()
+        assert not claude_dir.exists()
+    
+    def test_first_write_creates_claude_dir(self, temp_dir: Path):
+        """Test that the first write creates the Claude directory."""
+        claude_dir = temp_dir / ".claude"
+        config = Config(claude_dir=claude_dir)
+        
+        config.set("profile", "developer")
+        
         assert claude_dir.is_dir()
+        assert Config(claude_dir=claude_dir).get("profile") == "developer"
+    
+    def test_shared_instance_per_directory(self, temp_dir: Path):
+        """Test that shared() reuses one instance per directory."""
+        first = Config.shared(temp_dir / "a")
+        
+        assert Config.shared(temp_dir / "a") is first
+        assert Config.shared(temp_dir / "a" / ".." / "a") is first
+        assert Config.shared(temp_dir / "b") is not first
+    
+    def test_shared_defaults_to_home(self, mock_home_dir: Path):
+        """Test that shared() without a directory uses ~/.claude."""
+        config = Config.shared()
+        
+        assert config.claude_dir == mock_home_dir / ".claude"
+        assert Config.shared(mock_home_dir / ".claude") is config
     
     def test_load_returns_defaults_when_no_config(self, config: Config):
         """Test loading returns defaults when no config file exists."""
@@ -122,4 +152,122 @@ class TestConfig:
         
         # Should return defaults instead of crashing
         result = config.load()
-        assert result == config.get_defaults()
\ No newline at end of file
+        assert result == config.get_defaults()
+    
+    def test_get_uses_cache_until_file_changes(self, config: Config):
+        """Test repeated reads are served from cache and revalidated by stat."""
+        config.save({"profile": "developer"})
+        
+        assert config.get("profile") == "developer"
+        assert config.get("profile") == "developer"
+        assert config.cache_stats() == {"hits": 2, "misses": 0}
+        
+        # Simulate another process rewriting the file
+        with open(config.config_path, "w") as f:
+            json.dump({"profile": "minimal", "extra": True}, f)
+        
+        assert config.get("profile") == "minimal"
+        assert config.cache_stats()["misses"] == 1
+    
+    def test_cached_values_are_not_shared(self, config: Config):
+        """Test mutating returned values does not corrupt the cache."""
+        config.save({"level1": {"key": "value"}})
+        
+        config.load()["level1"]["key"] = "mutated"
+        config.get("level1")["key"] = "mutated"
+        
+        assert config.get("level1.key") == "value"
+    
+    def test_get_falls_back_to_builtin_defaults(self, config: Config):
+        """Test keys missing from the file resolve to their built-in default."""
+        config.save({"profile": "developer"})
+        
+        assert config.get("settings.telemetry") is False
+        assert config.get("no.such.key") is None
+        assert config.get("no.such.key", 1) == 1
+    
+    def test_defaults_are_private_copies(self, config: Config):
+        """Test mutating returned defaults does not affect later reads."""
+        config.get_defaults()["profile"] = "mutated"
+        config.get("components")["commands"] = False
+        
+        assert config.get("profile") == "quick"
+        assert config.get("components.commands") is True
+    
+    def test_get_many(self, config: Config):
+        """Test reading several keys with one call."""
+        config.save({"profile": "developer", "settings": {"debug": True}})
+        
+        assert config.get_many(["profile", "settings.debug", "settings.telemetry"]) == {
+            "profile": "developer",
+            "settings.debug": True,
+            "settings.telemetry": False,
+        }
+        assert config.get_many(["missing"], default=0) == {"missing": 0}
+    
+    def test_set_through_non_section_raises(self, config: Config):
+        """Test setting below a non-dict value fails clearly and writes nothing."""
+        config.set("profile", "developer")
+        
+        with pytest.raises(TypeError, match="'profile' is a str"):
+            config.set("profile.name", "x")
+        
+        assert config.get("profile") == "developer"
+    
+    def test_transaction_writes_once(self, config: Config):
+        """Test a transaction applies many changes with a single save."""
+        with patch.object(Config, "save", wraps=config.save) as mock_save:
+            with config.transaction() as txn:
+                for i in range(20):
+                    txn.set(f"provisioning.key{i}", i)
+                txn.set("profile", "developer")
+                assert txn.get("provisioning.key3") == 3
+        
+        assert mock_save.call_count == 1
+        assert config.get("provisioning.key19") == 19
+        assert config.get("profile") == "developer"
+    
+    def test_transaction_discards_changes_on_error(self, config: Config):
+        """Test nothing is written when the transaction block raises."""
+        config.set("profile", "quick")
+        
+        with pytest.raises(RuntimeError):
+            with config.transaction() as txn:
+                txn.set("profile", "developer")
+                raise RuntimeError("boom")
+        
+        assert config.get("profile") == "quick"
+    
+    def test_save_is_atomic(self, config: Config):
+        """Test saving leaves no temporary files behind."""
+        config.set_many({"a": 1, "b.c": 2})
+        
+        assert config.load()["b"] == {"c": 2}
+        leftovers = [p for p in config.claude_dir.iterdir() if p.suffix == ".tmp"]
+        assert leftovers == []
+    
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_save_keeps_file_permissions(self, config: Config):
+        """Test atomic saves honour the umask and keep an existing file's mode."""
+        config.set("a", 1)
+        expected = 0o666 & ~files._UMASK
+        assert stat.S_IMODE(config.config_path.stat().st_mode) == expected
+        
+        config.config_path.chmod(0o640)
+        config.set("a", 2)
+        assert stat.S_IMODE(config.config_path.stat().st_mode) == 0o640
+    
+    def test_concurrent_updates_are_not_lost(self, mock_claude_dir: Path):
+        """Test parallel read-modify-write cycles are serialized by the lock."""
+        def worker(n: int) -> None:
+            config = Config(claude_dir=mock_claude_dir)
+            for i in range(10):
+                config.set(f"workers.w{n}_{i}", True)
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert len(Config(claude_dir=mock_claude_dir).get("workers")) == 40
\ No newline at end of file
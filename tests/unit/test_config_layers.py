@@ -0,0 +1,133 @@
+"""Tests for layered configuration."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from superclaude_pro.core.config import Config
+from superclaude_pro.core.layers import env_layer, find_project_file, resolve
+
+
+@pytest.fixture
+def project_file(temp_dir: Path) -> Path:
+    """Create a project config file in the working directory."""
+    path = temp_dir / ".superclaude.json"
+    path.write_text(json.dumps({"profile": "developer", "settings": {"debug": True}}))
+    return path
+
+
+class TestLayers:
+    """Test layer merging."""
+    
+    def test_resolve_merges_sections(self):
+        """Test later layers override values but keep sibling keys."""
+        snapshot = resolve([
+            ("defaults", {"a": {"x": 1, "y": 2}, "b": 1}),
+            ("user", {"a": {"y": 3}}),
+        ])
+        
+        assert snapshot.get("a.x") == 1
+        assert snapshot.get("a.y") == 3
+        assert dict(snapshot.get("a")) == {"x": 1, "y": 3}
+        assert snapshot.source("a.x") == "defaults"
+        assert snapshot.source("a.y") == "user"
+        assert snapshot.source("a") is None
+    
+    def test_resolve_replaces_value_with_section(self):
+        """Test provenance when a layer turns a value into a section."""
+        snapshot = resolve([("user", {"a": 1}), ("env", {"a": {"b": 2}})])
+        
+        assert snapshot.get("a.b") == 2
+        assert snapshot.source("a") is None
+        assert snapshot.source("a.b") == "env"
+    
+    def test_snapshot_is_frozen_and_hashable(self):
+        """Test snapshots are read-only and compare by content."""
+        first = resolve([("user", {"a": [1, {"b": 2}]})])
+        second = resolve([("user", {"a": [1, {"b": 2}]})])
+        
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first.get("a") == (1, {"b": 2})
+        with pytest.raises(TypeError):
+            first.data["a"] = 1
+        assert resolve([("user", {"a": 2})]).digest != first.digest
+    
+    def test_env_layer(self):
+        """Test environment variables map to nested, typed keys."""
+        data = env_layer({
+            "SUPERCLAUDE_SETTINGS__TELEMETRY": "true",
+            "SUPERCLAUDE_PROFILE": "minimal",
+            "SUPERCLAUDE_MCP_SERVERS": '["magic"]',
+            "SUPERCLAUDE_": "ignored",
+            "OTHER": "ignored",
+        })
+        
+        assert data == {
+            "settings": {"telemetry": True},
+            "profile": "minimal",
+            "mcp_servers": ["magic"],
+        }
+    
+    def test_find_project_file_searches_parents(self, project_file: Path):
+        """Test the nearest project file is found from a subdirectory."""
+        subdir = project_file.parent / "src" / "pkg"
+        subdir.mkdir(parents=True)
+        
+        assert find_project_file(subdir) == project_file
+        assert find_project_file(project_file.parent.parent / "elsewhere") is None
+
+
+class TestConfigLayers:
+    """Test Config resolution across layers."""
+    
+    def test_precedence(self, config: Config, project_file: Path, monkeypatch):
+        """Test defaults < user < project < environment."""
+        monkeypatch.setenv("SUPERCLAUDE_SETTINGS__DEBUG", "false")
+        config.save({"profile": "minimal", "settings": {"auto_update": False}})
+        
+        assert config.get("profile") == "developer"
+        assert config.get("settings.auto_update") is False
+        assert config.get("settings.debug") is False
+        assert config.get("settings.telemetry") is False
+        assert config.source("profile") == "project"
+        assert config.source("settings.auto_update") == "user"
+        assert config.source("settings.debug") == "env"
+        assert config.source("settings.telemetry") == "defaults"
+    
+    def test_writes_only_touch_user_file(self, config: Config, project_file: Path):
+        """Test set() writes the user file and leaves overrides in place."""
+        config.set("profile", "minimal")
+        
+        assert config.load()["profile"] == "minimal"
+        assert config.get("profile") == "developer"
+        assert json.loads(project_file.read_text())["profile"] == "developer"
+    
+    def test_snapshot_reused_until_a_layer_changes(self, config: Config, project_file: Path):
+        """Test the merged snapshot is rebuilt only when a file changes."""
+        first = config.snapshot()
+        assert config.snapshot() is first
+        
+        project_file.write_text(json.dumps({"profile": "quick", "extra": 1}))
+        second = config.snapshot()
+        
+        assert second is not first
+        assert second.digest != first.digest
+        assert config.get("extra") == 1
+    
+    def test_env_changes_need_invalidation(self, config: Config, monkeypatch):
+        """Test environment overrides are read once per snapshot."""
+        assert config.get("profile") == "quick"
+        
+        monkeypatch.setenv("SUPERCLAUDE_PROFILE", "developer")
+        assert config.get("profile") == "quick"
+        
+        config.invalidate_cache()
+        assert config.get("profile") == "developer"
+    
+    def test_broken_project_file_is_ignored(self, config: Config, project_file: Path):
+        """Test an unreadable project file does not break lookups."""
+        project_file.write_text("{ invalid json }")
+        
+        assert config.get("profile") == "quick"
@@ -0,0 +1,112 @@
+"""Tests for config schema validation."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from superclaude_pro.core.config import Config
+from superclaude_pro.core.schema import ConfigModel, parse_layer_json, validate_layer
+
+
+class TestSchema:
+    """Test layer validation."""
+    
+    def test_parse_coerces_and_keeps_only_set_values(self):
+        """Test values are coerced and unset fields are not filled in."""
+        data = parse_layer_json(b'{"settings": {"telemetry": "yes"}, "extra": 1}', "test")
+        
+        assert data == {"settings": {"telemetry": True}, "extra": 1}
+    
+    def test_parse_valid_file_skips_json_module(self):
+        """Test valid files are parsed by pydantic alone."""
+        with patch("superclaude_pro.core.schema.json.loads", side_effect=AssertionError):
+            data = parse_layer_json(b'{"profile": "developer"}', "test")
+        
+        assert data == {"profile": "developer"}
+    
+    def test_parse_drops_invalid_values(self):
+        """Test invalid values are dropped and the rest kept."""
+        raw = json.dumps({
+            "profile": "developer",
+            "settings": {"telemetry": "maybe", "debug": True},
+            "mcp_servers": ["magic", 3],
+        }).encode()
+        
+        assert parse_layer_json(raw, "test") == {
+            "profile": "developer",
+            "settings": {"debug": True},
+        }
+    
+    def test_parse_mcp_servers(self):
+        """Test server definitions are validated and keep only set fields."""
+        raw = json.dumps({"mcp": {"servers": {
+            "ok": {"command": "node server.js", "timeout": "3"},
+            "bad": {"url": "http://localhost/mcp", "env": {"A": []}},
+        }}}).encode()
+        
+        assert parse_layer_json(raw, "test") == {"mcp": {"servers": {
+            "ok": {"command": "node server.js", "timeout": 3.0},
+            "bad": {"url": "http://localhost/mcp", "env": {}},
+        }}}
+    
+    def test_parse_rejects_non_objects(self):
+        """Test broken JSON and non-object files are unusable."""
+        assert parse_layer_json(b"{ invalid json }", "test") is None
+        assert parse_layer_json(b"[1, 2]", "test") is None
+    
+    def test_validate_layer(self):
+        """Test validating in-memory layers."""
+        assert validate_layer({"settings": {"telemetry": "1"}}, "env") == {
+            "settings": {"telemetry": True}
+        }
+        assert validate_layer({"components": {"mcp": "nope"}}, "env") == {"components": {}}
+
+
+class TestConfigModel:
+    """Test typed access through Config."""
+    
+    def test_model_is_typed_and_cached(self, config: Config):
+        """Test model() validates once per snapshot."""
+        config.set("settings.telemetry", True)
+        
+        model = config.model()
+        assert isinstance(model, ConfigModel)
+        assert model.settings.telemetry is True
+        assert model.mcp_servers == ["context7", "sequential", "magic", "playwright"]
+        assert config.model() is model
+        
+        config.set("profile", "developer")
+        assert config.model() is not model
+        assert config.model().profile == "developer"
+    
+    def test_model_is_frozen(self, config: Config):
+        """Test the model cannot be modified."""
+        with pytest.raises(ValidationError):
+            config.model().profile = "developer"
+    
+    def test_invalid_user_value_is_ignored(self, config: Config):
+        """Test a bad value falls back to its default without losing the file."""
+        config.config_path.write_text(
+            json.dumps({"profile": "developer", "settings": {"telemetry": "maybe"}})
+        )
+        
+        assert config.get("profile") == "developer"
+        assert config.get("settings.telemetry") is False
+    
+    def test_invalid_env_value_is_ignored(self, config: Config, monkeypatch):
+        """Test a bad environment override is dropped."""
+        monkeypatch.setenv("SUPERCLAUDE_SETTINGS__DEBUG", "maybe")
+        
+        assert config.get("settings.debug") is False
+    
+    def test_save_rejects_invalid_values(self, config: Config):
+        """Test invalid values are refused before anything is written."""
+        config.set("profile", "developer")
+        
+        with pytest.raises(ValidationError):
+            config.set("settings.telemetry", "maybe")
+        
+        assert config.load()["profile"] == "developer"
+        assert config.load()["settings"]["telemetry"] is False
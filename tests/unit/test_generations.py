@@ -0,0 +1,329 @@
+"""Tests for staged installs and rollback."""
+
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from superclaude_pro.core.config import Config
+from superclaude_pro.core.generations import GenerationStore
+from superclaude_pro.core.status import scan_status
+from superclaude_pro.core.sync import MANIFEST_FILE
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Generations are activated through symlinks"
+)
+
+# Installs ``argv[2]`` (old source) normally, then ``argv[3]`` (new source)
+# with the process killed on the argv[4]-th filesystem mutation
+CRASH_SCRIPT = """
+import os, sys
+from pathlib import Path
+from superclaude_pro.core.config import Config
+from superclaude_pro.core.generations import GenerationStore
+from superclaude_pro.core.status import scan_status
+
+claude_dir, old, new, crash_at = sys.argv[1:5]
+targets = lambda root: {"commands/sc": Path(root, "commands"), "CLAUDE.md": Path(root, "CLAUDE.md")}
+store = GenerationStore(Path(claude_dir))
+store.install(targets(old))
+
+calls = 0
+def crashing(fn):
+    def wrapper(*args, **kwargs):
+        global calls
+        calls += 1
+        if calls == int(crash_at):
+            os._exit(17)
+        return fn(*args, **kwargs)
+    return wrapper
+
+for name in ("replace", "rename", "symlink", "link", "unlink", "rmdir", "mkdir", "chmod", "fsync"):
+    setattr(os, name, crashing(getattr(os, name)))
+store.install(targets(new))
+"""
+
+
+def make_source(root: Path, version: str) -> Path:
+    """Create a package source tree whose contents depend on ``version``."""
+    (root / "commands" / "sub").mkdir(parents=True)
+    (root / "commands" / "analyze.md").write_text("analyze")
+    (root / "commands" / "build.md").write_text(f"build {version}")
+    (root / "commands" / "sub" / f"only-{version}.md").write_text(version)
+    (root / "CLAUDE.md").write_text(f"framework {version}")
+    return root
+
+
+def targets(source: Path) -> Dict[str, Path]:
+    """Get the install targets of a source tree."""
+    return {"commands/sc": source / "commands", "CLAUDE.md": source / "CLAUDE.md"}
+
+
+def installed(claude_dir: Path) -> Dict[str, str]:
+    """Read what Claude sees through the installed links."""
+    files = {}
+    commands = claude_dir / "commands" / "sc"
+    if commands.exists():
+        for path in sorted(commands.rglob("*")):
+            if path.is_file():
+                files[f"commands/{path.relative_to(commands).as_posix()}"] = path.read_text()
+    if (claude_dir / "CLAUDE.md").exists():
+        files["CLAUDE.md"] = (claude_dir / "CLAUDE.md").read_text()
+    return files
+
+
+def expected(source: Path) -> Dict[str, str]:
+    """Read a source tree the way ``installed()`` reads an install."""
+    files = {
+        f"commands/{path.relative_to(source / 'commands').as_posix()}": path.read_text()
+        for path in sorted((source / "commands").rglob("*"))
+        if path.is_file()
+    }
+    files["CLAUDE.md"] = (source / "CLAUDE.md").read_text()
+    return files
+
+
+@pytest.fixture
+def old(temp_dir: Path) -> Path:
+    """Create the source of the installed version."""
+    return make_source(temp_dir / "old", "1")
+
+
+@pytest.fixture
+def new(temp_dir: Path) -> Path:
+    """Create the source of the update."""
+    return make_source(temp_dir / "new", "2")
+
+
+class TestGenerationStore:
+    """Test GenerationStore."""
+    
+    def test_install_links_claude_dir_to_current(self, mock_claude_dir: Path, old: Path):
+        """Test installed paths are symlinks into the active generation."""
+        store = GenerationStore(mock_claude_dir)
+        generation = store.install(targets(old))
+        
+        assert store.current() == generation
+        assert store.previous() is None
+        assert (mock_claude_dir / "commands" / "sc").is_symlink()
+        assert installed(mock_claude_dir) == expected(old)
+    
+    def test_update_reuses_unchanged_files(
+        self, mock_claude_dir: Path, old: Path, new: Path
+    ):
+        """Test an update hard-links unchanged files and copies only the rest."""
+        store = GenerationStore(mock_claude_dir)
+        first = store.install(targets(old))
+        seen: List[int] = []
+        second = store.install(targets(new), on_progress=seen.append)
+        
+        assert store.current() == second
+        assert store.previous() == first
+        assert installed(mock_claude_dir) == expected(new)
+        old_path, new_path = store.path(first), store.path(second)
+        same = "commands/sc/analyze.md"
+        assert os.path.samefile(old_path / same, new_path / same)
+        assert not os.path.samefile(old_path / "CLAUDE.md", new_path / "CLAUDE.md")
+        changed = ("commands/sc/build.md", "commands/sc/sub/only-2.md", "CLAUDE.md")
+        assert sum(seen) == sum(len((new_path / name).read_text()) for name in changed)
+        assert not (new_path / "commands" / "sc" / "sub" / "only-1.md").exists()
+        manifest = store.manifest(second)
+        assert all(manifest.is_intact(path) for path in manifest.files())
+        
+        store.rollback()
+        assert installed(mock_claude_dir) == expected(old)
+    
+    def test_install_without_changes_stages_nothing(
+        self, mock_claude_dir: Path, old: Path, new: Path
+    ):
+        """Test reinstalling the same sources keeps the active generation."""
+        store = GenerationStore(mock_claude_dir)
+        first = store.install(targets(old))
+        second = store.install(targets(new))
+        seen: List[int] = []
+        
+        assert store.install(targets(new), on_progress=seen.append) == second
+        
+        assert seen == []
+        assert store.generations() == [first, second]
+        assert store.previous() == first
+        assert installed(mock_claude_dir) == expected(new)
+        # A different set of targets is a change even with the same files
+        assert store.install({"commands/sc": new / "commands"}) != second
+    
+    def test_manifest_records_targets_and_files(self, mock_claude_dir: Path, old: Path):
+        """Test each generation carries a sync manifest of its files."""
+        store = GenerationStore(mock_claude_dir)
+        generation = store.install(targets(old))
+        
+        manifest = store.manifest(generation)
+        
+        assert store.targets(generation) == ["CLAUDE.md", "commands/sc"]
+        assert manifest.path == store.path(generation) / MANIFEST_FILE
+        assert sorted(manifest.entries) == [
+            "CLAUDE.md",
+            "commands/sc/analyze.md",
+            "commands/sc/build.md",
+            "commands/sc/sub/only-1.md",
+        ]
+        assert all(manifest.is_intact(path) for path in manifest.files())
+    
+    def test_scan_status_checks_generation_files(self, config: Config, old: Path):
+        """Test a verify scan reports files edited or deleted after install."""
+        config.set("profile", "quick")
+        store = GenerationStore(config.claude_dir)
+        store.install(targets(old))
+        (config.claude_dir / "CLAUDE.md").write_text("edited")
+        (config.claude_dir / "commands" / "sc" / "build.md").unlink()
+        
+        problems = scan_status(config)["problems"]
+        
+        assert "CLAUDE.md was modified" in problems
+        assert "commands/sc/build.md is missing" in problems
+    
+    def test_progress_bar_counts_copied_bytes(self, mock_claude_dir: Path, old: Path):
+        """Test installs can report copied bytes and show a progress bar."""
+        store = GenerationStore(mock_claude_dir)
+        seen = []
+        
+        store.install(targets(old), on_progress=seen.append, progress=True)
+        
+        assert sum(seen) == sum(len(text) for text in expected(old).values())
+    
+    def test_rollback_flips_current_and_previous(
+        self, mock_claude_dir: Path, old: Path, new: Path
+    ):
+        """Test rollback restores the previous install and can be undone."""
+        store = GenerationStore(mock_claude_dir)
+        first = store.install(targets(old))
+        second = store.install(targets(new))
+        
+        assert store.rollback() == first
+        assert installed(mock_claude_dir) == expected(old)
+        assert store.previous() == second
+        
+        assert store.rollback() == second
+        assert installed(mock_claude_dir) == expected(new)
+    
+    def test_rollback_removes_links_only_the_newer_install_had(
+        self, mock_claude_dir: Path, old: Path, new: Path
+    ):
+        """Test paths added by an update are unlinked again by rollback."""
+        (new / "agents").mkdir()
+        (new / "agents" / "reviewer.md").write_text("review")
+        store = GenerationStore(mock_claude_dir)
+        store.install(targets(old))
+        store.install({**targets(new), "agents": new / "agents"})
+        assert (mock_claude_dir / "agents" / "reviewer.md").read_text() == "review"
+        
+        store.rollback()
+        
+        assert not os.path.lexists(mock_claude_dir / "agents")
+        assert installed(mock_claude_dir) == expected(old)
+        
+        store.rollback()
+        assert (mock_claude_dir / "agents" / "reviewer.md").read_text() == "review"
+        store.install(targets(new))
+        assert not os.path.lexists(mock_claude_dir / "agents")
+    
+    def test_rollback_without_previous_fails(self, mock_claude_dir: Path, old: Path):
+        """Test rollback needs two installs."""
+        store = GenerationStore(mock_claude_dir)
+        store.install(targets(old))
+        
+        with pytest.raises(RuntimeError, match="No previous installation"):
+            store.rollback()
+    
+    def test_prune_keeps_two_generations(self, mock_claude_dir: Path, old: Path, new: Path):
+        """Test older generations are deleted after an install."""
+        store = GenerationStore(mock_claude_dir)
+        for source in (old, new, old):
+            store.install(targets(source))
+        
+        assert store.generations() == ["000002", "000003"]
+    
+    def test_existing_files_are_moved_aside(self, mock_claude_dir: Path, old: Path):
+        """Test a pre-existing real directory is backed up, not deleted."""
+        legacy = mock_claude_dir / "commands" / "sc"
+        legacy.mkdir(parents=True)
+        (legacy / "mine.md").write_text("mine")
+        
+        store = GenerationStore(mock_claude_dir)
+        store.install(targets(old))
+        
+        assert installed(mock_claude_dir) == expected(old)
+        assert (store.backup_dir / "commands" / "sc" / "mine.md").read_text() == "mine"
+    
+    def test_modified_file_is_not_reused(self, mock_claude_dir: Path, old: Path):
+        """Test a file edited through the link is copied fresh, not hard-linked."""
+        store = GenerationStore(mock_claude_dir)
+        store.install(targets(old))
+        edited = mock_claude_dir / "commands" / "sc" / "analyze.md"
+        edited.write_text("edited!")
+        
+        store.install(targets(old))
+        
+        assert edited.read_text() == "analyze"
+    
+    def test_concurrent_stages_do_not_collide(
+        self, mock_claude_dir: Path, old: Path, new: Path
+    ):
+        """Test parallel installers get distinct, complete generations."""
+        staged: List[str] = []
+        errors: List[Exception] = []
+        
+        def stage(source: Path) -> None:
+            try:
+                staged.append(GenerationStore(mock_claude_dir).stage(targets(source)))
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+        
+        threads = [threading.Thread(target=stage, args=(s,)) for s in (old, new) * 3]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        store = GenerationStore(mock_claude_dir)
+        assert errors == []
+        assert sorted(staged) == store.generations()
+        assert len(set(staged)) == 6
+        for generation in staged:
+            manifest = store.manifest(generation)
+            assert all(manifest.is_intact(path) for path in manifest.files())
+    
+    def test_crash_at_any_step_leaves_a_complete_install(
+        self, temp_dir: Path, old: Path, new: Path
+    ):
+        """Test killing an update at every step leaves the old or new install."""
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        outcomes = set()
+        for crash_at in range(1, 500):
+            claude_dir = temp_dir / f"claude-{crash_at}"
+            proc = subprocess.run(
+                [sys.executable, "-c", CRASH_SCRIPT, str(claude_dir), str(old), str(new)]
+                + [str(crash_at)],
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+            assert proc.returncode in (0, 17), proc.stderr
+            
+            seen = installed(claude_dir)
+            assert seen in (expected(old), expected(new)), f"crash at step {crash_at}"
+            outcomes.add("new" if seen == expected(new) else "old")
+            
+            store = GenerationStore(claude_dir)
+            store.install(targets(new))
+            assert installed(claude_dir) == expected(new)
+            if proc.returncode == 0:
+                break
+        else:
+            pytest.fail("Install never completed")
+        
+        assert outcomes == {"old", "new"}
+        assert crash_at > 10
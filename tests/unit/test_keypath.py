@@ -0,0 +1,55 @@
+"""Tests for dotted-key access."""
+
+import pytest
+
+from superclaude_pro.core.keypath import (
+    compile_keys,
+    get_many,
+    get_path,
+    parse_key,
+    set_path,
+)
+
+
+class TestKeyPath:
+    """Test keypath helpers."""
+    
+    def test_parse_key_is_memoized(self):
+        """Test parsing the same key twice returns the cached path."""
+        assert parse_key("a.b.c") == ("a", "b", "c")
+        assert parse_key("a.b.c") is parse_key("a.b.c")
+    
+    def test_get_path(self):
+        """Test getting nested and missing values."""
+        data = {"a": {"b": 1}, "s": "text"}
+        
+        assert get_path(data, ("a", "b")) == 1
+        assert get_path(data, ("a", "x"), "default") == "default"
+        assert get_path(data, ("s", "x")) is None
+    
+    def test_set_path_creates_parents(self):
+        """Test missing parents are created as dicts."""
+        data = {"a": {"keep": True}}
+        set_path(data, ("a", "b", "c"), 1)
+        
+        assert data == {"a": {"keep": True, "b": {"c": 1}}}
+    
+    def test_set_path_rejects_non_dict_parent(self):
+        """Test setting below a list raises TypeError naming the parent."""
+        data = {"servers": ["one"]}
+        
+        with pytest.raises(TypeError, match="'servers' is a list"):
+            set_path(data, ("servers", "name"), "x")
+        assert data == {"servers": ["one"]}
+    
+    def test_get_many_shares_prefixes(self):
+        """Test bulk lookups, including overlapping keys."""
+        data = {"a": {"b": {"c": 1}, "d": 2}}
+        
+        assert get_many(data, ["a.b.c", "a.d", "a.b", "x.y"]) == {
+            "a.b.c": 1,
+            "a.d": 2,
+            "a.b": {"c": 1},
+            "x.y": None,
+        }
+        assert list(compile_keys(("a.b", "a.c"))) == ["a"]
@@ -0,0 +1,69 @@
+"""Tests for logging setup."""
+
+import logging
+import logging.handlers
+from pathlib import Path
+
+from superclaude_pro.utils import logger as logger_module
+from superclaude_pro.utils.logger import setup_logging, shutdown_logging
+
+
+class TestSetupLogging:
+    """Test setup_logging function."""
+    
+    def teardown_method(self):
+        shutdown_logging()
+    
+    def test_direct_mode_attaches_handlers(self, temp_dir: Path):
+        """Test the default mode writes from the caller's thread."""
+        setup_logging(log_file=temp_dir / "app.log")
+        
+        root = logging.getLogger()
+        assert not any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers)
+        assert logger_module._listener is None
+    
+    def test_background_mode_writes_after_shutdown(self, temp_dir: Path):
+        """Test queued records, including tracebacks, reach the handlers."""
+        log_file = temp_dir / "app.log"
+        setup_logging(log_file=log_file, background=True)
+        
+        root = logging.getLogger()
+        assert [type(h).__name__ for h in root.handlers] == ["_LocalQueueHandler"]
+        
+        log = logging.getLogger("test")
+        log.info("value is %d", 42)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            log.exception("failed")
+        shutdown_logging()
+        
+        contents = log_file.read_text()
+        assert "value is 42" in contents
+        assert "ValueError: boom" in contents
+        assert logger_module._listener is None
+    
+    def test_reconfiguring_stops_previous_listener(self, temp_dir: Path):
+        """Test calling setup again does not leak listener threads."""
+        setup_logging(background=True)
+        first = logger_module._listener
+        setup_logging(background=True)
+        
+        assert first is not None
+        assert first._thread is None
+        assert logger_module._listener is not first
+    
+    def test_reconfiguring_closes_previous_handlers(self, temp_dir: Path):
+        """Test switching from background to direct mode closes the old file."""
+        setup_logging(log_file=temp_dir / "first.log", background=True)
+        first = [
+            h for h in logger_module._listener.handlers
+            if isinstance(h, logging.FileHandler)
+        ]
+        setup_logging(log_file=temp_dir / "second.log")
+        
+        root = logging.getLogger()
+        files = [h for h in root.handlers if isinstance(h, logging.FileHandler)]
+        assert [Path(h.baseFilename).name for h in files] == ["second.log"]
+        assert len(first) == 1
+        assert first[0].stream is None
@@ -0,0 +1,277 @@
+"""Tests for MCP server probing and connection management."""
+
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+
+from superclaude_pro.core.config import Config
+from superclaude_pro.mcp import (
+    KNOWN_SERVERS,
+    MCPError,
+    MCPManager,
+    ServerSpec,
+    probe_servers,
+    server_specs,
+)
+from superclaude_pro.mcp.transport import Connection
+
+STUB = str(Path(__file__).resolve().parents[1] / "mcp_stub.py")
+
+
+def stub(name: str, *args: str, timeout: Any = None) -> ServerSpec:
+    """Spec of a stand-in stdio server."""
+    return ServerSpec(name, command=(sys.executable, STUB, *args), timeout=timeout)
+
+
+def run(coro: Any) -> Any:
+    """Run a coroutine to completion."""
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def http_stub(temp_dir: Path) -> Iterator[str]:
+    """URL of a stand-in HTTP server."""
+    log = temp_dir / "http.log"
+    process = subprocess.Popen(
+        [sys.executable, STUB, "--http", "--log", str(log)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        port = int(process.stdout.readline())  # type: ignore[union-attr]
+        yield f"http://127.0.0.1:{port}/mcp"
+    finally:
+        process.kill()
+        process.wait()
+
+
+class TestServerSpecs:
+    """Test server definitions from config."""
+    
+    def test_defaults_use_known_servers(self, config: Config) -> None:
+        """Test that the default servers resolve to built-in definitions."""
+        specs = server_specs(config)
+        assert [spec.name for spec in specs] == config.get("mcp_servers")
+        assert specs[0] == KNOWN_SERVERS["context7"]
+        assert specs[0].transport == "stdio"
+    
+    def test_overrides_and_custom_servers(self, config: Config) -> None:
+        """Test that mcp.servers overrides and defines servers."""
+        config.set("mcp_servers", ["context7", "remote", "broken"])
+        config.set("mcp.servers", {
+            "context7": {"command": "node ctx.js", "timeout": 3},
+            "remote": {"url": "http://localhost:1/mcp", "headers": {"X-Key": "k"}},
+            "broken": {"env": {"A": "1"}},
+        })
+        context7, remote = server_specs(config)
+        assert context7.command == ("node", "ctx.js")
+        assert context7.timeout == 3
+        assert remote.transport == "http"
+        assert remote.headers == {"X-Key": "k"}
+    
+    def test_string_commands_are_split_like_a_shell(self) -> None:
+        """Test that quoted arguments in a command string stay whole."""
+        spec = ServerSpec.from_dict("x", {"command": "node 'my server.js' --port 1"})
+        assert spec.command == ("node", "my server.js", "--port", "1")
+    
+    def test_project_file_cannot_define_servers(
+        self, config: Config, temp_dir: Path
+    ) -> None:
+        """Test that a checked-out project cannot choose commands to run."""
+        config.set("mcp_servers", ["context7", "mine"])
+        config.set("mcp.servers", {"mine": {"command": ["my-server"]}})
+        (temp_dir / ".superclaude.json").write_text(json.dumps({
+            "mcp_servers": ["pwn"],
+            "mcp": {"servers": {
+                "pwn": {"command": "touch PWNED"},
+                "context7": {"command": "touch PWNED"},
+                "mine": {"env": {"A": "1"}},
+            }},
+        }))
+        assert config.source("mcp_servers") == "project"
+        
+        specs = server_specs(config)
+        assert specs == [
+            KNOWN_SERVERS["context7"],
+            ServerSpec("mine", command=("my-server",)),
+        ]
+    
+    def test_from_dict_requires_command_or_url(self) -> None:
+        """Test that a spec without a way to reach the server is rejected."""
+        with pytest.raises(ValueError):
+            ServerSpec.from_dict("x", {})
+
+
+class TestMCPManager:
+    """Test concurrent probing, timeouts, caching and reuse."""
+    
+    def test_probes_run_concurrently(self) -> None:
+        """Test that startup takes about as long as the slowest server."""
+        specs = [stub(f"s{i}", "--delay", "0.5") for i in range(4)]
+        
+        async def probe() -> List[Any]:
+            async with MCPManager(specs) as manager:
+                return await manager.probe_all()
+        
+        start = time.perf_counter()
+        statuses = run(probe())
+        elapsed = time.perf_counter() - start
+        assert [status.name for status in statuses] == ["s0", "s1", "s2", "s3"]
+        assert all(status.healthy for status in statuses)
+        assert statuses[0].tools == ["echo", "add"]
+        assert statuses[0].version == "1.0.0"
+        # Sequential startup would take at least 2s
+        assert elapsed < 1.8
+    
+    def test_hanging_server_times_out_alone(self) -> None:
+        """Test that a hanging server fails without holding up the others."""
+        specs = [stub("ok"), stub("stuck", "--hang", timeout=0.5), ServerSpec(
+            "missing", command=("/nonexistent/mcp-server",)
+        )]
+        
+        async def probe() -> Any:
+            async with MCPManager(specs, timeout=5.0) as manager:
+                statuses = await manager.probe_all()
+                return statuses, manager.connection("stuck")
+        
+        start = time.perf_counter()
+        (ok, stuck, missing), connection = run(probe())
+        assert time.perf_counter() - start < 4.0
+        assert ok.healthy
+        assert not stuck.healthy and "timed out" in (stuck.error or "")
+        assert not missing.healthy and missing.error
+        assert connection is None
+    
+    def test_handshake_cache_skips_tools_list(self, temp_dir: Path) -> None:
+        """Test that a known server version is not asked for its tools again."""
+        log = temp_dir / "calls.log"
+        cache = temp_dir / "mcp-cache.json"
+        
+        async def probe(version: str) -> Any:
+            spec = stub("srv", "--log", str(log), "--version", version)
+            async with MCPManager([spec], cache_path=cache) as manager:
+                return (await manager.probe_all())[0]
+        
+        first = run(probe("1.0.0"))
+        second = run(probe("1.0.0"))
+        assert not first.cached and second.cached
+        assert second.tools == first.tools
+        assert log.read_text().count("tools/list") == 1
+        assert "srv@1.0.0" in json.loads(cache.read_text())
+        
+        upgraded = run(probe("2.0.0"))
+        assert not upgraded.cached
+        assert log.read_text().count("tools/list") == 2
+        assert list(json.loads(cache.read_text())) == ["srv@2.0.0"]
+    
+    def test_connections_are_reused(self, temp_dir: Path) -> None:
+        """Test that probing again pings the running server process."""
+        log = temp_dir / "calls.log"
+        
+        async def probe_twice() -> Any:
+            async with MCPManager([stub("srv", "--log", str(log))]) as manager:
+                first = await manager.probe_all()
+                pid = manager.connection("srv").pid  # type: ignore[union-attr]
+                await asyncio.gather(manager.probe("srv"), manager.probe("srv"))
+                result = await manager.call_tool("srv", "add", {"a": 2, "b": 3})
+                return first, pid, manager.connection("srv").pid, result  # type: ignore
+        
+        first, pid, later_pid, result = run(probe_twice())
+        assert first[0].healthy
+        assert pid == later_pid
+        assert result["content"][0]["text"] == "5"
+        methods = [line.split()[1] for line in log.read_text().splitlines()]
+        assert methods.count("initialize") == 1
+        assert methods.count("ping") == 2
+        assert {line.split()[0] for line in log.read_text().splitlines()} == {str(pid)}
+    
+    def test_concurrent_connects_start_one_process(self, temp_dir: Path) -> None:
+        """Test that simultaneous users of a server share one start."""
+        log = temp_dir / "calls.log"
+        
+        async def connect() -> Any:
+            async with MCPManager([stub("srv", "--log", str(log))]) as manager:
+                return await asyncio.gather(*(manager.connect("srv") for _ in range(5)))
+        
+        connections = run(connect())
+        assert all(connection is connections[0] for connection in connections)
+        methods = [line.split()[1] for line in log.read_text().splitlines()]
+        assert methods.count("initialize") == 1
+    
+    def test_timed_out_connect_is_not_reused(self, temp_dir: Path) -> None:
+        """Test that a connect after a timeout starts and initializes afresh."""
+        log = temp_dir / "calls.log"
+        
+        async def connect() -> Any:
+            spec = stub("srv", "--log", str(log), "--delay", "0.5")
+            async with MCPManager([spec], timeout=0.2) as manager:
+                with pytest.raises(asyncio.TimeoutError):
+                    await manager.connect("srv")
+                assert manager.connection("srv") is None
+                manager.timeout = 5.0
+                connection = await manager.connect("srv")
+                return connection.pid, await connection.request("ping")  # type: ignore
+        
+        pid, pong = run(connect())
+        assert pong == {}
+        calls = [line.split() for line in log.read_text().splitlines()]
+        initialized = [call[0] for call in calls if call[1] == "initialize"]
+        assert len(initialized) == 2
+        assert initialized[-1] == str(pid) != initialized[0]
+        assert [str(pid), "notifications/initialized"] in calls
+    
+    def test_connection_is_abstract(self) -> None:
+        """Test that a transport must implement request and notify."""
+        with pytest.raises(TypeError):
+            Connection(stub("srv"))  # type: ignore[abstract]
+    
+    def test_errors_are_raised_from_calls(self) -> None:
+        """Test that server errors surface as MCPError."""
+        
+        async def call() -> None:
+            async with MCPManager([stub("srv")]) as manager:
+                connection = await manager.connect("srv")
+                await connection.request("resources/list")
+        
+        with pytest.raises(MCPError) as info:
+            run(call())
+        assert info.value.code == -32601
+    
+    def test_http_transport(self, http_stub: str) -> None:
+        """Test probing and calling a server over streamable HTTP."""
+        spec = ServerSpec("remote", url=http_stub)
+        
+        async def probe() -> Any:
+            async with MCPManager([spec]) as manager:
+                (status,) = await manager.probe_all()
+                again = await manager.probe("remote")
+                result = await manager.call_tool("remote", "echo", {"x": 1})
+                session = manager.connection("remote").session_id  # type: ignore
+                return status, again, result, session
+        
+        status, again, result, session = run(probe())
+        assert status.healthy and status.tools == ["echo", "add"]
+        assert again.healthy
+        assert json.loads(result["content"][0]["text"]) == {"x": 1}
+        assert session == "stub-session"
+
+
+class TestProbeServers:
+    """Test the synchronous entry point."""
+    
+    def test_probe_servers_uses_config(self, config: Config) -> None:
+        """Test that configured servers are probed and the cache is written."""
+        config.set("mcp_servers", ["a", "b"])
+        config.set("mcp.servers", {
+            "a": {"command": [sys.executable, STUB]},
+            "b": {"command": [sys.executable, STUB, "--hang"]},
+        })
+        a, b = probe_servers(config, timeout=0.5)
+        assert a.healthy and not b.healthy
+        assert (config.claude_dir / "superclaude.mcp-cache.json").exists()
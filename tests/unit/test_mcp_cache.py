@@ -0,0 +1,233 @@
+"""Tests for the MCP tool call result cache."""
+
+import asyncio
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import Mock
+
+from superclaude_pro.core.config import Config
+from superclaude_pro.mcp import MCPManager, ServerSpec, ToolCache, call_key
+from superclaude_pro.mcp.cache import RESULT_CACHE_FILE, TELEMETRY_NAME
+from superclaude_pro.telemetry.collector import TelemetryCollector
+
+STUB = str(Path(__file__).resolve().parents[1] / "mcp_stub.py")
+RESULT = {"content": [{"type": "text", "text": "docs"}]}
+
+
+class Clock:
+    """Settable time source."""
+    
+    def __init__(self) -> None:
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCallKey:
+    """Test content-addressed call keys."""
+    
+    def test_argument_order_does_not_matter(self) -> None:
+        """Test that equal arguments give equal keys."""
+        a = call_key("context7", "get-library-docs", {"id": "/react", "tokens": 5000})
+        b = call_key("context7", "get-library-docs", {"tokens": 5000, "id": "/react"})
+        assert a == b
+        assert len(a) == 64
+    
+    def test_server_tool_and_values_matter(self) -> None:
+        """Test that any difference in the call changes the key."""
+        base = call_key("s", "t", {"a": 1})
+        assert base != call_key("s", "u", {"a": 1})
+        assert base != call_key("r", "t", {"a": 1})
+        assert base != call_key("s", "t", {"a": "1"})
+        assert call_key("s", "t", None) == call_key("s", "t", {})
+
+
+class TestToolCache:
+    """Test TTLs, LRU eviction and the disk tier."""
+    
+    def test_only_tools_with_a_ttl_are_cached(self) -> None:
+        """Test per-tool and per-server TTLs, and that 0 disables caching."""
+        cache = ToolCache(ttls={"docs": 60, "docs/search": 0, "web/fetch": 5})
+        assert cache.ttl("docs", "get") == 60
+        assert cache.ttl("docs", "search") is None
+        assert cache.ttl("web", "fetch") == 5
+        assert cache.ttl("web", "post") is None
+        assert not cache.put("web", "post", {}, RESULT)
+        assert cache.get("web", "post", {}) is None
+        assert cache.stats()["misses"] == 0
+    
+    def test_entries_expire(self) -> None:
+        """Test that results are served until their TTL passes."""
+        clock = Clock()
+        cache = ToolCache(ttls={"docs": 60}, clock=clock)
+        cache.put("docs", "get", {"id": 1}, RESULT)
+        clock.now += 59
+        assert cache.get("docs", "get", {"id": 1}) == RESULT
+        clock.now += 2
+        assert cache.get("docs", "get", {"id": 1}) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+    
+    def test_least_recently_used_is_evicted(self) -> None:
+        """Test that the memory tier keeps the most recently used results."""
+        cache = ToolCache(ttls={"docs": 60}, max_entries=2)
+        cache.put("docs", "get", {"id": 1}, {"n": 1})
+        cache.put("docs", "get", {"id": 2}, {"n": 2})
+        cache.get("docs", "get", {"id": 1})
+        cache.put("docs", "get", {"id": 3}, {"n": 3})
+        assert cache.get("docs", "get", {"id": 2}) is None
+        assert cache.get("docs", "get", {"id": 1}) == {"n": 1}
+        assert cache.get("docs", "get", {"id": 3}) == {"n": 3}
+        assert cache.stats()["evictions"] == 1
+    
+    def test_errors_are_not_cached(self) -> None:
+        """Test that results flagged as errors are not kept."""
+        cache = ToolCache(ttls={"docs": 60})
+        assert not cache.put("docs", "get", {}, {"isError": True, "content": []})
+        assert cache.get("docs", "get", {}) is None
+    
+    def test_disk_tier_outlives_the_process(self, temp_dir: Path) -> None:
+        """Test that a new cache on the same file serves stored results."""
+        clock = Clock()
+        path = temp_dir / RESULT_CACHE_FILE
+        first = ToolCache(ttls={"docs": 60}, path=path, clock=clock)
+        first.put("docs", "get", {"id": 1}, RESULT)
+        first.close()
+        
+        second = ToolCache(ttls={"docs": 60}, path=path, clock=clock)
+        assert second.get("docs", "get", {"id": 1}) == RESULT
+        clock.now += 61
+        third = ToolCache(ttls={"docs": 60}, path=path, clock=clock)
+        assert third.get("docs", "get", {"id": 1}) is None
+    
+    def test_disk_tier_is_bounded(self, temp_dir: Path) -> None:
+        """Test that the disk tier drops the least recently used rows."""
+        clock = Clock()
+        path = temp_dir / RESULT_CACHE_FILE
+        cache = ToolCache(ttls={"docs": 60}, path=path, max_disk_entries=3, clock=clock)
+        for n in range(5):
+            clock.now += 1
+            cache.put("docs", "get", {"id": n}, {"n": n})
+        cache.close()
+        
+        rows = sqlite3.connect(str(path)).execute("SELECT COUNT(*) FROM results")
+        assert rows.fetchone()[0] == 3
+        fresh = ToolCache(ttls={"docs": 60}, path=path, clock=clock)
+        assert fresh.get("docs", "get", {"id": 0}) is None
+        assert fresh.get("docs", "get", {"id": 4}) == {"n": 4}
+    
+    def test_disk_tier_is_trimmed_through_an_index(self, temp_dir: Path) -> None:
+        """Test that trimming by access time does not sort the whole table."""
+        path = temp_dir / RESULT_CACHE_FILE
+        cache = ToolCache(ttls={"docs": 60}, path=path, max_disk_entries=3)
+        cache.put("docs", "get", {}, RESULT)
+        cache.close()
+        
+        plan = sqlite3.connect(str(path)).execute(
+            "EXPLAIN QUERY PLAN SELECT key FROM results ORDER BY accessed DESC"
+        ).fetchall()
+        assert "results_accessed" in " ".join(str(row[-1]) for row in plan)
+    
+    def test_unusable_database_falls_back_to_memory(self, temp_dir: Path) -> None:
+        """Test that a corrupt database file does not break caching."""
+        path = temp_dir / RESULT_CACHE_FILE
+        path.write_bytes(b"not a database" * 100)
+        cache = ToolCache(ttls={"docs": 60}, path=path)
+        assert cache.put("docs", "get", {}, RESULT)
+        assert cache.get("docs", "get", {}) == RESULT
+    
+    def test_for_config(self, config: Config) -> None:
+        """Test that mcp.cache settings configure the cache."""
+        config.set("mcp.cache", {
+            "ttl": {"context7": 0, "docs/get": 30},
+            "persist": False,
+        })
+        cache = ToolCache.for_config(config)
+        assert cache.ttls == {"docs/get": 30.0}
+        assert cache.path is None
+        assert ToolCache.for_config(Config(claude_dir=config.claude_dir / "x")).path
+    
+    def test_report_sends_deltas(self) -> None:
+        """Test that each report carries only the counts since the last one."""
+        collector = Mock()
+        cache = ToolCache(ttls={"docs": 60})
+        cache.get("docs", "get", {})
+        cache.put("docs", "get", {}, RESULT)
+        cache.get("docs", "get", {})
+        cache.report(collector)
+        cache.report(collector)
+        cache.get("docs", "get", {})
+        cache.report(collector)
+        assert [c.args for c in collector.track_cache.call_args_list] == [
+            (TELEMETRY_NAME, 1, 1, 0),
+            (TELEMETRY_NAME, 1, 0, 0),
+        ]
+
+
+class TestManagerResultCache:
+    """Test tool calls through the manager's result cache."""
+    
+    def test_repeated_calls_hit_the_cache(self, config: Config) -> None:
+        """Test that cached calls skip the server and are reported."""
+        log = config.claude_dir / "calls.log"
+        config.set("settings.telemetry", True)
+        collector = TelemetryCollector(config)
+        spec = ServerSpec("docs", command=(sys.executable, STUB, "--log", str(log)))
+        cache = ToolCache(ttls={"docs/echo": 60}, path=config.claude_dir / "r.db")
+        
+        async def call() -> List[Any]:
+            manager = MCPManager([spec], result_cache=cache, telemetry=collector)
+            async with manager:
+                calls = [("echo", {"q": 1})] * 3 + [("add", {"a": 1})] * 2
+                results = []
+                for tool, arguments in calls:
+                    results.append(await manager.call_tool("docs", tool, arguments))
+                return results
+        
+        results = asyncio.run(call())
+        assert results[0] == results[2]
+        assert results[3]["content"][0]["text"] == "1"
+        assert log.read_text().count("tools/call") == 3
+        summary = collector.get_metrics_summary()
+        assert summary["caches"][TELEMETRY_NAME]["hits"] == 2
+        assert summary["caches"][TELEMETRY_NAME]["misses"] == 1
+    
+    def test_for_config_reports_to_telemetry(self, config: Config) -> None:
+        """Test that a configured manager reports cache counts when enabled."""
+        config.set("mcp_servers", ["docs"])
+        config.set("mcp.servers", {"docs": {"command": [sys.executable, STUB]}})
+        config.set("mcp.cache", {"ttl": {"docs": 60}, "persist": False})
+        assert MCPManager.for_config(config).telemetry is None
+        config.set("settings.telemetry", True)
+        
+        async def call() -> None:
+            async with MCPManager.for_config(config) as manager:
+                assert manager.telemetry is not None
+                for _ in range(3):
+                    await manager.call_tool("docs", "echo", {"q": 1})
+        
+        asyncio.run(call())
+        summary = TelemetryCollector(config).get_metrics_summary()
+        assert summary["caches"][TELEMETRY_NAME]["hits"] == 2
+        assert summary["caches"][TELEMETRY_NAME]["misses"] == 1
+    
+    def test_identical_calls_in_flight_share_a_request(self, temp_dir: Path) -> None:
+        """Test that concurrent identical calls send one request."""
+        log = temp_dir / "calls.log"
+        spec = ServerSpec("docs", command=(sys.executable, STUB, "--log", str(log)))
+        cache = ToolCache(ttls={"docs": 60})
+        
+        async def call() -> List[Any]:
+            async with MCPManager([spec], result_cache=cache) as manager:
+                await manager.connect("docs")
+                return await asyncio.gather(
+                    *(manager.call_tool("docs", "echo", {"q": 1}) for _ in range(5))
+                )
+        
+        results = asyncio.run(call())
+        assert all(result == results[0] for result in results)
+        assert log.read_text().count("tools/call") == 1
+        assert cache.stats()["hits"] == 4
@@ -0,0 +1,275 @@
+"""Tests for the orchestrator task scheduler."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, List
+
+import pytest
+
+from superclaude_pro.core.config import Config
+from superclaude_pro.orchestrator import (
+    CANCELLED,
+    DONE,
+    FAILED,
+    SKIPPED,
+    CycleError,
+    Scheduler,
+    critical_path,
+    topological_order,
+)
+
+
+def sleeper(seconds: float, value: Any = None) -> Callable[[], Any]:
+    """Task function that sleeps and returns ``value``."""
+    
+    def run() -> Any:
+        time.sleep(seconds)
+        return value
+    
+    return run
+
+
+class Recorder:
+    """Task functions that record when they start and how many overlap."""
+    
+    def __init__(self) -> None:
+        """Initialize recorder."""
+        self.started: List[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+    
+    def task(self, name: str, seconds: float = 0.0) -> Callable[[], str]:
+        """Task function that sleeps for ``seconds`` and returns ``name``."""
+        
+        def run() -> str:
+            with self._lock:
+                self.started.append(name)
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(seconds)
+            with self._lock:
+                self.active -= 1
+            return name
+        
+        return run
+
+
+class TestGraph:
+    """Test ordering, validation and critical paths."""
+    
+    def test_topological_order_respects_deps_and_priority(self) -> None:
+        """Test that tasks follow their dependencies, best priority first."""
+        deps = {"a": (), "b": (), "c": ("a",), "d": ("b", "c")}
+        assert topological_order(deps) == ["a", "b", "c", "d"]
+        assert topological_order(deps, {"b": 1}) == ["b", "a", "c", "d"]
+        assert topological_order(deps, {"c": 5})[:2] == ["a", "c"]
+    
+    def test_cycle_is_reported(self) -> None:
+        """Test that a cycle names the tasks along it."""
+        deps = {"a": ("c",), "b": ("a",), "c": ("b",), "d": ()}
+        with pytest.raises(CycleError) as info:
+            topological_order(deps)
+        cycle = info.value.cycle
+        assert cycle[0] == cycle[-1]
+        assert set(cycle) == {"a", "b", "c"}
+        for first, then in zip(cycle, cycle[1:]):
+            assert first in deps[then]
+    
+    def test_unknown_dependency(self) -> None:
+        """Test that depending on a missing task is rejected before running."""
+        scheduler = Scheduler()
+        scheduler.add("a", sleeper(0), deps=["missing"])
+        with pytest.raises(ValueError, match="missing"):
+            scheduler.run()
+    
+    def test_duplicate_task(self) -> None:
+        """Test that task names are unique."""
+        scheduler = Scheduler()
+        scheduler.add("a", sleeper(0))
+        with pytest.raises(ValueError, match="Duplicate"):
+            scheduler.add("a", sleeper(0))
+    
+    def test_critical_path(self) -> None:
+        """Test that the longest weighted chain is found."""
+        deps = {"a": (), "b": (), "c": ("a", "b"), "d": ("a",)}
+        length, path = critical_path(deps, {"a": 1, "b": 5, "c": 2, "d": 3})
+        assert (length, path) == (7, ["b", "c"])
+        assert critical_path({}, {}) == (0.0, [])
+
+
+class TestScheduler:
+    """Test execution on threads."""
+    
+    def test_runs_dag_in_parallel(self) -> None:
+        """Test that independent branches overlap and dependencies wait."""
+        recorder = Recorder()
+        scheduler = Scheduler(max_workers=4)
+        for name in ("a", "b", "c"):
+            scheduler.add(name, recorder.task(name, 0.2))
+        scheduler.add("d", recorder.task("d", 0.1), deps=["a", "b", "c"])
+        
+        report = scheduler.run()
+        
+        assert report.ok
+        assert report.results() == {"a": "a", "b": "b", "c": "c", "d": "d"}
+        assert recorder.started[-1] == "d"
+        assert recorder.peak == 3
+        assert report.wall_ms < 500
+        d = report.tasks["d"]
+        assert d.started_ms >= max(  # type: ignore[operator]
+            report.tasks[name].finished_ms for name in "abc"  # type: ignore[type-var]
+        )
+        assert report.critical_path()[1][-1] == "d"
+        assert report.wall_ms >= report.lower_bound_ms()
+    
+    def test_concurrency_limit_and_priority(self) -> None:
+        """Test that at most max_workers run and priority picks who goes first."""
+        recorder = Recorder()
+        scheduler = Scheduler(max_workers=2)
+        for name, priority in (("low", 0), ("mid", 1), ("high", 2), ("top", 3)):
+            scheduler.add(name, recorder.task(name, 0.05), priority=priority)
+        
+        report = scheduler.run()
+        
+        assert recorder.peak == 2
+        assert report.peak_workers == 2
+        assert set(recorder.started[:2]) == {"top", "high"}
+        assert report.order == ["top", "high", "mid", "low"]
+        assert report.tasks["low"].queued_ms > 40  # type: ignore[operator]
+    
+    def test_failure_skips_dependents_only(self) -> None:
+        """Test that a failure skips what depends on it and nothing else."""
+        
+        def boom() -> None:
+            raise RuntimeError("boom")
+        
+        scheduler = Scheduler(max_workers=2)
+        scheduler.add("bad", boom)
+        scheduler.add("after", sleeper(0), deps=["bad"])
+        scheduler.add("later", sleeper(0), deps=["after"])
+        scheduler.add("good", sleeper(0.05, "ok"))
+        scheduler.add("joined", sleeper(0), deps=["good", "bad"])
+        
+        report = scheduler.run()
+        
+        assert not report.ok
+        states = {name: task.state for name, task in report.tasks.items()}
+        assert states == {
+            "bad": FAILED,
+            "after": SKIPPED,
+            "later": SKIPPED,
+            "good": DONE,
+            "joined": SKIPPED,
+        }
+        assert str(report.failed()["bad"]) == "boom"
+    
+    def test_fail_fast_cancels_the_rest(self) -> None:
+        """Test that fail_fast stops starting tasks after a failure."""
+        
+        def boom() -> None:
+            raise RuntimeError("boom")
+        
+        scheduler = Scheduler(max_workers=1, fail_fast=True)
+        scheduler.add("bad", boom, priority=1)
+        scheduler.add("other", sleeper(0))
+        
+        report = scheduler.run()
+        
+        assert report.tasks["bad"].state == FAILED
+        assert report.tasks["other"].state == CANCELLED
+    
+    def test_cancel_from_a_task(self) -> None:
+        """Test that cancel() lets running tasks finish but starts no more."""
+        scheduler = Scheduler(max_workers=1)
+        
+        def stop() -> str:
+            scheduler.cancel()
+            return "stopped"
+        
+        scheduler.add("stop", stop)
+        scheduler.add("next", sleeper(0), deps=["stop"])
+        scheduler.add("other", sleeper(0))
+        
+        report = scheduler.run()
+        
+        assert report.tasks["stop"].state == DONE
+        assert report.tasks["next"].state == CANCELLED
+        assert report.tasks["other"].state == CANCELLED
+        # A new run starts afresh
+        assert not Scheduler().cancelled
+    
+    def test_to_dict(self) -> None:
+        """Test that reports serialize with timing per task."""
+        scheduler = Scheduler()
+        scheduler.add("a", sleeper(0.01))
+        data = scheduler.run().to_dict()
+        assert data["ok"]
+        assert data["critical_path"] == ["a"]
+        assert data["tasks"][0]["duration_ms"] >= 10
+    
+    def test_for_config(self, config: Config) -> None:
+        """Test that the worker limit comes from the config."""
+        config.set("orchestrator.max_workers", 7)
+        assert Scheduler.for_config(config).max_workers == 7
+        with pytest.raises(ValueError):
+            Scheduler(max_workers=0)
+
+
+class TestAsyncScheduler:
+    """Test execution on an event loop."""
+    
+    def test_mixes_coroutines_and_functions(self) -> None:
+        """Test that coroutines and blocking functions run concurrently."""
+        
+        async def fetch() -> str:
+            await asyncio.sleep(0.2)
+            return "fetched"
+        
+        scheduler = Scheduler(max_workers=3)
+        scheduler.add("fetch", fetch)
+        scheduler.add("blocking", sleeper(0.2, "blocked"))
+        scheduler.add("both", sleeper(0, "done"), deps=["fetch", "blocking"])
+        
+        report = asyncio.run(scheduler.run_async())
+        
+        assert report.results() == {
+            "fetch": "fetched",
+            "blocking": "blocked",
+            "both": "done",
+        }
+        assert report.wall_ms < 380
+    
+    def test_cancel_stops_running_coroutines(self) -> None:
+        """Test that cancel() cancels coroutines that are still running."""
+        scheduler = Scheduler(max_workers=2)
+        
+        async def stop() -> None:
+            await asyncio.sleep(0.05)
+            scheduler.cancel()
+        
+        async def slow() -> None:
+            await asyncio.sleep(10)
+        
+        scheduler.add("stop", stop)
+        scheduler.add("slow", slow)
+        scheduler.add("after", slow, deps=["slow"])
+        
+        start = time.perf_counter()
+        report = asyncio.run(scheduler.run_async())
+        
+        assert time.perf_counter() - start < 2
+        assert report.tasks["stop"].state == DONE
+        assert report.tasks["slow"].state == CANCELLED
+        assert report.tasks["after"].state in (CANCELLED, SKIPPED)
+    
+    def test_coroutines_on_threads(self) -> None:
+        """Test that run() also accepts coroutine functions."""
+        
+        async def value() -> int:
+            return 42
+        
+        scheduler = Scheduler()
+        scheduler.add("value", value)
+        assert scheduler.run().results() == {"value": 42}
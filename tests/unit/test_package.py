@@ -0,0 +1,38 @@
+"""Tests for the top-level package."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+import superclaude_pro
+
+
+class TestPackage:
+    """Test lazy package attributes."""
+    
+    def test_version(self):
+        """Test __version__ resolves to a string."""
+        assert isinstance(superclaude_pro.__version__, str)
+        assert superclaude_pro.__version__
+    
+    def test_version_matches_pyproject(self):
+        """Test the version literal is kept in step with pyproject.toml."""
+        pyproject = Path(__file__).parents[2] / "pyproject.toml"
+        if not pyproject.exists():
+            pytest.skip("not running from a source checkout")
+        match = re.search(r'^version = "([^"]+)"', pyproject.read_text(), re.M)
+        
+        assert match is not None
+        assert superclaude_pro.__version__ == match.group(1)
+    
+    def test_lazy_submodule(self):
+        """Test submodules are imported on attribute access."""
+        from superclaude_pro import core
+        
+        assert superclaude_pro.core is core
+    
+    def test_unknown_attribute(self):
+        """Test unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            superclaude_pro.does_not_exist
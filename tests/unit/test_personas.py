@@ -0,0 +1,112 @@
+"""Tests for persona auto-activation."""
+
+import fnmatch
+from pathlib import Path
+
+import pytest
+
+from superclaude_pro.personas import BUILTIN_PERSONAS, Persona, PersonaMatch, PersonaMatcher
+
+
+@pytest.fixture
+def matcher() -> PersonaMatcher:
+    """Create a matcher over the built-in personas."""
+    return PersonaMatcher(BUILTIN_PERSONAS)
+
+
+class TestPersonaMatcher:
+    """Test PersonaMatcher."""
+    
+    def test_builtin_personas(self):
+        """Test the eleven advertised personas are built in."""
+        assert len({persona.name for persona in BUILTIN_PERSONAS}) == 11
+    
+    @pytest.mark.parametrize("text, persona", [
+        ("I need to design a microservices architecture for an e-commerce platform", "architect"),
+        ("Review this authentication code for security vulnerabilities", "security"),
+        ("Create a responsive navigation component with dropdown menus", "frontend"),
+        ("Users report slow page load, find the bottlenecks", "performance"),
+    ])
+    def test_documented_examples(self, matcher: PersonaMatcher, text: str, persona: str):
+        """Test the examples from the docs activate the documented persona first."""
+        assert matcher.activate(text)[0].name == persona
+    
+    def test_keywords_count_once(self):
+        """Test repeating a keyword does not inflate the score."""
+        matcher = PersonaMatcher([Persona("a", keywords={"x": 1.5})], threshold=0)
+        
+        assert matcher.score("x X x") == {"a": 1.5}
+    
+    def test_file_patterns(self):
+        """Test name, extension, glob and path patterns."""
+        matcher = PersonaMatcher([
+            Persona("name", file_patterns=("Dockerfile",)),
+            Persona("ext", file_patterns=("*.d.ts",)),
+            Persona("glob", file_patterns=("test_*.py",)),
+            Persona("path", file_patterns=("docs/*",)),
+        ], threshold=0)
+        
+        assert matcher.score("", ["a/Dockerfile"]) == {"name": 2.0}
+        assert matcher.score("", ["src/x.d.ts"]) == {"ext": 2.0}
+        assert matcher.score("", ["tests/test_x.py", "src/x.ts"]) == {"glob": 2.0}
+        assert set(matcher.score("", ["pkg/docs/index.md", "docs/a.md"])) == {"path"}
+        assert matcher.score("", ["mydocs/a.md"]) == {}
+    
+    def test_globs_with_groups_of_their_own(self, monkeypatch: pytest.MonkeyPatch):
+        """Test globs are told apart when fnmatch adds capture groups.
+        
+        Python 3.9 and 3.10 translate globs with several stars into regexes
+        with groups, which must not shift the matcher's own groups.
+        """
+        translate = fnmatch.translate
+        monkeypatch.setattr(fnmatch, "translate", lambda p: f"(?:(x)|){translate(p)}")
+        matcher = PersonaMatcher([
+            Persona("tests", file_patterns=("test_*_*.py",)),
+            Persona("specs", file_patterns=("*_spec*.rb",)),
+            Persona("docs", file_patterns=("docs/*/*.txt",)),
+        ], threshold=0)
+        
+        assert matcher.score("", ["test_a_b.py"]) == {"tests": 2.0}
+        assert matcher.score("", ["lib/a_spec_b.rb"]) == {"specs": 2.0}
+        assert matcher.score("", ["docs/a/b.txt"]) == {"docs": 2.0}
+        assert matcher.score("", ["test_a.py", "a.rb"]) == {}
+    
+    def test_threshold_and_limit(self, matcher: PersonaMatcher):
+        """Test weak matches are dropped and results can be capped."""
+        text = "explain how to deploy the api with docker and test it"
+        
+        assert matcher.activate("how", threshold=None) == []
+        assert len(matcher.activate(text, limit=2)) == 2
+        assert len(matcher.activate(text)) > 2
+    
+    def test_activate_many(self, matcher: PersonaMatcher):
+        """Test batch scoring matches one-by-one scoring."""
+        contexts = [
+            "optimize the slow query",
+            ("fix the layout", ["src/App.tsx"]),
+            "optimize the slow query",
+            "nothing relevant",
+        ]
+        
+        results = matcher.activate_many(contexts)
+        
+        assert results[0] == matcher.activate("optimize the slow query")
+        assert results[1] == matcher.activate("fix the layout", ["src/App.tsx"])
+        assert results[2] == results[0] and results[2] is not results[0]
+        assert results[3] == []
+    
+    def test_from_directory(self, temp_dir: Path):
+        """Test persona files add personas and replace built-in ones."""
+        directory = temp_dir / "personas"
+        directory.mkdir()
+        (directory / "security.md").write_text(
+            "---\nkeywords: [\"cve:3\", audit]\nfile_patterns: [\"*.pem\"]\n---\n# Security\n"
+        )
+        (directory / "data.md").write_text("---\nkeywords: [pandas]\n---\nData science\n")
+        
+        matcher = PersonaMatcher.from_directory(directory, threshold=1.0)
+        
+        assert matcher.activate("check this cve") == [PersonaMatch("security", 3.0)]
+        assert matcher.activate("review for xss") == []
+        assert matcher.activate("pandas frame")[0].name == "data"
+        assert len(matcher.personas) == 12
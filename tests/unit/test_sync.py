@@ -0,0 +1,173 @@
+"""Tests for incremental file installation."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from superclaude_pro.core import sync
+from superclaude_pro.core.sync import Manifest, SyncResult, apply_sync, plan_sync
+from superclaude_pro.utils.progress import byte_progress
+
+
+def sync_tree(source: Path, dest: Path, manifest_path: Path, **kwargs) -> SyncResult:
+    """Plan and apply a sync, then save the manifest."""
+    manifest = Manifest.load(manifest_path)
+    plan = plan_sync(source, dest, manifest, **kwargs)
+    try:
+        return apply_sync(plan, manifest)
+    finally:
+        manifest.save()
+
+
+@pytest.fixture
+def source(temp_dir: Path) -> Path:
+    """Create a source tree to install."""
+    root = temp_dir / "source"
+    (root / "sub").mkdir(parents=True)
+    (root / "analyze.md").write_text("analyze")
+    (root / "build.md").write_text("build" * 100)
+    (root / "sub" / "deep.md").write_text("deep")
+    return root
+
+
+@pytest.fixture
+def dest(temp_dir: Path) -> Path:
+    """Get the install destination."""
+    return temp_dir / "claude" / "commands"
+
+
+@pytest.fixture
+def manifest_path(temp_dir: Path) -> Path:
+    """Get the manifest location."""
+    return temp_dir / "claude" / sync.MANIFEST_FILE
+
+
+class TestSync:
+    """Test planning and applying syncs."""
+    
+    def test_first_sync_copies_everything(self, source: Path, dest: Path, manifest_path: Path):
+        """Test an empty destination gets every file."""
+        result = sync_tree(source, dest, manifest_path, workers=4)
+        
+        assert len(result.copied) == 3
+        assert result.bytes_copied == len("analyze") + 500 + len("deep")
+        assert (dest / "sub" / "deep.md").read_text() == "deep"
+        assert len(Manifest.load(manifest_path).entries) == 3
+    
+    def test_resync_copies_nothing(self, source: Path, dest: Path, manifest_path: Path):
+        """Test unchanged files are neither rewritten nor re-read."""
+        sync_tree(source, dest, manifest_path)
+        
+        with patch.object(sync, "copy_file") as mock_copy:
+            result = sync_tree(source, dest, manifest_path)
+        
+        mock_copy.assert_not_called()
+        assert result.copied == []
+        assert len(result.unchanged) == 3
+    
+    def test_only_changed_files_are_copied(self, source: Path, dest: Path, manifest_path: Path):
+        """Test changed sources and tampered destinations are recopied."""
+        sync_tree(source, dest, manifest_path)
+        (source / "analyze.md").write_text("analyze v2")
+        (dest / "sub" / "deep.md").unlink()
+        
+        result = sync_tree(source, dest, manifest_path)
+        
+        assert sorted(p.name for p in result.copied) == ["analyze.md", "deep.md"]
+        assert (dest / "analyze.md").read_text() == "analyze v2"
+        assert (dest / "sub" / "deep.md").exists()
+    
+    def test_force_copies_everything(self, source: Path, dest: Path, manifest_path: Path):
+        """Test force ignores the manifest."""
+        sync_tree(source, dest, manifest_path)
+        
+        assert len(sync_tree(source, dest, manifest_path, force=True).copied) == 3
+    
+    def test_removed_sources_are_pruned(self, source: Path, dest: Path, manifest_path: Path):
+        """Test files no longer shipped are removed unless modified locally."""
+        sync_tree(source, dest, manifest_path)
+        (source / "analyze.md").unlink()
+        (source / "build.md").unlink()
+        (dest / "build.md").write_text("my local edits")
+        
+        result = sync_tree(source, dest, manifest_path)
+        
+        assert [p.name for p in result.removed] == ["analyze.md"]
+        assert not (dest / "analyze.md").exists()
+        assert (dest / "build.md").read_text() == "my local edits"
+        assert len(Manifest.load(manifest_path).entries) == 1
+    
+    def test_progress_reports_real_bytes(self, source: Path, dest: Path, manifest_path: Path):
+        """Test the progress callback sums to the planned byte count."""
+        manifest = Manifest.load(manifest_path)
+        plan = plan_sync(source, dest, manifest)
+        seen = []
+        
+        apply_sync(plan, manifest, on_progress=seen.append)
+        
+        assert sum(seen) == plan.copy_bytes == 511
+    
+    def test_progress_display(self, source: Path, dest: Path, manifest_path: Path):
+        """Test syncing through the byte progress bar."""
+        manifest = Manifest.load(manifest_path)
+        plan = plan_sync(source, dest, manifest)
+        
+        with byte_progress(plan.copy_bytes, "Installing") as advance:
+            result = apply_sync(plan, manifest, on_progress=advance)
+        
+        assert result.bytes_copied == plan.copy_bytes
+    
+    def test_failed_copy_leaves_no_temp_files(self, source: Path, dest: Path, manifest_path: Path):
+        """Test an interrupted copy keeps the old file and cleans up."""
+        sync_tree(source, dest, manifest_path)
+        (source / "analyze.md").write_text("analyze v2")
+        
+        with patch.object(sync.os, "replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                sync_tree(source, dest, manifest_path, workers=1)
+        
+        assert (dest / "analyze.md").read_text() == "analyze"
+        assert not [p for p in os.listdir(dest) if p.endswith(".tmp")]
+    
+    def test_single_file_source(self, source: Path, temp_dir: Path, manifest_path: Path):
+        """Test a file can be installed on its own and pruned when dropped."""
+        target = temp_dir / "claude" / "CLAUDE.md"
+        
+        assert len(sync_tree(source / "build.md", target, manifest_path).copied) == 1
+        assert target.read_text() == "build" * 100
+        assert sync_tree(source / "build.md", target, manifest_path).copied == []
+        
+        (source / "build.md").unlink()
+        manifest = Manifest.load(manifest_path)
+        assert plan_sync(source / "build.md", target, manifest).remove == [target]
+    
+    def test_manifest_survives_moving_its_directory(self, source: Path, temp_dir: Path):
+        """Test entries are relative to the manifest, so a moved tree stays intact."""
+        staged = temp_dir / "staged"
+        sync_tree(source, staged / "commands", staged / sync.MANIFEST_FILE)
+        final = temp_dir / "final"
+        os.rename(staged, final)
+        
+        manifest = Manifest.load(final / sync.MANIFEST_FILE)
+        
+        assert sorted(manifest.entries) == [
+            "commands/analyze.md", "commands/build.md", "commands/sub/deep.md",
+        ]
+        assert all(manifest.is_intact(path) for path in manifest.files())
+        assert plan_sync(source, final / "commands", manifest).copy == []
+    
+    def test_metadata_and_unknown_versions(self, manifest_path: Path):
+        """Test metadata round-trips and manifests of other versions are ignored."""
+        manifest = Manifest(manifest_path, metadata={"targets": ["commands"]})
+        manifest.save()
+        assert Manifest.load(manifest_path).metadata == {"targets": ["commands"]}
+        
+        entry = {"sha256": "x", "size": 1, "mtime_ns": 1}
+        manifest_path.write_text(
+            json.dumps({"version": 99, "files": {"commands/analyze.md": entry}})
+        )
+        
+        assert Manifest.load(manifest_path).entries == {}
@@ -0,0 +1,157 @@
+"""Tests for the telemetry collector."""
+
+import gc
+import json
+import weakref
+from unittest.mock import patch
+
+import pytest
+
+from superclaude_pro.core.config import Config
+from superclaude_pro.telemetry.collector import TelemetryCollector
+from superclaude_pro.telemetry.metrics import Metrics
+
+
+@pytest.fixture
+def collector(config: Config) -> TelemetryCollector:
+    """Create a telemetry collector with telemetry enabled."""
+    config.set("settings.telemetry", True)
+    return TelemetryCollector(config)
+
+
+class TestTelemetryCollector:
+    """Test TelemetryCollector class."""
+    
+    def test_disabled_collector_stores_nothing(self, config: Config):
+        """Test nothing is written when telemetry is disabled."""
+        collector = TelemetryCollector(config)
+        collector.track_command("install")
+        
+        assert collector.get_metrics_summary() == {}
+        assert not (config.claude_dir / ".telemetry").exists()
+    
+    def test_metrics_summary(self, collector: TelemetryCollector):
+        """Test summary counts commands and errors."""
+        collector.track_command("install")
+        collector.track_command("install")
+        collector.track_command("status")
+        collector.track_error("ValueError", "bad value")
+        
+        summary = collector.get_metrics_summary()
+        
+        assert summary["total_events"] == 4
+        assert summary["total_commands"] == 3
+        assert summary["total_errors"] == 1
+        assert summary["top_commands"][0] == ("install", 2)
+        assert summary["top_errors"] == [("ValueError", 1)]
+    
+    def test_legacy_metrics_are_migrated(self, config: Config):
+        """Test events from the old metrics.json are moved into the store."""
+        config.set("settings.telemetry", True)
+        legacy = config.claude_dir / ".telemetry" / "metrics.json"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text(json.dumps([
+            {"event": "command_executed", "properties": {"command": "update"}},
+        ]))
+        
+        collector = TelemetryCollector(config)
+        
+        assert not legacy.exists()
+        assert collector.get_metrics_summary()["top_commands"] == [("update", 1)]
+    
+    def test_background_mode(self, config: Config):
+        """Test buffered events are visible after a flush."""
+        config.set("settings.telemetry", True)
+        collector = TelemetryCollector(config, background=True)
+        
+        for _ in range(5):
+            collector.track_command("status")
+        collector.flush()
+        
+        assert len(list(collector.iter_events())) == 5
+        assert collector.get_metrics_summary()["total_commands"] == 5
+        collector.close()
+    
+    def test_exit_hook_does_not_keep_collector_alive(self, config: Config):
+        """Test an unclosed collector can be freed and close() drops its hook."""
+        config.set("settings.telemetry", True)
+        with patch("superclaude_pro.telemetry.collector.atexit") as mock_atexit:
+            collector = TelemetryCollector(config)
+            hook = mock_atexit.register.call_args.args[0]
+            collector.close()
+            mock_atexit.unregister.assert_called_once_with(hook)
+        
+        ref = weakref.ref(TelemetryCollector(config))
+        gc.collect()
+        
+        assert ref() is None
+    
+    def test_summary_covers_full_history(self, collector: TelemetryCollector):
+        """Test the rollup keeps counting past the event retention bound."""
+        collector.store.max_events = 10
+        collector.store.segment_bytes = 256
+        for _ in range(50):
+            collector.track_command("status")
+        
+        assert len(list(collector.store.iter_events())) < 50
+        assert collector.get_metrics_summary()["total_commands"] == 50
+    
+    
+    def test_context_stored_once_per_session(self, collector: TelemetryCollector):
+        """Test events reference a single session record for their context."""
+        with patch("superclaude_pro.telemetry.collector.platform.python_version") as mock_version:
+            for _ in range(3):
+                collector.track_command("status")
+        
+        records = list(collector.store.iter_events())
+        assert [r["event"] for r in records] == ["session_started"] + ["command_executed"] * 3
+        assert all("context" not in r for r in records[1:])
+        assert records[0]["context"]["version"] == "3.1.0"
+        assert mock_version.call_count <= 1
+        
+        events = list(collector.iter_events())
+        assert len(events) == 3
+        assert events[0]["context"]["client_id"] == collector.client_id
+        assert collector.get_metrics_summary()["total_events"] == 3
+    
+    def test_rollup_is_merged_in_batches(self, collector: TelemetryCollector):
+        """Test counts reach the rollup file every N events and on close."""
+        collector.rollup_every = 100
+        with patch.object(
+            Metrics, "accumulate", autospec=True, side_effect=Metrics.accumulate
+        ) as accumulate:
+            for _ in range(250):
+                collector.track_command("status")
+            
+            assert accumulate.call_count == 2
+            assert Metrics.load(collector.rollup_file).total_commands == 200
+            assert collector.get_metrics_summary()["total_commands"] == 250
+            
+            collector.close()
+        
+        assert Metrics.load(collector.rollup_file).total_commands == 250
+    
+    def test_rollup_is_merged_after_interval(self, collector: TelemetryCollector):
+        """Test a quiet session still persists its counts after the interval."""
+        collector.track_command("status")
+        assert not Metrics.load(collector.rollup_file)
+        
+        collector.rollup_interval = 0
+        collector.track_command("status")
+        
+        assert Metrics.load(collector.rollup_file).total_commands == 2
+    
+    def test_events_do_not_rewrite_the_rollup(self, collector: TelemetryCollector):
+        """Test the rollup is not read and rewritten for each event."""
+        count = 500
+        with patch.object(
+            Metrics, "accumulate", autospec=True, side_effect=Metrics.accumulate
+        ) as accumulate:
+            for i in range(count):
+                collector.track_command(f"cmd{i % 20}", duration_ms=i)
+            
+            assert accumulate.call_count == 0
+            collector.close()
+        
+        assert accumulate.call_count == 1
+        assert Metrics.load(collector.rollup_file).total_commands == count
@@ -0,0 +1,87 @@
+"""Tests for the background telemetry flusher."""
+
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from superclaude_pro.telemetry.flusher import BLOCK, DROP_OLDEST, BackgroundFlusher
+
+
+class TestBackgroundFlusher:
+    """Test BackgroundFlusher class."""
+    
+    def test_flush_writes_all_events(self):
+        """Test flush drains the buffer through the sink in batches."""
+        batches: List[List[Dict[str, Any]]] = []
+        flusher = BackgroundFlusher(batches.append, batch_size=10, interval=60)
+        
+        for n in range(25):
+            flusher.submit({"n": n})
+        assert flusher.flush(timeout=5)
+        
+        assert [e["n"] for batch in batches for e in batch] == list(range(25))
+        assert all(len(batch) <= 10 for batch in batches)
+        assert flusher.stats()["flushed"] == 25
+        flusher.close()
+    
+    def test_close_drains_buffer(self):
+        """Test closing writes pending events and rejects new ones."""
+        written: List[Dict[str, Any]] = []
+        flusher = BackgroundFlusher(written.extend, interval=60)
+        
+        flusher.submit({"n": 1})
+        flusher.close()
+        
+        assert written == [{"n": 1}]
+        assert flusher.submit({"n": 2}) is False
+        assert flusher.dropped == 1
+    
+    def test_drop_oldest_overflow(self):
+        """Test the oldest events are dropped and counted when full."""
+        release = threading.Event()
+        written: List[Dict[str, Any]] = []
+        
+        def slow_sink(batch: List[Dict[str, Any]]) -> None:
+            release.wait(5)
+            written.extend(batch)
+        
+        flusher = BackgroundFlusher(
+            slow_sink, capacity=5, batch_size=1, interval=60, overflow=DROP_OLDEST
+        )
+        flusher.submit({"n": 0})
+        # Wait for the first event to be picked up by the blocked sink
+        while flusher.stats()["pending"]:
+            time.sleep(0.001)
+        for n in range(1, 11):
+            flusher.submit({"n": n})
+        release.set()
+        flusher.close()
+        
+        assert flusher.dropped == 5
+        assert [e["n"] for e in written] == [0, 6, 7, 8, 9, 10]
+    
+    def test_block_overflow_times_out(self):
+        """Test the block policy drops new events after its timeout."""
+        release = threading.Event()
+        flusher = BackgroundFlusher(
+            lambda batch: release.wait(5),
+            capacity=1,
+            interval=60,
+            overflow=BLOCK,
+            block_timeout=0.05,
+        )
+        flusher.submit({"n": 0})
+        while flusher.stats()["pending"]:
+            time.sleep(0.001)
+        assert flusher.submit({"n": 1}) is True
+        assert flusher.submit({"n": 2}) is False
+        assert flusher.dropped == 1
+        release.set()
+        flusher.close()
+    
+    def test_invalid_overflow_policy(self):
+        """Test unknown overflow policies are rejected."""
+        with pytest.raises(ValueError, match="Unknown overflow policy"):
+            BackgroundFlusher(lambda batch: None, overflow="explode")
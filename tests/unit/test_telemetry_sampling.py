@@ -0,0 +1,100 @@
+"""Tests for telemetry sampling and rate limiting."""
+
+import random
+
+from superclaude_pro.core.config import Config
+from superclaude_pro.telemetry.collector import TelemetryCollector
+from superclaude_pro.telemetry.sampling import EventSampler, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self) -> None:
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Test TokenBucket class."""
+    
+    def test_burst_then_refill(self):
+        """Test the bucket allows a burst and refills at its rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+        
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+        clock.now = 0.5
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is False
+
+
+class TestEventSampler:
+    """Test EventSampler class."""
+    
+    def test_sampled_weights_are_unbiased(self):
+        """Test summed weights estimate the true event count."""
+        sampler = EventSampler(rates={"*": 0.1}, rng=random.Random(42).random)
+        
+        weights = [sampler.weigh("heartbeat") for _ in range(20000)]
+        kept = [w for w in weights if w is not None]
+        
+        assert 0.08 < len(kept) / 20000 < 0.12
+        assert abs(sum(kept) - 20000) < 2000
+        assert sampler.sampled_out == 20000 - len(kept)
+    
+    def test_errors_are_always_kept(self):
+        """Test error events bypass sampling and rate limits."""
+        sampler = EventSampler(rates={"*": 0.0}, limits={"*": {"per_second": 0, "burst": 0}})
+        
+        assert all(sampler.weigh("error_occurred") == 1.0 for _ in range(100))
+        assert sampler.weigh("command_executed") is None
+    
+    def test_rate_limited_events_carry_weight(self):
+        """Test dropped events are folded into the next kept event's weight."""
+        clock = FakeClock()
+        sampler = EventSampler(limits={"tick": {"per_second": 1, "burst": 1}}, clock=clock)
+        
+        assert sampler.weigh("tick") == 1.0
+        assert sampler.weigh("tick") is None
+        assert sampler.weigh("tick") is None
+        clock.now = 1.0
+        assert sampler.weigh("tick") == 3.0
+        assert sampler.rate_limited == 2
+    
+    def test_from_config(self):
+        """Test samplers are only built when settings ask for one."""
+        assert EventSampler.from_config({"telemetry": True}) is None
+        assert EventSampler.from_config({"telemetry_rate_limits": {"x": {}}}) is None
+        
+        sampler = EventSampler.from_config({"telemetry_sampling": {"command_executed": 0.5}})
+        assert sampler is not None
+        assert sampler.rates == {"command_executed": 0.5}
+
+
+class TestCollectorSampling:
+    """Test sampling in TelemetryCollector."""
+    
+    def test_summary_reports_estimated_totals(self, config: Config):
+        """Test summaries scale sampled events back up by their weight."""
+        config.set_many({
+            "settings.telemetry": True,
+            "settings.telemetry_sampling": {"command_executed": 0.25},
+        })
+        collector = TelemetryCollector(config)
+        collector.sampler.rng = random.Random(7).random
+        
+        for _ in range(2000):
+            collector.track_command("status")
+        collector.track_error("ValueError", "boom")
+        
+        stored = [e for e in collector.iter_events() if e["event"] == "command_executed"]
+        summary = collector.get_metrics_summary()
+        
+        assert len(stored) < 700
+        assert all(e["sample_weight"] == 4.0 for e in stored)
+        assert summary["estimated"] is True
+        assert 1700 < summary["total_commands"] < 2300
+        assert summary["total_errors"] == 1
@@ -0,0 +1,116 @@
+"""Tests for telemetry error sanitization."""
+
+import re
+
+import pytest
+
+from superclaude_pro.core.config import Config
+from superclaude_pro.telemetry.collector import TelemetryCollector
+from superclaude_pro.telemetry.sanitizer import (
+    DEFAULT_RULES,
+    ErrorSanitizer,
+    sanitize_error,
+)
+
+
+def legacy_sanitize(error_message: str) -> str:
+    """Two-pass implementation the sanitizer replaces."""
+    sanitized = re.sub(r'[\/]\S+[\/]\S+', '<path>', error_message)
+    sanitized = re.sub(r'[a-zA-Z0-9]{20,}', '<redacted>', sanitized)
+    return sanitized[:500]
+
+
+class TestErrorSanitizer:
+    """Test ErrorSanitizer class."""
+    
+    def test_matches_legacy_behaviour(self):
+        """Test default rules produce the same output as the two-pass version."""
+        messages = [
+            "FileNotFoundError: /home/user/.claude/superclaude.json missing",
+            "token=abcdefghijklmnopqrstuvwxyz0123 rejected",
+            "failed at C:/Users/dev/project/file.py line 3",
+            "plain message",
+            "x" * 2000,
+        ]
+        for message in messages:
+            assert sanitize_error(message) == legacy_sanitize(message)
+    
+    def test_huge_input_is_truncated(self):
+        """Test long tracebacks are cut to the maximum length."""
+        message = "Traceback line with some words\n" * 100000
+        result = sanitize_error(message)
+        
+        assert len(result) == 500
+        assert result == legacy_sanitize(message)
+    
+    def test_secret_at_cut_point_is_redacted(self):
+        """Test a secret straddling the scan window is not leaked in part."""
+        # The long path shrinks to "<path>", pulling the secret into the output
+        message = "/p/" + "q" * 990 + " " + "A" * 40 + " tail"
+        
+        assert sanitize_error(message) == "<path> <redacted> tail"
+    
+    def test_user_defined_rules(self):
+        """Test custom patterns run before the defaults."""
+        sanitizer = ErrorSanitizer.from_config([
+            r"sk-[A-Za-z0-9]{8}",
+            {"pattern": r"user=\w+", "replacement": "user=<user>"},
+            [r"\d{3}-\d{4}", "<phone>"],
+        ])
+        
+        result = sanitizer.sanitize("key sk-abcd1234 for user=alice call 555-1234")
+        
+        assert result == "key <redacted> for user=<user> call <phone>"
+    
+    def test_invalid_rules_are_skipped(self):
+        """Test broken user rules do not disable sanitization."""
+        sanitizer = ErrorSanitizer.from_config(["(unclosed", {"replacement": "x"}])
+        
+        assert sanitizer.rules == ErrorSanitizer().rules
+    
+    def test_global_flags_apply_to_their_rule(self):
+        """Test a leading (?i) flag is scoped to its own rule."""
+        sanitizer = ErrorSanitizer.from_config([r"(?i)token=\S+", r"x-key"])
+        
+        result = sanitizer.sanitize("TOKEN=abc X-KEY x-key")
+        
+        assert len(sanitizer.rules) == len(DEFAULT_RULES) + 2
+        assert result == "<redacted> X-KEY <redacted>"
+    
+    def test_backreferences_are_rejected(self):
+        """Test numbered backreferences are skipped instead of breaking the engine."""
+        sanitizer = ErrorSanitizer.from_config([
+            r"""(["']).*?\1""",
+            r"(?:a)(?(1)b|c)",
+            r"""(?P<q>["']).*?(?P=q)""",
+            r"(?P<q>x)y",
+            r"path\\1",
+        ])
+        
+        patterns = [pattern for pattern, _ in sanitizer.rules]
+        assert patterns[:2] == [r"""(?P<q>["']).*?(?P=q)""", r"path\\1"]
+        assert sanitizer.sanitize("say 'hi' now") == "say <redacted> now"
+        with pytest.raises(re.error):
+            ErrorSanitizer(rules=[(r"""(["']).*?\1""", "<q>")])
+    
+    def test_collector_with_tricky_rules(self, config: Config):
+        """Test flag and backreference rules cannot crash the collector."""
+        config.set_many({
+            "settings.telemetry": True,
+            "settings.telemetry_redact_patterns": [
+                r"(?i)token=\S+", r"""(["']).*?\1""",
+            ],
+        })
+        collector = TelemetryCollector(config)
+        
+        assert collector._sanitize_error("Token=abc") == "<redacted>"
+    
+    def test_collector_uses_configured_rules(self, config: Config):
+        """Test the collector picks up redaction rules from config."""
+        config.set_many({
+            "settings.telemetry": True,
+            "settings.telemetry_redact_patterns": [r"acct-\d+"],
+        })
+        collector = TelemetryCollector(config)
+        
+        assert collector._sanitize_error("bad acct-42") == "bad <redacted>"
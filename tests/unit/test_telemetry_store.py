@@ -0,0 +1,88 @@
+"""Tests for the append-only telemetry event store."""
+
+import threading
+from pathlib import Path
+
+from superclaude_pro.telemetry.store import EventStore
+
+
+class TestEventStore:
+    """Test EventStore class."""
+    
+    def test_append_and_iterate(self, temp_dir: Path):
+        """Test events are streamed back in append order."""
+        store = EventStore(temp_dir / "events")
+        store.append({"n": 1})
+        store.append_many([{"n": 2}, {"n": 3}])
+        
+        assert [e["n"] for e in store.iter_events()] == [1, 2, 3]
+        assert len(store.segments()) == 1
+    
+    def test_iterate_empty_store(self, temp_dir: Path):
+        """Test iterating a store that was never written."""
+        store = EventStore(temp_dir / "missing")
+        assert list(store.iter_events()) == []
+    
+    def test_rotation_and_compaction_bound_events(self, temp_dir: Path):
+        """Test old events are compacted away once segments rotate."""
+        store = EventStore(temp_dir / "events", max_events=50, segment_bytes=512)
+        for n in range(500):
+            store.append({"n": n})
+        
+        events = [e["n"] for e in store.iter_events()]
+        sealed = len(events) - len(store._read_lines(store.segments()[-1]))
+        
+        assert sealed <= 50
+        assert events[-1] == 499
+        assert events == sorted(events)
+        assert len(store.segments()) <= 3
+    
+    def test_compaction_bounds_bytes(self, temp_dir: Path):
+        """Test the total size bound is honoured for sealed segments."""
+        store = EventStore(
+            temp_dir / "events", max_events=10000, max_bytes=2048, segment_bytes=512
+        )
+        for n in range(500):
+            store.append({"n": n, "padding": "x" * 20})
+        
+        sealed = store.segments()[:-1]
+        assert sum(p.stat().st_size for p in sealed) <= 2048
+    
+    def test_torn_lines_are_skipped(self, temp_dir: Path):
+        """Test a partially written line does not break readers."""
+        store = EventStore(temp_dir / "events")
+        store.append({"n": 1})
+        with open(store.segments()[-1], "ab") as f:
+            f.write(b'{"n": 2, "trunc')
+        
+        assert [e["n"] for e in store.iter_events()] == [1]
+    
+    def test_append_follows_rotation_by_another_store(self, temp_dir: Path):
+        """Test a store stops appending to a segment another store sealed."""
+        stale = EventStore(temp_dir / "events", segment_bytes=512)
+        stale.append({"n": "stale"})
+        
+        other = EventStore(temp_dir / "events", segment_bytes=512)
+        while len(other.segments()) < 2:
+            other.append({"n": "other"})
+        
+        stale.append({"n": "late"})
+        
+        newest = stale._read_lines(stale.segments()[-1])
+        assert newest == [b'{"n":"late"}\n']
+    
+    def test_concurrent_appends(self, temp_dir: Path):
+        """Test concurrent writers do not lose or interleave events."""
+        def worker(n: int) -> None:
+            store = EventStore(temp_dir / "events", max_events=10000)
+            for i in range(100):
+                store.append({"worker": n, "i": i})
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        events = list(EventStore(temp_dir / "events").iter_events())
+        assert len(events) == 400
@@ -0,0 +1,211 @@
+"""Tests for cached update checks."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import httpx
+import pytest
+
+from superclaude_pro.core.updates import UPDATE_CACHE_FILE, UpdateChecker, version_key
+
+
+class IndexServer:
+    """Local stand-in for the package index, honouring If-None-Match."""
+    
+    def __init__(self) -> None:
+        """Start serving on a free port."""
+        self.version = "3.2.0"
+        self.requests: List[Dict[str, Any]] = []
+        self.fail = False
+        self.delay = 0.0
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                server.requests.append(dict(self.headers))
+                time.sleep(server.delay)
+                if server.fail:
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+                etag = f'"{server.version}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = json.dumps({"info": {"version": server.version}}).encode()
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", "Tue, 21 Jan 2025 00:00:00 GMT")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args: Any) -> None:
+                pass
+        
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/pypi/superclaude-pro/json"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+    
+    def stop(self) -> None:
+        """Stop serving."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def index() -> Iterator[IndexServer]:
+    """Run a local package index."""
+    server = IndexServer()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client() -> Iterator[httpx.Client]:
+    """Create an HTTP client for the test."""
+    with httpx.Client(timeout=5.0) as client:
+        yield client
+
+
+def make_checker(
+    mock_claude_dir: Path, index: IndexServer, client: httpx.Client, ttl: float = 3600
+) -> UpdateChecker:
+    """Create a checker against the local index."""
+    return UpdateChecker(
+        mock_claude_dir / UPDATE_CACHE_FILE, url=index.url, ttl=ttl, client=client
+    )
+
+
+class TestUpdateChecker:
+    """Test UpdateChecker."""
+    
+    def test_fresh_cache_skips_network(
+        self, mock_claude_dir: Path, index: IndexServer, client: httpx.Client
+    ):
+        """Test a second check within the TTL makes no request."""
+        checker = make_checker(mock_claude_dir, index, client)
+        
+        assert checker.check("3.1.0") == "3.2.0"
+        assert checker.check("3.1.0") == "3.2.0"
+        assert make_checker(mock_claude_dir, index, client).check("3.1.0") == "3.2.0"
+        
+        assert len(index.requests) == 1
+    
+    def test_stale_cache_revalidates_conditionally(
+        self, mock_claude_dir: Path, index: IndexServer, client: httpx.Client
+    ):
+        """Test an expired cache sends its validators and accepts a 304."""
+        checker = make_checker(mock_claude_dir, index, client, ttl=0)
+        checker.check("3.1.0")
+        
+        assert checker.check("3.1.0") == "3.2.0"
+        
+        assert index.requests[1]["If-None-Match"] == '"3.2.0"'
+        assert "If-Modified-Since" in index.requests[1]
+    
+    def test_new_release_replaces_cache(
+        self, mock_claude_dir: Path, index: IndexServer, client: httpx.Client
+    ):
+        """Test a changed index is picked up on revalidation."""
+        checker = make_checker(mock_claude_dir, index, client, ttl=0)
+        checker.check("3.1.0")
+        index.version = "3.10.0"
+        
+        assert checker.check("3.9.0") == "3.10.0"
+        assert checker.cached()["etag"] == '"3.10.0"'
+    
+    def test_stale_while_revalidate(
+        self, mock_claude_dir: Path, index: IndexServer, client: httpx.Client
+    ):
+        """Test wait=False answers from the cache and refreshes in the background."""
+        checker = make_checker(mock_claude_dir, index, client, ttl=0)
+        assert checker.check("3.1.0", wait=False) is None
+        
+        checker.join(5)
+        assert len(index.requests) == 1
+        index.version = "3.3.0"
+        
+        assert checker.check("3.1.0", wait=False) == "3.2.0"
+        checker.join(5)
+        assert checker.cached()["version"] == "3.3.0"
+    
+    def test_background_refresh_finishes_at_exit(
+        self, mock_claude_dir: Path, index: IndexServer
+    ):
+        """Test a process exiting right after wait=False still writes the cache."""
+        index.delay = 0.5
+        cache_path = mock_claude_dir / UPDATE_CACHE_FILE
+        script = (
+            "import sys\n"
+            "from superclaude_pro.core.updates import UpdateChecker\n"
+            "checker = UpdateChecker(sys.argv[1], url=sys.argv[2], ttl=0)\n"
+            "assert checker.check('3.1.0', wait=False) is None\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        proc = subprocess.run(
+            [sys.executable, "-c", script, str(cache_path), index.url],
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        
+        assert proc.returncode == 0, proc.stderr
+        assert len(index.requests) == 1
+        entry = json.loads(cache_path.read_text())
+        assert entry["version"] == "3.2.0"
+        assert entry["etag"] == '"3.2.0"'
+    
+    def test_failed_lookup_keeps_cache_and_backs_off(
+        self, mock_claude_dir: Path, index: IndexServer, client: httpx.Client
+    ):
+        """Test errors return the cached version and are not retried within the TTL."""
+        checker = make_checker(mock_claude_dir, index, client, ttl=0)
+        checker.check("3.1.0")
+        index.fail = True
+        
+        assert checker.check("3.1.0") == "3.2.0"
+        
+        checker.ttl = 3600
+        assert checker.check("3.1.0") == "3.2.0"
+        assert len(index.requests) == 2
+    
+    def test_unreachable_index_without_cache(self, mock_claude_dir: Path, client: httpx.Client):
+        """Test an unreachable index is reported as unknown, not raised."""
+        checker = UpdateChecker(
+            mock_claude_dir / UPDATE_CACHE_FILE, url="http://127.0.0.1:9/", client=client
+        )
+        
+        assert checker.check("3.1.0") is None
+    
+    def test_cache_is_per_index(
+        self, mock_claude_dir: Path, index: IndexServer, client: httpx.Client
+    ):
+        """Test a cache written for another index URL is ignored."""
+        make_checker(mock_claude_dir, index, client).check("3.1.0")
+        
+        other = UpdateChecker(mock_claude_dir / UPDATE_CACHE_FILE, url=index.url + "?x")
+        
+        assert other.cached() is None
+
+
+class TestVersionKey:
+    """Test version_key."""
+    
+    def test_ordering(self):
+        """Test numeric, trailing-zero and pre-release ordering."""
+        assert version_key("3.10.0") > version_key("3.9.1")
+        assert version_key("3.1") == version_key("3.1.0")
+        assert version_key("3.2.0rc1") < version_key("3.2.0")
+        assert version_key("3.2.0rc1") > version_key("3.1.9")
+        assert version_key("0.0.0-dev") < version_key("0.0.1")